@@ -2,11 +2,20 @@ from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
+from sqlalchemy import text
 
 from alembic import context
 
 from src.models.base import Base  # Import the Base where models' metadata is defined
-from src.models import vendor_model, vendor_metric_model, vendor_score_model
+from src.models import (
+    vendor_model,
+    vendor_metric_model,
+    vendor_score_model,
+    vendor_score_aggregate_model,
+    recompute_job_model,
+    scheduled_run_model,
+    score_replay_model,
+)
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -28,6 +37,22 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+def partition_names(connectable) -> set[str]:
+    """Tables that are partitions of a partitioned table.
+
+    They are created and dropped by ``src.services.partition_service``, not by
+    migrations; comparing them against the models would have autogenerate
+    propose dropping every partition with its data.
+    """
+    # A connection of its own, so the migration connection is not left in a transaction.
+    with connectable.connect() as connection:
+        return set(
+            connection.execute(
+                text("SELECT relname FROM pg_class WHERE relispartition AND relkind IN ('r', 'p')")
+            ).scalars()
+        )
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -65,9 +90,16 @@ def run_migrations_online() -> None:
         poolclass=pool.NullPool,
     )
 
+    partitions = partition_names(connectable)
+
+    def include_name(name, type_, parent_names):
+        if type_ == "table":
+            return name not in partitions
+        return True
+
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_name=include_name
         )
 
         with context.begin_transaction():
@@ -0,0 +1,45 @@
+"""add vendor latest score
+
+Revision ID: 3c9e4b7a1d20
+Revises: 58f6eba8725a
+Create Date: 2026-10-17 10:40:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e4b7a1d20'
+down_revision: Union[str, Sequence[str], None] = '58f6eba8725a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('vendors', sa.Column('latest_score', sa.Float(), nullable=True))
+    op.add_column('vendors', sa.Column('latest_scored_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Backfill the current score from the newest snapshot of every vendor.
+    op.execute(
+        """
+        UPDATE vendors AS v
+        SET latest_score = s.score,
+            latest_scored_at = s.calculated_at
+        FROM (
+            SELECT DISTINCT ON (vendor_id) vendor_id, score, calculated_at
+            FROM vendor_scores
+            ORDER BY vendor_id, calculated_at DESC
+        ) AS s
+        WHERE s.vendor_id = v.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('vendors', 'latest_scored_at')
+    op.drop_column('vendors', 'latest_score')
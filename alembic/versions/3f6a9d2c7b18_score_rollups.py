@@ -0,0 +1,86 @@
+"""score rollups
+
+Revision ID: 3f6a9d2c7b18
+Revises: 8b4f0d6e2c19
+Create Date: 2026-10-17 20:11:05.482913
+
+Precomputed score distributions behind the ``/scores`` leaderboard, stats
+and histogram endpoints: ``category_score_buckets`` counts current scores
+per category and 1-point bucket, ``daily_score_buckets`` keeps a copy per
+day. ``vendors.rollup_score``/``rollup_category`` record what each vendor
+is counted as, so a refresh only folds in vendors that changed; the tables
+start empty and the first refresh counts every vendor.
+``ix_vendors_category_latest_score`` serves the leaderboard directly.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.database.migration_helpers import drop_invalid_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6a9d2c7b18'
+down_revision: Union[str, Sequence[str], None] = '8b4f0d6e2c19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('category_score_buckets',
+    sa.Column('category', sa.String(length=50), nullable=False),
+    sa.Column('bucket', sa.SmallInteger(), nullable=False),
+    sa.Column('vendors', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.Float(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('category', 'bucket')
+    )
+    op.create_table('daily_score_buckets',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('category', sa.String(length=50), nullable=False),
+    sa.Column('bucket', sa.SmallInteger(), nullable=False),
+    sa.Column('vendors', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'category', 'bucket')
+    )
+    op.add_column('vendors', sa.Column('rollup_score', sa.Float(), nullable=True))
+    op.add_column('vendors', sa.Column('rollup_category', sa.String(length=50), nullable=True))
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        drop_invalid_index('ix_vendors_category_latest_score', 'vendors')
+        op.create_index(
+            'ix_vendors_category_latest_score',
+            'vendors',
+            ['category', sa.text('latest_score DESC'), 'id'],
+            unique=False,
+            postgresql_where=sa.text('latest_score IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        drop_invalid_index('ix_vendors_rollup_pending', 'vendors')
+        op.create_index(
+            'ix_vendors_rollup_pending',
+            'vendors',
+            ['id'],
+            unique=False,
+            postgresql_where=sa.text(
+                'latest_score IS DISTINCT FROM rollup_score OR category IS DISTINCT FROM rollup_category'
+            ),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in ('ix_vendors_rollup_pending', 'ix_vendors_category_latest_score'):
+            op.drop_index(name, table_name='vendors', postgresql_concurrently=True, if_exists=True)
+    op.drop_column('vendors', 'rollup_category')
+    op.drop_column('vendors', 'rollup_score')
+    op.drop_table('daily_score_buckets')
+    op.drop_table('category_score_buckets')
@@ -0,0 +1,33 @@
+"""vendor scoring rule version
+
+Revision ID: 5e8c1b7d4a92
+Revises: d29b7e4c1a83
+Create Date: 2026-10-17 18:02:44.913270
+
+Adds ``vendors.last_scored_version`` to the scoring watermark so switching
+the active scoring rule set rescores vendors. Vendors scored so far were
+scored with the built-in ``v1`` rules.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8c1b7d4a92'
+down_revision: Union[str, Sequence[str], None] = 'd29b7e4c1a83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('vendors', sa.Column('last_scored_version', sa.String(length=40), nullable=True))
+    op.execute("UPDATE vendors SET last_scored_version = 'v1' WHERE last_scored_metric_id IS NOT NULL")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('vendors', 'last_scored_version')
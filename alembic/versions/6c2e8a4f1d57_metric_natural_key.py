@@ -0,0 +1,64 @@
+"""metric natural key
+
+Revision ID: 6c2e8a4f1d57
+Revises: 3f6a9d2c7b18
+Create Date: 2026-10-17 22:40:18.306154
+
+Makes ``(vendor_id, timestamp)`` unique in ``vendor_metrics`` so retried
+submissions resolve to the row already stored (``INSERT ... ON CONFLICT DO
+NOTHING``) instead of adding another. Existing duplicates are removed first,
+keeping the lowest id of each pair, and the decayed aggregates of the vendors
+that had any are dropped; the next rescore rebuilds them from the remaining
+history. ``ix_vendor_metrics_vendor_id_timestamp`` is rebuilt as unique rather
+than adding a second index on the same columns. Postgres cannot build an
+index on a partitioned table concurrently, so the table is locked for the
+duration of the build.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c2e8a4f1d57'
+down_revision: Union[str, Sequence[str], None] = '3f6a9d2c7b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        WITH removed AS (
+            DELETE FROM vendor_metrics AS duplicate
+            USING vendor_metrics AS kept
+            WHERE duplicate.vendor_id = kept.vendor_id
+              AND duplicate."timestamp" = kept."timestamp"
+              AND duplicate.id > kept.id
+            RETURNING duplicate.vendor_id
+        )
+        DELETE FROM vendor_score_aggregates
+        WHERE vendor_id IN (SELECT vendor_id FROM removed)
+        """
+    )
+    op.drop_index('ix_vendor_metrics_vendor_id_timestamp', table_name='vendor_metrics')
+    op.create_index(
+        'ix_vendor_metrics_vendor_id_timestamp',
+        'vendor_metrics',
+        ['vendor_id', sa.text('timestamp DESC')],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_vendor_metrics_vendor_id_timestamp', table_name='vendor_metrics')
+    op.create_index(
+        'ix_vendor_metrics_vendor_id_timestamp',
+        'vendor_metrics',
+        ['vendor_id', sa.text('timestamp DESC')],
+        unique=False,
+    )
@@ -0,0 +1,36 @@
+"""vendor scoring watermark
+
+Revision ID: 7d2e4f9a1b35
+Revises: e5b0a93d7c18
+Create Date: 2026-10-17 13:21:08.402517
+
+Records on ``vendors`` which metric and category the current score was
+computed from, so bulk recomputes can skip vendors with nothing new. The
+columns start NULL, so the first recompute after upgrading rescores everyone.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e4f9a1b35'
+down_revision: Union[str, Sequence[str], None] = 'e5b0a93d7c18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('vendors', sa.Column('last_scored_metric_id', sa.UUID(), nullable=True))
+    op.add_column('vendors', sa.Column('last_scored_metric_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('vendors', sa.Column('last_scored_category', sa.String(length=50), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('vendors', 'last_scored_category')
+    op.drop_column('vendors', 'last_scored_metric_at')
+    op.drop_column('vendors', 'last_scored_metric_id')
@@ -0,0 +1,115 @@
+"""vendor listing indexes
+
+Revision ID: 8b4f0d6e2c19
+Revises: 5e8c1b7d4a92
+Create Date: 2026-10-17 18:47:12.306518
+
+Indexes behind ``GET /vendors``: ``(name, id)`` and ``(category, name, id)``
+serve the keyset order with and without a category filter (replacing the
+single-column ``name`` and ``category`` indexes), ``lower(name)
+text_pattern_ops`` serves case-insensitive name prefixes and ``latest_score``
+the score range filters. Where the ``pg_trgm`` extension is available a
+trigram GIN index on ``lower(name)`` also serves substring search; without it
+substring search falls back to scanning.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.database.migration_helpers import drop_invalid_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b4f0d6e2c19'
+down_revision: Union[str, Sequence[str], None] = '5e8c1b7d4a92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _pg_trgm_available() -> bool:
+    return op.get_bind().execute(
+        sa.text("SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')")
+    ).scalar()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    trigram = _pg_trgm_available()
+    if trigram:
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        drop_invalid_index('ix_vendors_name_id', 'vendors')
+        op.create_index(
+            'ix_vendors_name_id',
+            'vendors',
+            ['name', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        drop_invalid_index('ix_vendors_category_name_id', 'vendors')
+        op.create_index(
+            'ix_vendors_category_name_id',
+            'vendors',
+            ['category', 'name', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        drop_invalid_index('ix_vendors_name_lower_prefix', 'vendors')
+        op.create_index(
+            'ix_vendors_name_lower_prefix',
+            'vendors',
+            [sa.text('lower(name) text_pattern_ops')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        drop_invalid_index('ix_vendors_latest_score', 'vendors')
+        op.create_index(
+            'ix_vendors_latest_score',
+            'vendors',
+            ['latest_score'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        if trigram:
+            drop_invalid_index('ix_vendors_name_trgm', 'vendors')
+            op.create_index(
+                'ix_vendors_name_trgm',
+                'vendors',
+                [sa.text('lower(name) gin_trgm_ops')],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.drop_index('ix_vendors_name', table_name='vendors', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_vendors_category', table_name='vendors', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # pg_trgm is left installed; other objects may depend on it.
+    with op.get_context().autocommit_block():
+        drop_invalid_index('ix_vendors_category', 'vendors')
+        op.create_index(
+            'ix_vendors_category', 'vendors', ['category'], unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        drop_invalid_index('ix_vendors_name', 'vendors')
+        op.create_index(
+            'ix_vendors_name', 'vendors', ['name'], unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        for name in (
+            'ix_vendors_name_trgm',
+            'ix_vendors_latest_score',
+            'ix_vendors_name_lower_prefix',
+            'ix_vendors_category_name_id',
+            'ix_vendors_name_id',
+        ):
+            op.drop_index(name, table_name='vendors', postgresql_concurrently=True, if_exists=True)
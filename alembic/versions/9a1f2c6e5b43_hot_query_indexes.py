@@ -0,0 +1,105 @@
+"""hot query indexes
+
+Revision ID: 9a1f2c6e5b43
+Revises: 3c9e4b7a1d20
+Create Date: 2026-10-17 11:05:47.902114
+
+Replaces the single-column ``vendor_id`` indexes with composite indexes
+matching the "newest first per vendor" queries, and drops the ``UNIQUE (id)``
+constraints that duplicated the primary keys. Indexes are built and dropped
+``CONCURRENTLY`` so the migration can run against a live database.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.database.migration_helpers import drop_invalid_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a1f2c6e5b43'
+down_revision: Union[str, Sequence[str], None] = '3c9e4b7a1d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('ALTER TABLE vendors DROP CONSTRAINT IF EXISTS vendors_id_key')
+    op.execute('ALTER TABLE vendor_metrics DROP CONSTRAINT IF EXISTS vendor_metrics_id_key')
+    op.execute('ALTER TABLE vendor_scores DROP CONSTRAINT IF EXISTS vendor_scores_id_key')
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        drop_invalid_index('ix_vendor_metrics_vendor_id_timestamp', 'vendor_metrics')
+        op.create_index(
+            'ix_vendor_metrics_vendor_id_timestamp',
+            'vendor_metrics',
+            ['vendor_id', sa.text('timestamp DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        drop_invalid_index('ix_vendor_scores_vendor_id_calculated_at', 'vendor_scores')
+        op.create_index(
+            'ix_vendor_scores_vendor_id_calculated_at',
+            'vendor_scores',
+            ['vendor_id', sa.text('calculated_at DESC')],
+            unique=False,
+            postgresql_include=['score'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_vendor_metrics_vendor_id',
+            table_name='vendor_metrics',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_vendor_scores_vendor_id',
+            table_name='vendor_scores',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        drop_invalid_index('ix_vendor_scores_vendor_id', 'vendor_scores')
+        op.create_index(
+            'ix_vendor_scores_vendor_id',
+            'vendor_scores',
+            ['vendor_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        drop_invalid_index('ix_vendor_metrics_vendor_id', 'vendor_metrics')
+        op.create_index(
+            'ix_vendor_metrics_vendor_id',
+            'vendor_metrics',
+            ['vendor_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_vendor_scores_vendor_id_calculated_at',
+            table_name='vendor_scores',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_vendor_metrics_vendor_id_timestamp',
+            table_name='vendor_metrics',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    op.create_unique_constraint('vendor_scores_id_key', 'vendor_scores', ['id'])
+    op.create_unique_constraint('vendor_metrics_id_key', 'vendor_metrics', ['id'])
+    op.create_unique_constraint('vendors_id_key', 'vendors', ['id'])
@@ -0,0 +1,46 @@
+"""vendor score aggregates
+
+Revision ID: a6d31f8c2e57
+Revises: f3a7c2d9e810
+Create Date: 2026-10-17 15:32:41.118204
+
+Running time-decayed metric sums per vendor for ``SCORING_MODE=decayed``.
+The table starts empty; recomputes build missing rows from the metric
+history on first use.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d31f8c2e57'
+down_revision: Union[str, Sequence[str], None] = 'f3a7c2d9e810'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('vendor_score_aggregates',
+    sa.Column('vendor_id', sa.UUID(), nullable=False),
+    sa.Column('half_life_seconds', sa.Float(), nullable=False),
+    sa.Column('anchor_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('weight_sum', sa.Float(), nullable=False),
+    sa.Column('on_time_delivery_sum', sa.Float(), nullable=False),
+    sa.Column('compliance_sum', sa.Float(), nullable=False),
+    sa.Column('complaint_sum', sa.Float(), nullable=False),
+    sa.Column('missing_documents_sum', sa.Float(), nullable=False),
+    sa.Column('metric_count', sa.Integer(), nullable=False),
+    sa.Column('revision', sa.UUID(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['vendor_id'], ['vendors.id'], ),
+    sa.PrimaryKeyConstraint('vendor_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('vendor_score_aggregates')
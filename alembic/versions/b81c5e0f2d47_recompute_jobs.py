@@ -0,0 +1,61 @@
+"""recompute jobs
+
+Revision ID: b81c5e0f2d47
+Revises: 7d2e4f9a1b35
+Create Date: 2026-10-17 14:05:52.119364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81c5e0f2d47'
+down_revision: Union[str, Sequence[str], None] = '7d2e4f9a1b35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('recompute_jobs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('force', sa.Boolean(), nullable=False),
+    sa.Column('shard_count', sa.Integer(), nullable=False),
+    sa.Column('cancel_requested', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_recompute_jobs_status'), 'recompute_jobs', ['status'], unique=False)
+    op.create_table('recompute_job_shards',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('job_id', sa.UUID(), nullable=False),
+    sa.Column('shard_index', sa.Integer(), nullable=False),
+    sa.Column('lower_bound', sa.UUID(), nullable=False),
+    sa.Column('upper_bound', sa.UUID(), nullable=True),
+    sa.Column('checkpoint', sa.UUID(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('claim_token', sa.UUID(), nullable=True),
+    sa.Column('recomputed_vendors', sa.Integer(), nullable=False),
+    sa.Column('skipped_vendors', sa.Integer(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('busy_seconds', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['job_id'], ['recompute_jobs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('job_id', 'shard_index')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('recompute_job_shards')
+    op.drop_index(op.f('ix_recompute_jobs_status'), table_name='recompute_jobs')
+    op.drop_table('recompute_jobs')
@@ -0,0 +1,78 @@
+"""vendor score replay id
+
+Revision ID: b8e47d2a9c30
+Revises: 6c2e8a4f1d57
+Create Date: 2026-10-18 09:12:44.218630
+
+Adds ``vendor_scores.replay_id`` so scores written by a score replay are kept
+apart from the live history, which is now the rows where it is NULL.
+Existing replay output is identified as the scores of a replayed version
+whose ``calculated_at`` is one of the vendor's metric timestamps (live
+scores are stamped with the time they were computed) and linked to its
+replay. The covering history index becomes partial on live rows and a twin
+covers replayed rows, so neither history scans past the other's scores.
+Postgres cannot build an index on a partitioned table concurrently, so the
+table is locked for the builds.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e47d2a9c30'
+down_revision: Union[str, Sequence[str], None] = '6c2e8a4f1d57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nullable without a default: a catalog-only change on every partition.
+    op.add_column('vendor_scores', sa.Column('replay_id', sa.UUID(), nullable=True))
+    op.execute(
+        """
+        UPDATE vendor_scores AS score
+        SET replay_id = replay.id
+        FROM score_replays AS replay
+        WHERE score.scoring_version = replay.scoring_version
+          AND EXISTS (
+              SELECT 1 FROM vendor_metrics AS metric
+              WHERE metric.vendor_id = score.vendor_id
+                AND metric."timestamp" = score.calculated_at
+          )
+        """
+    )
+    op.drop_index('ix_vendor_scores_vendor_id_calculated_at_id', table_name='vendor_scores')
+    op.create_index(
+        'ix_vendor_scores_vendor_id_calculated_at_id',
+        'vendor_scores',
+        ['vendor_id', sa.text('calculated_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['score'],
+        postgresql_where=sa.text('replay_id IS NULL'),
+    )
+    op.create_index(
+        'ix_vendor_scores_replayed_vendor_id_calculated_at_id',
+        'vendor_scores',
+        ['vendor_id', sa.text('calculated_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['score'],
+        postgresql_where=sa.text('replay_id IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_vendor_scores_replayed_vendor_id_calculated_at_id', table_name='vendor_scores')
+    op.drop_index('ix_vendor_scores_vendor_id_calculated_at_id', table_name='vendor_scores')
+    op.create_index(
+        'ix_vendor_scores_vendor_id_calculated_at_id',
+        'vendor_scores',
+        ['vendor_id', sa.text('calculated_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['score'],
+    )
+    op.drop_column('vendor_scores', 'replay_id')
@@ -0,0 +1,66 @@
+"""score history keyset index
+
+Revision ID: c47d8e21f9a6
+Revises: 9a1f2c6e5b43
+Create Date: 2026-10-17 11:32:09.551276
+
+Adds ``id`` as a tie-breaker to the vendor_scores covering index so the
+``(calculated_at, id)`` keyset used by score history pagination is a pure
+index range scan.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.database.migration_helpers import drop_invalid_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47d8e21f9a6'
+down_revision: Union[str, Sequence[str], None] = '9a1f2c6e5b43'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        drop_invalid_index('ix_vendor_scores_vendor_id_calculated_at_id', 'vendor_scores')
+        op.create_index(
+            'ix_vendor_scores_vendor_id_calculated_at_id',
+            'vendor_scores',
+            ['vendor_id', sa.text('calculated_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_include=['score'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_vendor_scores_vendor_id_calculated_at',
+            table_name='vendor_scores',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        drop_invalid_index('ix_vendor_scores_vendor_id_calculated_at', 'vendor_scores')
+        op.create_index(
+            'ix_vendor_scores_vendor_id_calculated_at',
+            'vendor_scores',
+            ['vendor_id', sa.text('calculated_at DESC')],
+            unique=False,
+            postgresql_include=['score'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_vendor_scores_vendor_id_calculated_at_id',
+            table_name='vendor_scores',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
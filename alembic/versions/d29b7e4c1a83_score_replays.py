@@ -0,0 +1,53 @@
+"""score replays
+
+Revision ID: d29b7e4c1a83
+Revises: a6d31f8c2e57
+Create Date: 2026-10-17 16:10:27.554091
+
+Adds ``vendor_scores.scoring_version`` (existing snapshots become ``v1``)
+and the ``score_replays`` checkpoint table.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd29b7e4c1a83'
+down_revision: Union[str, Sequence[str], None] = 'a6d31f8c2e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A constant default is stored in the catalog, so this does not rewrite the partitions.
+    op.add_column('vendor_scores', sa.Column('scoring_version', sa.String(length=40), server_default='v1', nullable=False))
+    op.create_table('score_replays',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('scoring_version', sa.String(length=40), nullable=False),
+    sa.Column('mode', sa.String(length=20), nullable=False),
+    sa.Column('half_life_seconds', sa.Float(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('claim_token', sa.UUID(), nullable=True),
+    sa.Column('checkpoint_vendor_id', sa.UUID(), nullable=True),
+    sa.Column('checkpoint_timestamp', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('checkpoint_metric_id', sa.UUID(), nullable=True),
+    sa.Column('carry', sa.JSON(), nullable=True),
+    sa.Column('vendors_replayed', sa.Integer(), nullable=False),
+    sa.Column('scores_written', sa.Integer(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('scoring_version')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('score_replays')
+    op.drop_column('vendor_scores', 'scoring_version')
@@ -0,0 +1,135 @@
+"""partition metrics and scores by month
+
+Revision ID: e5b0a93d7c18
+Revises: c47d8e21f9a6
+Create Date: 2026-10-17 12:02:31.774590
+
+Rebuilds ``vendor_metrics`` and ``vendor_scores`` as tables range-partitioned
+by month on ``timestamp`` / ``calculated_at``. Existing rows are copied into
+monthly partitions covering their range plus three months ahead; a DEFAULT
+partition catches anything outside the created months until the partition
+maintenance job (``src.services.partition_service``) moves it. The copy holds
+locks on both tables, so run this in a maintenance window.
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b0a93d7c18'
+down_revision: Union[str, Sequence[str], None] = 'c47d8e21f9a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+MONTHS_AHEAD = 3
+
+
+def _metric_columns(partition_key_in_pk: bool) -> list:
+    return [
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('vendor_id', sa.UUID(), nullable=False),
+        sa.Column('timestamp', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('on_time_delivery_rate', sa.Float(), nullable=False),
+        sa.Column('complaint_count', sa.Integer(), nullable=False),
+        sa.Column('missing_documents', sa.Boolean(), nullable=False),
+        sa.Column('compliance_score', sa.Float(), nullable=False),
+        sa.Column('raw_payload', sa.JSON(), nullable=True),
+        sa.ForeignKeyConstraint(['vendor_id'], ['vendors.id'], ),
+        sa.PrimaryKeyConstraint('id', 'timestamp') if partition_key_in_pk else sa.PrimaryKeyConstraint('id'),
+    ]
+
+
+def _score_columns(partition_key_in_pk: bool) -> list:
+    return [
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('vendor_id', sa.UUID(), nullable=False),
+        sa.Column('calculated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['vendor_id'], ['vendors.id'], ),
+        sa.PrimaryKeyConstraint('id', 'calculated_at') if partition_key_in_pk else sa.PrimaryKeyConstraint('id'),
+    ]
+
+
+def _create_indexes() -> None:
+    op.create_index(
+        'ix_vendor_metrics_vendor_id_timestamp',
+        'vendor_metrics',
+        ['vendor_id', sa.text('timestamp DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_vendor_scores_vendor_id_calculated_at_id',
+        'vendor_scores',
+        ['vendor_id', sa.text('calculated_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['score'],
+    )
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def _create_month_partitions(table: str, column: str) -> None:
+    bind = op.get_bind()
+    lowest = bind.execute(
+        sa.text(f'SELECT min("{column}") FROM {table}_unpartitioned')
+    ).scalar()
+
+    now = datetime.now(timezone.utc)
+    month = (lowest or now).astimezone(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    last = _add_months(now.replace(day=1, hour=0, minute=0, second=0, microsecond=0), MONTHS_AHEAD)
+
+    while month <= last:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        month = upper
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('vendor_metrics', 'vendor_scores'):
+        op.rename_table(table, f'{table}_unpartitioned')
+        op.execute(f'ALTER TABLE {table}_unpartitioned RENAME CONSTRAINT {table}_pkey TO {table}_unpartitioned_pkey')
+        # Free the foreign key name so the rebuilt table keeps it.
+        op.drop_constraint(f'{table}_vendor_id_fkey', f'{table}_unpartitioned', type_='foreignkey')
+    op.drop_index('ix_vendor_metrics_vendor_id_timestamp', table_name='vendor_metrics_unpartitioned')
+    op.drop_index('ix_vendor_scores_vendor_id_calculated_at_id', table_name='vendor_scores_unpartitioned')
+
+    op.create_table('vendor_metrics', *_metric_columns(True), postgresql_partition_by='RANGE ("timestamp")')
+    op.create_table('vendor_scores', *_score_columns(True), postgresql_partition_by='RANGE (calculated_at)')
+    _create_indexes()
+
+    for table, column in (('vendor_metrics', 'timestamp'), ('vendor_scores', 'calculated_at')):
+        _create_month_partitions(table, column)
+        op.execute(f'INSERT INTO {table} SELECT * FROM {table}_unpartitioned')
+        op.drop_table(f'{table}_unpartitioned')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('vendor_metrics', 'vendor_scores'):
+        op.rename_table(table, f'{table}_partitioned')
+        op.execute(f'ALTER INDEX {table}_pkey RENAME TO {table}_partitioned_pkey')
+        op.drop_constraint(f'{table}_vendor_id_fkey', f'{table}_partitioned', type_='foreignkey')
+    op.drop_index('ix_vendor_metrics_vendor_id_timestamp', table_name='vendor_metrics_partitioned')
+    op.drop_index('ix_vendor_scores_vendor_id_calculated_at_id', table_name='vendor_scores_partitioned')
+
+    op.create_table('vendor_metrics', *_metric_columns(False))
+    op.create_table('vendor_scores', *_score_columns(False))
+    _create_indexes()
+
+    for table in ('vendor_metrics', 'vendor_scores'):
+        op.execute(f'INSERT INTO {table} SELECT * FROM {table}_partitioned')
+        # Dropping the parent drops every partition with it.
+        op.drop_table(f'{table}_partitioned')
@@ -0,0 +1,42 @@
+"""scheduled runs
+
+Revision ID: f3a7c2d9e810
+Revises: b81c5e0f2d47
+Create Date: 2026-10-17 14:48:20.604711
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a7c2d9e810'
+down_revision: Union[str, Sequence[str], None] = 'b81c5e0f2d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('scheduled_runs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('job_name', sa.String(length=100), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('duration_seconds', sa.Float(), nullable=False),
+    sa.Column('processed_vendors', sa.Integer(), nullable=True),
+    sa.Column('recomputed_vendors', sa.Integer(), nullable=True),
+    sa.Column('skipped_vendors', sa.Integer(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_scheduled_runs_job_name'), 'scheduled_runs', ['job_name'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_scheduled_runs_job_name'), table_name='scheduled_runs')
+    op.drop_table('scheduled_runs')
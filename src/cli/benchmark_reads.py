@@ -0,0 +1,191 @@
+"""Per-request CPU of the vendor read endpoints: response models vs. serialized rows.
+
+The model path is what ``GET /vendors/{id}`` and ``GET /vendors/{id}/scores``
+used to do: load ORM objects, build ``VendorResponse``/``VendorScoreResponse``
+models, then let FastAPI re-validate them against ``response_model`` and
+render them with ``json.dumps``. The bytes path selects column tuples and
+serializes them once with pydantic-core, which is what the routes do now.
+
+Both are timed with ``time.process_time`` around the handler body plus
+FastAPI's response serialization, on a cache miss (the entry is invalidated
+before every request) and on a cache hit; the ASGI stack is left out because
+it costs the same for both. Database time only counts as far as it is spent
+in this process. ``--seed`` inserts a vendor with that many scores to read.
+
+Usage::
+
+    python -m src.cli.benchmark_reads --seed 100
+    python -m src.cli.benchmark_reads --vendor 5f0c... --limit 50 --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Sequence
+
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute, serialize_response
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from src.database.databases import SessionLocal
+from src.main import app
+from src.models import VendorModel, VendorScoreModel
+from src.schema import VendorResponse, VendorScorePage, VendorScoreResponse
+from src.services import get_vendor_score_page_json, list_vendor_scores
+from src.utils.cache import vendor_cache
+from src.utils.cursor import encode_score_cursor
+from src.utils.validate_vendor import VENDOR_RESPONSE_ADAPTER, load_vendor, load_vendor_json, vendor_to_response
+
+SCORE_PAGE_ADAPTER = TypeAdapter(VendorScorePage)
+
+
+def seed_vendor(scores: int) -> uuid.UUID:
+    now = datetime.now(timezone.utc)
+    vendor_id = uuid.uuid4()
+    with SessionLocal() as session:
+        session.execute(
+            insert(VendorModel),
+            [{"id": vendor_id, "name": f"bench-{vendor_id.hex[:12]}", "category": "supplier", "latest_score": 50.0}],
+        )
+        session.execute(
+            insert(VendorScoreModel),
+            [
+                {
+                    "vendor_id": vendor_id,
+                    "calculated_at": now - timedelta(minutes=index),
+                    "score": random.uniform(0, 100),
+                    "scoring_version": "v1",
+                }
+                for index in range(scores)
+            ],
+        )
+        session.commit()
+    return vendor_id
+
+
+def load_vendor_response(session: Session, vendor_id: uuid.UUID) -> VendorResponse:
+    """The old ``GET /vendors/{id}`` read: an ORM vendor turned into a cached ``VendorResponse``."""
+    return vendor_cache.get_or_load(
+        "vendor", vendor_id, VENDOR_RESPONSE_ADAPTER, lambda: vendor_to_response(load_vendor(session, vendor_id))
+    )
+
+
+def load_score_page(session: Session, vendor_id: uuid.UUID, limit: int) -> VendorScorePage:
+    """The old ``GET /vendors/{id}/scores`` read: ORM scores turned into a cached ``VendorScorePage``."""
+
+    def load() -> VendorScorePage:
+        load_vendor(session, vendor_id)
+        scores = list_vendor_scores(session, vendor_id, limit=limit + 1)
+        next_cursor = None
+        if len(scores) > limit:
+            scores = scores[:limit]
+            next_cursor = encode_score_cursor(scores[-1].calculated_at, scores[-1].id)
+        return VendorScorePage(
+            items=[VendorScoreResponse.model_validate(score, from_attributes=True) for score in scores],
+            next_cursor=next_cursor,
+        )
+
+    return vendor_cache.get_or_load("score-models", vendor_id, SCORE_PAGE_ADAPTER, load, limit)
+
+
+def _route(path: str) -> APIRoute:
+    return next(route for route in app.routes if isinstance(route, APIRoute) and route.path == path)
+
+
+async def time_requests(
+    session: Session, handle: Callable, vendor_id: uuid.UUID, requests: int, *, cached: bool
+) -> tuple[float, bytes]:
+    """CPU seconds per request of ``handle``, and the body it rendered.
+
+    The session is closed between requests, as the request-scoped ones are, so
+    misses cannot be answered from its identity map.
+    """
+
+    body = b""
+    spent = 0.0
+    await handle()  # warm the cache, prepared statements and adapters
+    for _ in range(requests):
+        session.close()
+        if not cached:
+            vendor_cache.invalidate([vendor_id])
+        started = time.process_time()
+        body = (await handle()).body
+        spent += time.process_time() - started
+    return spent / requests, body
+
+
+async def run(session: Session, vendor_id: uuid.UUID, limit: int, requests: int) -> dict[str, tuple[float, bytes]]:
+    detail_field = _route("/vendors/{vendor_id}").response_field
+    scores_field = _route("/vendors/{vendor_id}/scores").response_field
+
+    async def detail_models() -> Response:
+        vendor = load_vendor_response(session, vendor_id)
+        return JSONResponse(await serialize_response(field=detail_field, response_content=vendor))
+
+    async def detail_bytes() -> Response:
+        return Response(content=load_vendor_json(session, vendor_id), media_type="application/json")
+
+    async def scores_models() -> Response:
+        page = load_score_page(session, vendor_id, limit)
+        return JSONResponse(await serialize_response(field=scores_field, response_content=page.items))
+
+    async def scores_bytes() -> Response:
+        items, _ = get_vendor_score_page_json(session, vendor_id, limit=limit)
+        return Response(content=items, media_type="application/json")
+
+    handlers = {
+        "detail models": detail_models,
+        "detail bytes": detail_bytes,
+        f"scores[{limit}] models": scores_models,
+        f"scores[{limit}] bytes": scores_bytes,
+    }
+    results = {}
+    for name, handle in handlers.items():
+        for cached in (False, True):
+            results[f"{name} {'hit' if cached else 'miss'}"] = await time_requests(
+                session, handle, vendor_id, requests, cached=cached
+            )
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vendor", type=uuid.UUID, help="vendor to read; required without --seed")
+    parser.add_argument("--seed", type=int, default=0, help="insert a vendor with this many scores and read it")
+    parser.add_argument("--limit", type=int, default=100, help="scores per page")
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    if args.seed:
+        vendor_id = seed_vendor(args.seed)
+    elif args.vendor is not None:
+        vendor_id = args.vendor
+    else:
+        parser.error("pass --vendor or --seed")
+
+    with SessionLocal() as session:
+        results = asyncio.run(run(session, vendor_id, args.limit, args.requests))
+
+    # JSONResponse renders with json.dumps, so bodies are compared as documents
+    matches = {
+        name: json.loads(body) == json.loads(results[name.replace(" bytes ", " models ")][1])
+        for name, (_, body) in results.items()
+    }
+    print(f"{'path':<26}  us/request  matches models")
+    for name, (seconds, _) in results.items():
+        print(f"{name:<26}  {seconds * 1e6:>10.1f}  {matches[name]}")
+    return 0 if all(matches.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Time a forced full recompute at increasing degrees of parallelism.
+
+Every run rescores all vendors, so point it at a scratch database. ``--seed``
+first inserts that many synthetic vendors with one metric each.
+
+Usage::
+
+    python -m src.cli.benchmark_recompute --max-parallelism 8
+    python -m src.cli.benchmark_recompute --seed 200000 --max-parallelism 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Sequence
+
+from sqlalchemy import insert
+
+from src.database.databases import SessionLocal
+from src.models import VendorMetricModel, VendorModel
+from src.schema import VendorCategory
+from src.services import bulk_recompute_vendor_scores, parallel_recompute_vendor_scores
+
+SEED_BATCH_SIZE = 10_000
+
+
+def seed_vendors(count: int) -> None:
+    now = datetime.now(timezone.utc)
+    categories = [category.value for category in VendorCategory]
+    with SessionLocal() as session:
+        for start in range(0, count, SEED_BATCH_SIZE):
+            ids = [uuid.uuid4() for _ in range(min(SEED_BATCH_SIZE, count - start))]
+            session.execute(
+                insert(VendorModel),
+                [
+                    {"id": vendor_id, "name": f"bench-{vendor_id.hex[:12]}", "category": random.choice(categories)}
+                    for vendor_id in ids
+                ],
+            )
+            session.execute(
+                insert(VendorMetricModel),
+                [
+                    {
+                        "vendor_id": vendor_id,
+                        "timestamp": now,
+                        "on_time_delivery_rate": random.uniform(50, 100),
+                        "complaint_count": random.randint(0, 20),
+                        "missing_documents": random.random() < 0.1,
+                        "compliance_score": random.uniform(50, 100),
+                    }
+                    for vendor_id in ids
+                ],
+            )
+            session.commit()
+
+
+def time_recompute(parallelism: int) -> tuple[float, int]:
+    started = time.perf_counter()
+    if parallelism == 1:
+        with SessionLocal() as session:
+            summary = bulk_recompute_vendor_scores(session, force=True)
+    else:
+        summary = parallel_recompute_vendor_scores(parallelism=parallelism, force=True)
+    return time.perf_counter() - started, summary.processed_vendors
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-parallelism", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0, help="synthetic vendors to insert first")
+    args = parser.parse_args(argv)
+
+    if args.seed:
+        seed_vendors(args.seed)
+
+    baseline = None
+    print("parallelism  vendors  seconds  vendors/s  speedup")
+    for parallelism in range(1, args.max_parallelism + 1):
+        seconds, vendors = time_recompute(parallelism)
+        baseline = baseline or seconds
+        print(
+            f"{parallelism:>11}  {vendors:>7}  {seconds:>7.2f}  {vendors / seconds:>9.0f}  {baseline / seconds:>6.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
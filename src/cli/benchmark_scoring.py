@@ -0,0 +1,152 @@
+"""Compare compiled scoring rule sets with the hardcoded v1 formula they replaced.
+
+Scores the same random metrics with the original formula (kept here
+verbatim as the reference), the active compiled rule set called directly and
+through ``score_metric_values``, and both vectorized kernels. With the
+built-in v1 rules active every path must produce identical scores; timings
+are per metric. No database needed.
+
+Usage::
+
+    python -m src.cli.benchmark_scoring --metrics 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from typing import Sequence
+
+import numpy as np
+
+from src.schema import VendorCategory
+from src.services import compute_scores_batch, encode_categories, score_metric_values, scoring_rules
+
+REFERENCE_CATEGORY_WEIGHTS = {
+    "supplier": 1.0,
+    "distributor": 0.95,
+    "dealer": 0.9,
+    "manufacturer": 1.05,
+}
+_REFERENCE_WEIGHT_TABLE = np.array([*REFERENCE_CATEGORY_WEIGHTS.values(), 1.0], dtype=np.float64)
+
+
+def _clamp_score(value: float) -> float:
+    return max(0.0, min(100.0, value))
+
+
+def _complaint_penalty(complaints: int) -> float:
+    return min(complaints * 1.25, 25.0)
+
+
+def _missing_docs_penalty(missing: float) -> float:
+    return 10.0 * missing
+
+
+def reference_score(
+    on_time_delivery_rate: float,
+    compliance_score: float,
+    complaint_count: float,
+    missing_documents: float,
+    category: str,
+) -> float:
+    """``score_metric_values`` as it was before scoring rule sets."""
+
+    delivery_component = on_time_delivery_rate * 0.45
+    compliance_component = compliance_score * 0.4
+    reliability_component = max(0, 15 - _complaint_penalty(complaint_count))
+    penalty_component = _missing_docs_penalty(missing_documents)
+
+    raw_score = delivery_component + compliance_component + reliability_component - penalty_component
+    weight = REFERENCE_CATEGORY_WEIGHTS.get(category, 1.0)
+
+    return _clamp_score(raw_score * weight)
+
+
+def reference_scores_batch(
+    on_time_delivery_rate: np.ndarray,
+    compliance_score: np.ndarray,
+    complaint_count: np.ndarray,
+    missing_documents: np.ndarray,
+    category_codes: np.ndarray,
+) -> np.ndarray:
+    delivery_component = on_time_delivery_rate * 0.45
+    compliance_component = compliance_score * 0.4
+
+    complaint_penalty = complaint_count * 1.25
+    complaint_penalty = np.where(25.0 < complaint_penalty, 25.0, complaint_penalty)
+    reliability_component = 15 - complaint_penalty
+    reliability_component = np.where(reliability_component > 0, reliability_component, 0.0)
+
+    raw_score = delivery_component + compliance_component + reliability_component - missing_documents * 10.0
+    weighted = raw_score * _REFERENCE_WEIGHT_TABLE[category_codes]
+
+    capped = np.where(weighted < 100.0, weighted, 100.0)
+    return np.where(capped > 0.0, capped, 0.0)
+
+
+def random_metrics(count: int) -> list[tuple[float, float, float, float, str]]:
+    categories = [category.value for category in VendorCategory]
+    return [
+        (
+            random.uniform(0, 100),
+            random.uniform(0, 100),
+            float(random.randint(0, 30)),
+            float(random.random() < 0.1),
+            random.choice(categories),
+        )
+        for _ in range(count)
+    ]
+
+
+def time_scalar(score: Callable[..., float], metrics: list[tuple], repeat: int) -> tuple[float, list[float]]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        scores = [score(*metric) for metric in metrics]
+        best = min(best, time.perf_counter() - started)
+    return best, scores
+
+
+def time_batch(score_batch: Callable[..., np.ndarray], columns: tuple, repeat: int) -> tuple[float, list[float]]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        scores = score_batch(*columns)
+        best = min(best, time.perf_counter() - started)
+    return best, scores.tolist()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--metrics", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5, help="best of this many runs is reported")
+    args = parser.parse_args(argv)
+
+    metrics = random_metrics(args.metrics)
+    columns = (
+        *(np.array(column, dtype=np.float64) for column in list(zip(*metrics))[:4]),
+        encode_categories(metric[4] for metric in metrics),
+    )
+    rules = scoring_rules.active()
+
+    runs = {
+        "reference v1 formula": time_scalar(reference_score, metrics, args.repeat),
+        f"compiled {rules.version} rules.score": time_scalar(rules.score, metrics, args.repeat),
+        "score_metric_values": time_scalar(score_metric_values, metrics, args.repeat),
+        "reference v1 kernel": time_batch(reference_scores_batch, columns, args.repeat),
+        f"compiled {rules.version} kernel": time_batch(compute_scores_batch, columns, args.repeat),
+    }
+
+    expected = runs["reference v1 formula"][1]
+    print(f"{'path':<28}  ns/metric  matches reference")
+    for name, (seconds, scores) in runs.items():
+        print(f"{name:<28}  {seconds / args.metrics * 1e9:>9.1f}  {scores == expected}")
+    return 0 if all(scores == expected for _, scores in runs.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Stream a metrics file into ``vendor_metrics`` through PostgreSQL COPY.
+
+Usage::
+
+    python -m src.cli.import_metrics metrics.ndjson
+    python -m src.cli.import_metrics metrics.csv --flush-rows 20000
+    cat metrics.ndjson | python -m src.cli.import_metrics - --format ndjson
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Sequence
+
+from src.database.databases import SessionLocal
+from src.schema import MetricImportSummary
+from src.services import import_metric_lines
+from src.services.metric_import_service import IMPORT_FLUSH_ROWS
+
+
+def _report_progress(summary: MetricImportSummary) -> None:
+    print(
+        f"lines={summary.lines_read} imported={summary.imported} duplicates={summary.duplicates} "
+        f"rejected={summary.rejected}",
+        file=sys.stderr,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="NDJSON or CSV file, or '-' for stdin")
+    parser.add_argument("--format", choices=("ndjson", "csv"), help="defaults to the file extension")
+    parser.add_argument("--flush-rows", type=int, default=IMPORT_FLUSH_ROWS)
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    stream = sys.stdin if args.path == "-" else open(args.path, encoding="utf-8", newline="")
+
+    session = SessionLocal()
+    try:
+        summary = import_metric_lines(
+            session, stream, fmt, flush_rows=args.flush_rows, on_progress=_report_progress
+        )
+    finally:
+        session.close()
+        if stream is not sys.stdin:
+            stream.close()
+
+    for error in summary.errors:
+        print(f"line {error.line}: {error.detail}", file=sys.stderr)
+    print(summary.model_dump_json())
+    return 0 if summary.rejected == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""Create upcoming vendor_metrics/vendor_scores partitions and apply retention.
+
+Usage::
+
+    python -m src.cli.partitions
+    python -m src.cli.partitions --no-retention
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Sequence
+
+from src.database.databases import SessionLocal
+from src.services import run_partition_maintenance
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--no-retention", action="store_true", help="only create partitions")
+    args = parser.parse_args(argv)
+
+    session = SessionLocal()
+    try:
+        summary = run_partition_maintenance(session, apply_retention=not args.no_retention)
+    finally:
+        session.close()
+
+    print(summary.model_dump_json())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""Replay the metric history into the score history of a loaded scoring rule set.
+
+Runs in the foreground; rerunning with the same version resumes an
+unfinished replay from its checkpoint.
+
+Usage::
+
+    python -m src.cli.replay_scores v2
+    python -m src.cli.replay_scores v2-decayed --mode decayed --batch-size 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Sequence
+
+from sqlalchemy import select
+
+from src.database.databases import SessionLocal
+from src.models import ScoreReplayModel
+from src.services import create_score_replay, get_score_replay, resume_score_replay, run_score_replay
+from src.services.score_replay_service import REPLAY_BATCH_SIZE
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scoring_version")
+    parser.add_argument("--mode", choices=("latest", "decayed"), help="defaults to SCORING_MODE")
+    parser.add_argument("--batch-size", type=int, default=REPLAY_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    session = SessionLocal()
+    try:
+        replay = session.execute(
+            select(ScoreReplayModel).where(ScoreReplayModel.scoring_version == args.scoring_version)
+        ).scalar_one_or_none()
+        if replay is None:
+            replay = create_score_replay(session, args.scoring_version, mode=args.mode)
+        elif replay.status != "succeeded":
+            replay = resume_score_replay(session, replay.id)
+
+        run_score_replay(session, replay.id, batch_size=args.batch_size)
+        summary = get_score_replay(session, replay.id)
+    finally:
+        session.close()
+
+    print(summary.model_dump_json())
+    return 0 if summary.status == "succeeded" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,74 @@
-from typing import Iterator
-from src.utils.validate_db_url import validate_database_url, validate_database_echo
+from typing import Any, AsyncIterator, Iterator
+from src.utils.validate_db_url import get_database_settings
 
-from sqlalchemy import create_engine
+from sqlalchemy import Delete, Insert, Update, create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 
 
-DATABASE_URL = validate_database_url()
-DATABASE_ECHO = validate_database_echo()
+def to_psycopg_url(url: str) -> str:
+    """Point a plain postgres URL at psycopg, which serves both sync and async engines.
 
+    SQLAlchemy would otherwise pick psycopg2 for the sync engine, which is not
+    installed and does not understand psycopg's connection arguments.
+    """
+    parsed = make_url(url)
+    if parsed.drivername in ("postgres", "postgresql"):
+        parsed = parsed.set(drivername="postgresql+psycopg")
+    return parsed.render_as_string(hide_password=False)
 
-engine = create_engine(url=DATABASE_URL, echo=DATABASE_ECHO, future=True)
+
+DATABASE_SETTINGS = get_database_settings()
+DATABASE_URL = to_psycopg_url(DATABASE_SETTINGS.url)
+DATABASE_ECHO = DATABASE_SETTINGS.echo
+
+engine = create_engine(url=DATABASE_URL, future=True, **DATABASE_SETTINGS.engine_options(DATABASE_URL))
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
+# Connections are only opened on first use, so this costs nothing in sync mode.
+async_engine = create_async_engine(url=DATABASE_URL, **DATABASE_SETTINGS.engine_options(DATABASE_URL))
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+class RoutingSession(Session):
+    """Session that reads from the replica engine and writes to the primary one.
+
+    Anything flushed or any INSERT/UPDATE/DELETE goes to ``primary_bind`` so a
+    read-only request never needs a primary connection.
+    """
+
+    primary_bind: Engine = engine
+    replica_bind: Engine = engine
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kw: Any) -> Engine:
+        if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            return self.primary_bind
+        return self.replica_bind
+
+
+class AsyncRoutingSession(RoutingSession):
+    """Sync-side routing session backing ``AsyncSession`` reads."""
+
+    primary_bind = async_engine.sync_engine
+    replica_bind = async_engine.sync_engine
+
+
+if DATABASE_SETTINGS.read_replica_url:
+    REPLICA_URL = to_psycopg_url(DATABASE_SETTINGS.read_replica_url)
+    replica_engine = create_engine(url=REPLICA_URL, future=True, **DATABASE_SETTINGS.engine_options(REPLICA_URL))
+    async_replica_engine = create_async_engine(url=REPLICA_URL, **DATABASE_SETTINGS.engine_options(REPLICA_URL))
+    RoutingSession.replica_bind = replica_engine
+    AsyncRoutingSession.replica_bind = async_replica_engine.sync_engine
+
+    ReadSessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False)
+    AsyncReadSessionLocal = async_sessionmaker(
+        sync_session_class=AsyncRoutingSession, autoflush=False, expire_on_commit=False
+    )
+else:
+    ReadSessionLocal = SessionLocal
+    AsyncReadSessionLocal = AsyncSessionLocal
+
 
 def get_db() -> Iterator[Session]:
     db = SessionLocal()
@@ -19,3 +76,22 @@ def get_db() -> Iterator[Session]:
         yield db
     finally:
         db.close()
+
+
+def get_read_db() -> Iterator[Session]:
+    """Session for read-only (GET) endpoints, served by the read replica when configured."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncReadSessionLocal() as db:
+        yield db
@@ -0,0 +1,21 @@
+"""Operations shared by the scripts in ``alembic/versions``.
+
+They live here rather than next to the scripts because the installed
+``alembic`` package shadows that directory, and alembic loads revision
+scripts (``history``, ``heads``) without running ``env.py``.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def drop_invalid_index(name: str, table: str) -> None:
+    """Drop ``name`` if an interrupted ``CREATE INDEX CONCURRENTLY`` left it invalid.
+
+    ``if_not_exists`` would otherwise keep the unusable index and carry on.
+    """
+    invalid = op.get_bind().execute(
+        sa.text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"), {"name": name}
+    ).scalar()
+    if invalid:
+        op.drop_index(name, table_name=table, postgresql_concurrently=True)
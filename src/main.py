@@ -1,12 +1,87 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+
+from src.database.databases import SessionLocal, engine
+from src.routers.jobs import router as job_router
+from src.routers.metrics import router as metric_router
+from src.routers.scheduler import router as scheduler_router
+from src.routers.scores import router as score_router
+from src.routers.scoring_rules import router as scoring_rules_router
+from src.services import (
+    build_scheduler,
+    interrupted_shard_ids,
+    run_partition_maintenance,
+    shutdown_job_executor,
+    submit_shards,
+)
+from src.utils.validate_db_url import get_scheduler_settings, validate_database_async
+
+if validate_database_async():
+    from src.routers.aio import admin_router, vendor_router
+else:
+    from src.routers.admin import router as admin_router
+    from src.routers.vendors import router as vendor_router
+
+
+logger = logging.getLogger(__name__)
+
+
+def _ensure_partitions() -> None:
+    session = SessionLocal()
+    try:
+        summary = run_partition_maintenance(session, apply_retention=False)
+        if summary.created:
+            logger.info("Created partitions: %s", ", ".join(summary.created))
+    except Exception:
+        # The app can still serve traffic; the maintenance endpoint/CLI can retry.
+        logger.exception("Partition maintenance failed at startup")
+    finally:
+        session.close()
+
+
+def _resume_interrupted_jobs() -> None:
+    session = SessionLocal()
+    try:
+        shard_ids = interrupted_shard_ids(session)
+        if shard_ids:
+            logger.info("Resuming %d recompute job shards", len(shard_ids))
+            submit_shards(shard_ids)
+    except Exception:
+        logger.exception("Could not resume recompute jobs at startup")
+    finally:
+        session.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await run_in_threadpool(_ensure_partitions)
+    await run_in_threadpool(_resume_interrupted_jobs)
+
+    scheduler = None
+    if get_scheduler_settings().enabled:
+        # Every worker runs a scheduler; advisory locks let only one execute each run.
+        scheduler = build_scheduler(engine)
+        scheduler.start()
+
+    yield
+
+    if scheduler is not None:
+        scheduler.shutdown(wait=False)
+    shutdown_job_executor()
 
-from src.routers.admin import router as admin_router
-from src.routers.vendors import router as vendor_router
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(vendor_router)
 app.include_router(admin_router)
+app.include_router(metric_router)
+app.include_router(job_router)
+app.include_router(scheduler_router)
+app.include_router(scoring_rules_router)
+app.include_router(score_router)
 
 
 @app.get("/")
@@ -16,4 +91,4 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
@@ -1,9 +1,21 @@
 from .vendor_model import VendorModel
 from .vendor_metric_model import VendorMetricModel
 from .vendor_score_model import VendorScoreModel
+from .vendor_score_aggregate_model import VendorScoreAggregateModel
+from .recompute_job_model import RecomputeJobModel, RecomputeJobShardModel
+from .scheduled_run_model import ScheduledRunModel
+from .score_replay_model import ScoreReplayModel
+from .score_rollup_model import CategoryScoreBucketModel, DailyScoreBucketModel
 
 __all__ = [
     "VendorModel",
     "VendorMetricModel",
     "VendorScoreModel",
+    "VendorScoreAggregateModel",
+    "RecomputeJobModel",
+    "RecomputeJobShardModel",
+    "ScheduledRunModel",
+    "ScoreReplayModel",
+    "CategoryScoreBucketModel",
+    "DailyScoreBucketModel",
 ]
@@ -0,0 +1,72 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+from src.models.base import Base
+
+
+class RecomputeJobModel(Base):
+    """A queued bulk score recompute; the work itself is tracked per shard."""
+
+    __tablename__ = "recompute_jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False
+    )
+    # queued -> running -> succeeded | failed | cancelled
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued", index=True)
+    force: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    shard_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    cancel_requested: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+    def __repr__(self) -> str:
+        return f"<RecomputeJob(id={self.id}, status={self.status})>"
+
+
+class RecomputeJobShardModel(Base):
+    """One vendor id range of a recompute job, with its checkpoint and counters."""
+
+    __tablename__ = "recompute_job_shards"
+    __table_args__ = (UniqueConstraint("job_id", "shard_index"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False
+    )
+    job_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("recompute_jobs.id", ondelete="CASCADE"), nullable=False
+    )
+    shard_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Vendor ids in [lower_bound, upper_bound); NULL upper bound means unbounded.
+    lower_bound: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    upper_bound: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    # Last vendor id whose chunk was committed; work resumes after it.
+    checkpoint: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    # queued -> running -> succeeded | failed | cancelled
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued")
+    # Changed on every claim; a worker that lost its claim stops at the next chunk.
+    claim_token: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    recomputed_vendors: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    skipped_vendors: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Seconds spent inside chunks; throughput is computed from it.
+    busy_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+
+    def __repr__(self) -> str:
+        return f"<RecomputeJobShard(job_id={self.job_id}, index={self.shard_index}, status={self.status})>"
@@ -0,0 +1,38 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import DateTime, Float, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+from src.models.base import Base
+
+
+class ScheduledRunModel(Base):
+    """History of scheduler-triggered runs, one row per executed run."""
+
+    __tablename__ = "scheduled_runs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False
+    )
+    job_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    # succeeded | failed
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+    finished_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    duration_seconds: Mapped[float] = mapped_column(Float, nullable=False)
+    processed_vendors: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    recomputed_vendors: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    skipped_vendors: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+
+    def __repr__(self) -> str:
+        return f"<ScheduledRun(job_name={self.job_name}, status={self.status}, started_at={self.started_at})>"
@@ -0,0 +1,48 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import JSON, DateTime, Float, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+from src.models.base import Base
+
+
+class ScoreReplayModel(Base):
+    """A replay of the metric history into a versioned score history, with its checkpoint."""
+
+    __tablename__ = "score_replays"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False
+    )
+    # vendor_scores.scoring_version the replayed scores are written with.
+    scoring_version: Mapped[str] = mapped_column(String(40), nullable=False, unique=True)
+    mode: Mapped[str] = mapped_column(String(20), nullable=False)
+    half_life_seconds: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    # queued -> running -> succeeded | failed
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued")
+    # Changed on every claim; a worker that lost its claim stops at the next batch.
+    claim_token: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    # Last metric (vendor_id, timestamp, id) whose score was committed; the replay resumes after it.
+    checkpoint_vendor_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    checkpoint_timestamp: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    checkpoint_metric_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    # Decayed running sums of the checkpoint vendor, so a resume can continue its series.
+    carry: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    vendors_replayed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    scores_written: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+    def __repr__(self) -> str:
+        return f"<ScoreReplay(scoring_version={self.scoring_version}, status={self.status})>"
@@ -0,0 +1,48 @@
+from datetime import date, datetime, timezone
+
+from sqlalchemy import Date, DateTime, Float, Integer, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+from src.models.base import Base
+
+
+class CategoryScoreBucketModel(Base):
+    """Distribution of current vendor scores: vendors per category and 1-point score bucket.
+
+    Maintained incrementally from ``vendors.latest_score`` by
+    ``src.services.score_rollup_service``; bucket ``b`` holds scores in
+    ``[b, b + 1)``, with 100 folded into bucket 99.
+    """
+
+    __tablename__ = "category_score_buckets"
+
+    category: Mapped[str] = mapped_column(String(50), primary_key=True, nullable=False)
+    bucket: Mapped[int] = mapped_column(SmallInteger, primary_key=True, nullable=False)
+    vendors: Mapped[int] = mapped_column(Integer, nullable=False)
+    score_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+
+
+    def __repr__(self) -> str:
+        return f"<CategoryScoreBucket(category={self.category}, bucket={self.bucket}, vendors={self.vendors})>"
+
+
+class DailyScoreBucketModel(Base):
+    """``category_score_buckets`` as it stood after the last rollup refresh of each UTC day."""
+
+    __tablename__ = "daily_score_buckets"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True, nullable=False)
+    category: Mapped[str] = mapped_column(String(50), primary_key=True, nullable=False)
+    bucket: Mapped[int] = mapped_column(SmallInteger, primary_key=True, nullable=False)
+    vendors: Mapped[int] = mapped_column(Integer, nullable=False)
+    score_sum: Mapped[float] = mapped_column(Float, nullable=False)
+
+
+    def __repr__(self) -> str:
+        return f"<DailyScoreBucket(day={self.day}, category={self.category}, bucket={self.bucket})>"
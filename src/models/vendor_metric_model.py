@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Integer, Float, Boolean, DateTime, JSON
+from sqlalchemy import Integer, Float, Boolean, DateTime, JSON, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy import ForeignKey
@@ -14,14 +14,22 @@ class VendorMetricModel(Base):
     """Stores every metric submission made for each vendor."""
 
     __tablename__ = "vendor_metrics"
+    __table_args__ = (
+        # Serves every "newest metric for a vendor" lookup without a sort, and
+        # makes (vendor_id, timestamp) the natural key resubmissions conflict on.
+        Index("ix_vendor_metrics_vendor_id_timestamp", "vendor_id", text("timestamp DESC"), unique=True),
+        # Monthly partitions are managed by src.services.partition_service.
+        {"postgresql_partition_by": 'RANGE ("timestamp")'},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False
     )
     vendor_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("vendors.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("vendors.id"), nullable=False
     )
-    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # Part of the primary key because Postgres requires the partition key in it.
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True, nullable=False)
     on_time_delivery_rate: Mapped[float] = mapped_column(Float, nullable=False)
     complaint_count: Mapped[int] = mapped_column(Integer, nullable=False)
     missing_documents: Mapped[bool] = mapped_column(Boolean, nullable=False)
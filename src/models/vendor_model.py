@@ -1,7 +1,8 @@
 import uuid
 from datetime import datetime, timezone
+from typing import Optional
 
-from sqlalchemy import String, DateTime
+from sqlalchemy import String, DateTime, Float, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -13,12 +14,37 @@ class VendorModel(Base):
     """Vendor Model: Stores identity and category of each vendor."""
 
     __tablename__ = "vendors"
+    __table_args__ = (
+        # Keyset order of GET /vendors, with and without a category filter.
+        Index("ix_vendors_name_id", "name", "id"),
+        Index("ix_vendors_category_name_id", "category", "name", "id"),
+        # Case-insensitive name prefixes; the pg_trgm GIN index for substring
+        # search is created by its migration only where the extension exists.
+        Index("ix_vendors_name_lower_prefix", text("lower(name) text_pattern_ops")),
+        Index("ix_vendors_latest_score", "latest_score"),
+        # Per-category leaderboards: the top N of a category is an index range read.
+        Index(
+            "ix_vendors_category_latest_score",
+            "category",
+            text("latest_score DESC"),
+            "id",
+            postgresql_where=text("latest_score IS NOT NULL"),
+        ),
+        # Vendors whose current score is not yet counted in category_score_buckets.
+        Index(
+            "ix_vendors_rollup_pending",
+            "id",
+            postgresql_where=text(
+                "latest_score IS DISTINCT FROM rollup_score OR category IS DISTINCT FROM rollup_category"
+            ),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False
     )
-    name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
-    category: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
+    category: Mapped[str] = mapped_column(String(50), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
         default=lambda: datetime.now(timezone.utc), 
@@ -30,6 +56,17 @@ class VendorModel(Base):
         onupdate=lambda: datetime.now(timezone.utc), 
         nullable=False
     )
+    # Denormalized copy of the newest vendor_scores row, maintained by the scoring service.
+    latest_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    latest_scored_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Watermark of what latest_score was computed from; incremental recomputes skip unchanged vendors.
+    last_scored_metric_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    last_scored_metric_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_scored_category: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    last_scored_version: Mapped[Optional[str]] = mapped_column(String(40), nullable=True)
+    # Score and category this vendor is currently counted under in the score rollups.
+    rollup_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    rollup_category: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
 
     def __repr__(self) -> str:
@@ -0,0 +1,43 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+from src.models.base import Base
+
+
+class VendorScoreAggregateModel(Base):
+    """Running time-decayed sums of a vendor's metrics, one row per vendor.
+
+    Sums are weighted relative to ``anchor_at`` (the newest metric), so the
+    decayed mean of a component is ``<component>_sum / weight_sum``.
+    """
+
+    __tablename__ = "vendor_score_aggregates"
+
+    vendor_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("vendors.id"), primary_key=True, nullable=False
+    )
+    # Half-life the sums were decayed with; rows built with another one are rebuilt.
+    half_life_seconds: Mapped[float] = mapped_column(Float, nullable=False)
+    anchor_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    weight_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    on_time_delivery_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    compliance_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    complaint_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    missing_documents_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    metric_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Changes on every merge; serves as the scoring watermark in decayed mode.
+    revision: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), default=uuid.uuid4, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+
+
+    def __repr__(self) -> str:
+        return f"<VendorScoreAggregate(vendor_id={self.vendor_id}, metric_count={self.metric_count})>"
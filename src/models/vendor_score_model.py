@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Float, DateTime
+from sqlalchemy import Float, DateTime, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy import ForeignKey
@@ -14,17 +14,45 @@ class VendorScoreModel(Base):
     """Stores history of computed vendor score."""
 
     __tablename__ = "vendor_scores"
+    __table_args__ = (
+        # Covering index: latest-score and history reads by vendor are index-only;
+        # id breaks ties for the (calculated_at, id) history keyset. Live and
+        # replayed scores are indexed apart so neither history scans the other.
+        Index(
+            "ix_vendor_scores_vendor_id_calculated_at_id",
+            "vendor_id",
+            text("calculated_at DESC"),
+            text("id DESC"),
+            postgresql_include=["score"],
+            postgresql_where=text("replay_id IS NULL"),
+        ),
+        Index(
+            "ix_vendor_scores_replayed_vendor_id_calculated_at_id",
+            "vendor_id",
+            text("calculated_at DESC"),
+            text("id DESC"),
+            postgresql_include=["score"],
+            postgresql_where=text("replay_id IS NOT NULL"),
+        ),
+        # Monthly partitions are managed by src.services.partition_service.
+        {"postgresql_partition_by": "RANGE (calculated_at)"},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False
     )
     vendor_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("vendors.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("vendors.id"), nullable=False
     )
+    # Part of the primary key because Postgres requires the partition key in it.
     calculated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+        DateTime(timezone=True), primary_key=True, default=lambda: datetime.now(timezone.utc), nullable=False
     )
     score: Mapped[float] = mapped_column(Float, nullable=False)
+    # Scoring rules the score was computed with; replays write other versions alongside.
+    scoring_version: Mapped[str] = mapped_column(String(40), nullable=False, server_default="v1")
+    # Set on scores written by a score replay; live history is the rows where it is NULL.
+    replay_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
 
 
     def __repr__(self) -> str:
@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from src.database.databases import get_db
-from src.schema import VendorResponse, VendorScoreRecomputeSummary
-from src.services import recompute_all_vendor_scores, recompute_latest_score
+from src.schema import CacheStats, PartitionMaintenanceSummary, VendorResponse, VendorScoreRecomputeSummary
+from src.services import bulk_recompute_vendor_scores, recompute_latest_score, run_partition_maintenance
+from src.utils.cache import vendor_cache
 from src.utils.validate_vendor import load_vendor, vendor_to_response
 
 
@@ -33,20 +34,38 @@ def admin_recompute_vendor_score(
     if snapshot is None:
         raise HTTPException(status_code=400, detail="Vendor has no metrics to recompute")
 
-    return vendor_to_response(vendor, snapshot)
+    return vendor_to_response(vendor)
 
 
-@router.get("/vendors/scores/recompute", response_model=VendorScoreRecomputeSummary)
+@router.get("/vendors/scores/recompute", response_model=VendorScoreRecomputeSummary, deprecated=True)
 def admin_recompute_all_vendor_scores(
+    force: bool = Query(False, description="Rescore every vendor, including unchanged ones"),
     session: Session = Depends(get_db),
 ) -> VendorScoreRecomputeSummary:
-    """Recompute scores for every vendor and return a summary."""
+    """Recompute scores for vendors with new metrics or a changed category and return a summary.
+
+    Runs inside the request; prefer ``POST /admin/jobs/recompute`` for large fleets.
+    """
 
     try:
-        processed = recompute_all_vendor_scores(session)
+        return bulk_recompute_vendor_scores(session, force=force)
 
     except SQLAlchemyError as exc:
         session.rollback()
         raise HTTPException(status_code=500, detail="Failed to recompute vendor scores") from exc
 
-    return VendorScoreRecomputeSummary(processed_vendors=processed)
+
+@router.post("/partitions/maintenance", response_model=PartitionMaintenanceSummary)
+def admin_run_partition_maintenance(
+    session: Session = Depends(get_db),
+) -> PartitionMaintenanceSummary:
+    """Create upcoming monthly partitions and apply the configured retention policy."""
+
+    return run_partition_maintenance(session)
+
+
+@router.get("/cache/stats", response_model=CacheStats)
+def admin_cache_stats() -> CacheStats:
+    """Hit/miss/eviction counters of this worker's vendor detail cache."""
+
+    return vendor_cache.stats()
@@ -0,0 +1,9 @@
+"""Async routers serving the same paths as ``src.routers`` from ``AsyncSession``s."""
+
+from .admin import router as admin_router
+from .vendors import router as vendor_router
+
+__all__ = [
+    "admin_router",
+    "vendor_router",
+]
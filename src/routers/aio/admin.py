@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.database.databases import get_async_db, get_db
+from src.schema import CacheStats, PartitionMaintenanceSummary, VendorResponse, VendorScoreRecomputeSummary
+from src.services import run_partition_maintenance
+from src.services.aio import bulk_recompute_vendor_scores, recompute_latest_score
+from src.utils.cache import vendor_cache
+from src.utils.validate_vendor import load_vendor_async, vendor_to_response
+
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/vendors/{vendor_id}/scores/recompute", response_model=VendorResponse)
+async def admin_recompute_vendor_score(
+    vendor_id: UUID,
+    session: AsyncSession = Depends(get_async_db),
+) -> VendorResponse:
+    """Force recomputation of a specific vendor's score."""
+
+    try:
+        vendor = await load_vendor_async(session, vendor_id)
+        snapshot = await recompute_latest_score(session, vendor)
+
+    except SQLAlchemyError as exc:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to recompute vendor score") from exc
+
+    if snapshot is None:
+        raise HTTPException(status_code=400, detail="Vendor has no metrics to recompute")
+
+    return vendor_to_response(vendor)
+
+
+@router.get("/vendors/scores/recompute", response_model=VendorScoreRecomputeSummary, deprecated=True)
+async def admin_recompute_all_vendor_scores(
+    force: bool = Query(False, description="Rescore every vendor, including unchanged ones"),
+    session: AsyncSession = Depends(get_async_db),
+) -> VendorScoreRecomputeSummary:
+    """Recompute scores for vendors with new metrics or a changed category and return a summary.
+
+    Runs inside the request; prefer ``POST /admin/jobs/recompute`` for large fleets.
+    """
+
+    try:
+        return await bulk_recompute_vendor_scores(session, force=force)
+
+    except SQLAlchemyError as exc:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to recompute vendor scores") from exc
+
+
+@router.post("/partitions/maintenance", response_model=PartitionMaintenanceSummary)
+def admin_run_partition_maintenance(
+    session: Session = Depends(get_db),
+) -> PartitionMaintenanceSummary:
+    """Create upcoming monthly partitions and apply the configured retention policy."""
+
+    return run_partition_maintenance(session)
+
+
+@router.get("/cache/stats", response_model=CacheStats)
+def admin_cache_stats() -> CacheStats:
+    """Hit/miss/eviction counters of this worker's vendor detail cache."""
+
+    return vendor_cache.stats()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from src.database.databases import get_async_db, get_async_read_db
+
+from src.schema import (
+    VendorBatchGetRequest,
+    VendorBatchGetResponse,
+    VendorCategory,
+    VendorCreate,
+    VendorListResponse,
+    VendorMetricCreate,
+    VendorMetricResponse,
+    VendorResponse,
+    VendorScoreResponse,
+)
+from src.services.aio import (
+    batch_get_vendors,
+    create_metric,
+    create_vendor,
+    get_vendor_score_page_json,
+    list_vendors,
+    recompute_latest_score,
+)
+from src.services import metric_is_scored
+
+from src.utils.cursor import decode_score_cursor, decode_vendor_cursor
+from src.utils.idempotency import IDEMPOTENCY_KEY_HEADER, idempotent_response, metric_idempotency, request_fingerprint
+from src.utils.validate_vendor import load_vendor_async, load_vendor_json_async, vendor_to_response
+
+
+router = APIRouter(prefix="/vendors", tags=["vendors"])
+
+
+@router.post("", response_model=VendorResponse, status_code=201)
+async def register_vendor(payload: VendorCreate, session: AsyncSession = Depends(get_async_db)) -> VendorResponse:
+    try:
+        vendor = await create_vendor(session, payload)
+        return vendor_to_response(vendor)
+
+    except IntegrityError as exc:
+        await session.rollback()
+        raise HTTPException(status_code=409, detail="Vendor already exists") from exc
+
+    except SQLAlchemyError as exc:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to register vendor") from exc
+
+
+@router.post("/{vendor_id}/metrics", response_model=VendorMetricResponse, status_code=201)
+async def submit_vendor_metrics(
+    vendor_id: UUID,
+    payload: VendorMetricCreate,
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER, min_length=1, max_length=255),
+    session: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """Record a metric and rescore the vendor.
+
+    Retries are safe: a request repeating an ``Idempotency-Key`` is answered
+    from the idempotency store, and one repeating a metric's vendor and
+    timestamp returns the stored metric. Neither writes or rescores again.
+    """
+
+    scope = f"metrics:{vendor_id}"
+    fingerprint = request_fingerprint(payload.model_dump_json().encode())
+    if idempotency_key is not None:
+        replay = await metric_idempotency.aget(scope, idempotency_key, fingerprint)
+        if replay is not None:
+            return idempotent_response(replay, replayed=True)
+
+    vendor = await load_vendor_async(session, vendor_id)
+
+    raw_payload = payload.raw_payload
+    if raw_payload is None:
+        raw_payload = payload.model_dump(mode="json", exclude={"raw_payload"})
+
+    try:
+        metric, created = await create_metric(session, vendor, payload, raw_payload=raw_payload)
+        if created or not metric_is_scored(vendor, metric):
+            await recompute_latest_score(session, vendor)
+
+        body = VendorMetricResponse.model_validate(metric, from_attributes=True).model_dump_json().encode()
+
+    except IntegrityError as exc:
+        await session.rollback()
+        raise HTTPException(status_code=400, detail="Invalid metric submission") from exc
+
+    except SQLAlchemyError as exc:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to submit vendor metrics") from exc
+
+    if idempotency_key is not None:
+        await metric_idempotency.aput(scope, idempotency_key, fingerprint, body)
+    return idempotent_response(body, replayed=not created)
+
+
+@router.post(":batchGet", response_model=VendorBatchGetResponse)
+async def batch_get_vendor_details(
+    payload: VendorBatchGetRequest, session: AsyncSession = Depends(get_async_read_db)
+) -> VendorBatchGetResponse:
+    """Look up many vendors at once; items follow the request order and unknown ids come back as not found."""
+
+    return await batch_get_vendors(session, payload.ids)
+
+
+@router.get("", response_model=VendorListResponse)
+async def get_vendors(
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    after: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    category: Optional[VendorCategory] = Query(None),
+    name_prefix: Optional[str] = Query(None, min_length=1, max_length=200, description="Case-insensitive name prefix"),
+    q: Optional[str] = Query(None, min_length=1, max_length=200, description="Case-insensitive name substring"),
+    min_score: Optional[float] = Query(None, ge=0, le=100),
+    max_score: Optional[float] = Query(None, ge=0, le=100),
+    session: AsyncSession = Depends(get_async_read_db),
+) -> VendorListResponse:
+    """List vendors by name with their latest scores, one keyset page at a time."""
+
+    if min_score is not None and max_score is not None and min_score > max_score:
+        raise HTTPException(status_code=400, detail="min_score must not exceed max_score")
+    position = decode_vendor_cursor(after) if after is not None else None
+
+    page = await list_vendors(
+        session,
+        limit=limit,
+        after=position,
+        category=category.value if category is not None else None,
+        name_prefix=name_prefix,
+        search=q,
+        min_score=min_score,
+        max_score=max_score,
+    )
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+
+    return page
+
+
+# Cached reads go to the primary: only a cache miss touches the database, and
+# a miss loaded from a lagging replica would cache the data a write just
+# invalidated for the whole entry ttl.
+@router.get("/{vendor_id}", response_model=VendorResponse)
+async def get_vendor_detail(vendor_id: UUID, session: AsyncSession = Depends(get_async_db)) -> Response:
+    # already-serialized bytes; response_model only documents the shape
+    return Response(content=await load_vendor_json_async(session, vendor_id), media_type="application/json")
+
+
+@router.get("/{vendor_id}/scores", response_model=List[VendorScoreResponse])
+async def get_vendor_scores(
+    vendor_id: UUID,
+    limit: int = Query(10, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    after: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    scoring_version: Optional[str] = Query(None, description="Only scores computed with this scoring version"),
+    replayed: bool = Query(False, description="Scores written by score replays instead of the live history"),
+    session: AsyncSession = Depends(get_async_db),
+) -> Response:
+
+    if after is not None and offset:
+        raise HTTPException(status_code=400, detail="Use either offset or after, not both")
+    position = decode_score_cursor(after) if after is not None else None
+
+    items, next_cursor = await get_vendor_score_page_json(
+        session,
+        vendor_id,
+        limit=limit,
+        offset=offset,
+        after=position,
+        start=start,
+        end=end,
+        scoring_version=scoring_version,
+        replayed=replayed,
+    )
+    response = Response(content=items, media_type="application/json")
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    return response
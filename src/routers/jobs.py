@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from src.database.databases import get_db
+from src.schema import RecomputeJobCreate, RecomputeJobResponse, ScoreReplayCreate, ScoreReplayResponse
+from src.services import (
+    create_recompute_job,
+    create_score_replay,
+    get_recompute_job,
+    get_score_replay,
+    job_shard_ids,
+    request_job_cancel,
+    resume_job,
+    resume_score_replay,
+    submit_score_replay,
+    submit_shards,
+)
+
+
+router = APIRouter(prefix="/admin/jobs", tags=["admin"])
+
+
+@router.post("/recompute", response_model=RecomputeJobResponse, status_code=202)
+def enqueue_recompute_job(
+    payload: Optional[RecomputeJobCreate] = None,
+    session: Session = Depends(get_db),
+) -> RecomputeJobResponse:
+    """Queue a bulk score recompute executed by the worker pool; poll the job for progress."""
+
+    payload = payload or RecomputeJobCreate()
+    job = create_recompute_job(session, force=payload.force, shards=payload.shards)
+    submit_shards(job_shard_ids(session, job.id))
+    return get_recompute_job(session, job.id)
+
+
+@router.post("/replays", response_model=ScoreReplayResponse, status_code=202)
+def enqueue_score_replay(payload: ScoreReplayCreate, session: Session = Depends(get_db)) -> ScoreReplayResponse:
+    """Queue a replay of the whole metric history into the score history of a new scoring version."""
+
+    replay = create_score_replay(session, payload.scoring_version, mode=payload.mode)
+    submit_score_replay(replay.id)
+    return get_score_replay(session, replay.id)
+
+
+@router.get("/replays/{replay_id}", response_model=ScoreReplayResponse)
+def get_replay(replay_id: UUID, session: Session = Depends(get_db)) -> ScoreReplayResponse:
+    """Progress of a score replay."""
+
+    return get_score_replay(session, replay_id)
+
+
+@router.post("/replays/{replay_id}/resume", response_model=ScoreReplayResponse, status_code=202)
+def resume_replay(replay_id: UUID, session: Session = Depends(get_db)) -> ScoreReplayResponse:
+    """Requeue a failed or interrupted replay from its checkpoint."""
+
+    replay = resume_score_replay(session, replay_id)
+    submit_score_replay(replay.id)
+    return get_score_replay(session, replay.id)
+
+
+@router.get("/{job_id}", response_model=RecomputeJobResponse)
+def get_job(job_id: UUID, session: Session = Depends(get_db)) -> RecomputeJobResponse:
+    """Progress, throughput and errors of a recompute job."""
+
+    return get_recompute_job(session, job_id)
+
+
+@router.post("/{job_id}/cancel", response_model=RecomputeJobResponse)
+def cancel_job(job_id: UUID, session: Session = Depends(get_db)) -> RecomputeJobResponse:
+    """Stop a job; running shards finish their current chunk first."""
+
+    request_job_cancel(session, job_id)
+    return get_recompute_job(session, job_id)
+
+
+@router.post("/{job_id}/resume", response_model=RecomputeJobResponse, status_code=202)
+def resume_recompute_job(job_id: UUID, session: Session = Depends(get_db)) -> RecomputeJobResponse:
+    """Requeue the unfinished shards of a failed, cancelled or crashed job from their checkpoints."""
+
+    submit_shards(resume_job(session, job_id))
+    return get_recompute_job(session, job_id)
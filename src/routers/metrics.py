@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import codecs
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from src.database.databases import get_db
+from src.schema import MetricImportSummary, VendorMetricBatchRequest, VendorMetricBatchResponse
+from src.services import MetricImporter, create_metrics_batch
+from src.services.metric_import_service import ImportFormat
+from src.utils.validate_vendor import load_vendor
+
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.post("/metrics:batch", response_model=VendorMetricBatchResponse)
+def submit_metrics_batch(
+    payload: VendorMetricBatchRequest,
+    session: Session = Depends(get_db),
+) -> VendorMetricBatchResponse:
+    """Ingest metrics for many vendors at once; each item carries its ``vendor_id``."""
+
+    return create_metrics_batch(session, payload.items)
+
+
+@router.post("/vendors/{vendor_id}/metrics:batch", response_model=VendorMetricBatchResponse)
+def submit_vendor_metrics_batch(
+    vendor_id: UUID,
+    payload: VendorMetricBatchRequest,
+    session: Session = Depends(get_db),
+) -> VendorMetricBatchResponse:
+    """Ingest many metrics for a single vendor."""
+
+    load_vendor(session, vendor_id)
+    return create_metrics_batch(session, payload.items, vendor_id=vendor_id)
+
+
+@router.post("/metrics:import", response_model=MetricImportSummary)
+async def import_metrics(
+    request: Request,
+    fmt: ImportFormat = Query("ndjson", alias="format"),
+    session: Session = Depends(get_db),
+) -> MetricImportSummary:
+    """Stream an NDJSON or CSV request body into ``vendor_metrics`` via COPY.
+
+    The body is decoded chunk by chunk as it arrives; parsing and COPY run in
+    the threadpool so the event loop is never blocked on the database.
+    """
+
+    importer = MetricImporter(session, fmt)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    remainder = ""
+
+    try:
+        async for chunk in request.stream():
+            *lines, remainder = (remainder + decoder.decode(chunk)).split("\n")
+            if lines:
+                await run_in_threadpool(importer.feed_lines, lines)
+        remainder += decoder.decode(b"", final=True)
+
+    except UnicodeDecodeError as exc:
+        raise HTTPException(status_code=400, detail="Import body must be UTF-8 encoded") from exc
+
+    if remainder:
+        await run_in_threadpool(importer.feed_lines, [remainder])
+    return await run_in_threadpool(importer.finish)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from src.database.databases import get_read_db
+from src.schema import ScheduledRunResponse
+from src.services import list_scheduled_runs
+
+
+router = APIRouter(prefix="/admin/scheduler", tags=["admin"])
+
+
+@router.get("/runs", response_model=List[ScheduledRunResponse])
+def get_scheduled_runs(
+    job_name: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=200),
+    session: Session = Depends(get_read_db),
+) -> List[ScheduledRunResponse]:
+    """History of scheduler-triggered runs, newest first."""
+
+    return [
+        ScheduledRunResponse.model_validate(run)
+        for run in list_scheduled_runs(session, job_name=job_name, limit=limit)
+    ]
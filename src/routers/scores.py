@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from src.database.databases import get_read_db
+from src.schema import LeaderboardResponse, ScoreHistogramResponse, ScoreStatsResponse, VendorCategory
+from src.services import get_leaderboard, get_score_histogram, get_score_stats, open_score_export
+from src.services.score_export_service import EXPORT_MAX_VENDOR_IDS, EXPORT_MEDIA_TYPES, ExportFormat
+
+
+router = APIRouter(prefix="/scores", tags=["scores"])
+
+
+@router.get("/export")
+def export_scores(
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+    vendor_ids: Optional[List[UUID]] = Query(None, alias="vendor_id", description="Repeat to export several vendors"),
+    category: Optional[VendorCategory] = Query(None),
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    scoring_version: Optional[str] = Query(None),
+    replayed: bool = Query(False, description="Export scores written by score replays instead of live ones"),
+    session: Session = Depends(get_read_db),
+) -> StreamingResponse:
+    """Stream the matching score history as NDJSON, CSV or an Arrow IPC stream.
+
+    Rows come off a server-side cursor one batch at a time and are written as
+    the client reads them, so an export of any size runs in constant memory.
+    """
+
+    if vendor_ids is not None and len(vendor_ids) > EXPORT_MAX_VENDOR_IDS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {EXPORT_MAX_VENDOR_IDS} vendor_id values; filter by category instead"
+        )
+    if start is not None and end is not None and start >= end:
+        raise HTTPException(status_code=400, detail="from must be before to")
+
+    # The export opens its own connection: the request session is closed
+    # before the body is streamed.
+    chunks = open_score_export(
+        session.get_bind(),
+        fmt,
+        vendor_ids=vendor_ids,
+        category=category.value if category is not None else None,
+        start=start,
+        end=end,
+        scoring_version=scoring_version,
+        replayed=replayed,
+    )
+    extension = "arrows" if fmt == "arrow" else fmt
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="scores.{extension}"'},
+    )
+
+
+@router.get("/leaderboard", response_model=LeaderboardResponse)
+def get_score_leaderboard(
+    category: Optional[VendorCategory] = Query(None, description="Every category when omitted"),
+    limit: int = Query(10, ge=1, le=100, description="Vendors per category"),
+    session: Session = Depends(get_read_db),
+) -> LeaderboardResponse:
+    """Vendors with the highest current scores, ranked within each category."""
+
+    return get_leaderboard(session, category=category.value if category is not None else None, limit=limit)
+
+
+@router.get("/stats", response_model=ScoreStatsResponse)
+def get_category_score_stats(
+    category: Optional[VendorCategory] = Query(None),
+    session: Session = Depends(get_read_db),
+) -> ScoreStatsResponse:
+    """Count, mean and percentiles of current scores per category, from the score rollups."""
+
+    return get_score_stats(session, category=category.value if category is not None else None)
+
+
+@router.get("/histogram", response_model=ScoreHistogramResponse)
+def get_daily_score_histogram(
+    category: Optional[VendorCategory] = Query(None, description="All categories combined when omitted"),
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+    bin_width: int = Query(10, ge=1, le=100, description="Score points per histogram bin"),
+    session: Session = Depends(get_read_db),
+) -> ScoreHistogramResponse:
+    """Daily distribution of current scores, as of the last rollup refresh of each day (both ends inclusive)."""
+
+    if start is not None and end is not None and start > end:
+        raise HTTPException(status_code=400, detail="from must not be after to")
+    return get_score_histogram(
+        session,
+        category=category.value if category is not None else None,
+        start=start,
+        end=end,
+        bin_width=bin_width,
+    )
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from src.database.databases import get_db
+from src.schema import ScoreRollupRefreshSummary, ScoringRulesResponse
+from src.services import get_scoring_rules, refresh_score_rollups, reload_scoring_rules
+
+
+router = APIRouter(prefix="/admin/scoring", tags=["admin"])
+
+
+@router.get("/rules", response_model=ScoringRulesResponse)
+def get_rules() -> ScoringRulesResponse:
+    """Rule sets loaded by the worker serving this request."""
+
+    return get_scoring_rules()
+
+
+@router.post("/rules/reload", response_model=ScoringRulesResponse)
+def reload_rules() -> ScoringRulesResponse:
+    """Reload ``SCORING_RULES_PATH`` now instead of waiting for the next change check.
+
+    Only this worker reloads immediately; the others pick the change up
+    within ``SCORING_RULES_RELOAD_SECONDS``.
+    """
+
+    return reload_scoring_rules()
+
+
+@router.post("/rollups/refresh", response_model=ScoreRollupRefreshSummary)
+def refresh_rollups(session: Session = Depends(get_db)) -> ScoreRollupRefreshSummary:
+    """Fold scores changed outside recompute runs (e.g. by metric submissions) into the rollups now."""
+
+    return refresh_score_rollups(session)
@@ -1,6 +1,41 @@
-from .vendor_category import VendorCategory, VendorCreate, VendorUpdate, VendorResponse, VendorListResponse
-from .vendor_metric import VendorMetricCreate, VendorMetricResponse
-from .vendor_score import VendorScoreResponse, VendorScoreRecomputeSummary
+from .vendor_category import (
+    VendorCategory,
+    VendorCreate,
+    VendorUpdate,
+    VendorResponse,
+    VendorListResponse,
+    VendorRow,
+    VendorBatchGetRequest,
+    VendorBatchGetItem,
+    VendorBatchGetResponse,
+)
+from .vendor_metric import (
+    METRIC_BATCH_MAX_ITEMS,
+    VendorMetricCreate,
+    VendorMetricResponse,
+    VendorMetricBatchItem,
+    VendorMetricBatchRequest,
+    VendorMetricBatchItemResult,
+    VendorMetricBatchResponse,
+    MetricImportRejection,
+    MetricImportSummary,
+)
+from .vendor_score import VendorScoreResponse, VendorScoreRow, VendorScorePage, VendorScoreRecomputeSummary
+from .partition import PartitionMaintenanceSummary
+from .cache import CacheStats
+from .scheduled_run import ScheduledRunResponse
+from .scoring_rules import ScoringRuleSet, ScoringRuleFile, ScoringRulesResponse
+from .score_replay import ScoreReplayCreate, ScoreReplayResponse
+from .score_rollup import (
+    LeaderboardEntry,
+    LeaderboardResponse,
+    CategoryScoreStats,
+    ScoreStatsResponse,
+    DailyScoreDistribution,
+    ScoreHistogramResponse,
+    ScoreRollupRefreshSummary,
+)
+from .recompute_job import JobStatus, RecomputeJobCreate, RecomputeJobShardResponse, RecomputeJobResponse
 
 __all__ = [
     "VendorCategory",
@@ -8,8 +43,40 @@ __all__ = [
     "VendorUpdate",
     "VendorResponse",
     "VendorListResponse",
+    "VendorRow",
+    "VendorBatchGetRequest",
+    "VendorBatchGetItem",
+    "VendorBatchGetResponse",
     "VendorMetricCreate",
     "VendorMetricResponse",
+    "METRIC_BATCH_MAX_ITEMS",
+    "VendorMetricBatchItem",
+    "VendorMetricBatchRequest",
+    "VendorMetricBatchItemResult",
+    "VendorMetricBatchResponse",
+    "MetricImportRejection",
+    "MetricImportSummary",
     "VendorScoreResponse",
+    "VendorScoreRow",
+    "VendorScorePage",
     "VendorScoreRecomputeSummary",
-]
\ No newline at end of file
+    "PartitionMaintenanceSummary",
+    "CacheStats",
+    "JobStatus",
+    "RecomputeJobCreate",
+    "RecomputeJobShardResponse",
+    "RecomputeJobResponse",
+    "ScheduledRunResponse",
+    "ScoringRuleSet",
+    "ScoringRuleFile",
+    "ScoringRulesResponse",
+    "ScoreReplayCreate",
+    "ScoreReplayResponse",
+    "LeaderboardEntry",
+    "LeaderboardResponse",
+    "CategoryScoreStats",
+    "ScoreStatsResponse",
+    "DailyScoreDistribution",
+    "ScoreHistogramResponse",
+    "ScoreRollupRefreshSummary",
+]
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    """Counters of a cache as seen by this worker since it started.
+
+    Size and eviction counters are only known for the in-memory backend.
+    """
+
+    backend: str
+    ttl_seconds: float
+    hits: int
+    misses: int
+    coalesced: int = 0
+    size: Optional[int] = None
+    maxsize: Optional[int] = None
+    evictions: Optional[int] = None
+    expirations: Optional[int] = None
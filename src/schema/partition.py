@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+
+class PartitionMaintenanceSummary(BaseModel):
+    """Partitions touched by one maintenance run."""
+
+    created: list[str] = Field(default_factory=list)
+    archived: list[str] = Field(default_factory=list)
+    dropped: list[str] = Field(default_factory=list)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field, ConfigDict
+
+JobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+
+class RecomputeJobCreate(BaseModel):
+    """Request body for enqueueing a bulk recompute job."""
+
+    force: bool = False
+    shards: Optional[int] = Field(None, ge=1, le=256, description="Vendor id ranges processed in parallel")
+
+
+class RecomputeJobShardResponse(BaseModel):
+    """Progress of one vendor id range of a job."""
+
+    shard_index: int
+    status: JobStatus
+    lower_bound: UUID
+    upper_bound: Optional[UUID] = None
+    checkpoint: Optional[UUID] = None
+    recomputed_vendors: int
+    skipped_vendors: int
+    error: Optional[str] = None
+    heartbeat_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RecomputeJobResponse(BaseModel):
+    """Job state with counters summed over its shards."""
+
+    id: UUID
+    status: JobStatus
+    force: bool
+    cancel_requested: bool
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    processed_vendors: int = Field(0, ge=0)
+    recomputed_vendors: int = Field(0, ge=0)
+    skipped_vendors: int = Field(0, ge=0)
+    rows_per_second: float = Field(0.0, ge=0)
+    errors: list[str] = Field(default_factory=list)
+    shards: list[RecomputeJobShardResponse] = Field(default_factory=list)
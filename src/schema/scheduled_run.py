@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ScheduledRunResponse(BaseModel):
+    """One scheduler-triggered run and what it did."""
+
+    id: UUID
+    job_name: str
+    status: str
+    started_at: datetime
+    finished_at: datetime
+    duration_seconds: float
+    processed_vendors: Optional[int] = None
+    recomputed_vendors: Optional[int] = None
+    skipped_vendors: Optional[int] = None
+    error: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
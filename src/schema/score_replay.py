@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+class ScoreReplayCreate(BaseModel):
+    """Request body for replaying the metric history with a loaded scoring rule set."""
+
+    scoring_version: str = Field(..., min_length=1, max_length=40, pattern=r"^[A-Za-z0-9._-]+$")
+    # Defaults to SCORING_MODE.
+    mode: Optional[Literal["latest", "decayed"]] = None
+
+
+class ScoreReplayResponse(BaseModel):
+    """Progress of a score history replay."""
+
+    id: UUID
+    scoring_version: str
+    mode: str
+    half_life_seconds: Optional[float] = None
+    status: Literal["queued", "running", "succeeded", "failed"]
+    checkpoint_vendor_id: Optional[UUID] = None
+    checkpoint_timestamp: Optional[datetime] = None
+    vendors_replayed: int
+    scores_written: int
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class LeaderboardEntry(BaseModel):
+    """A vendor's place among the highest current scores of its category."""
+
+    category: str
+    rank: int
+    vendor_id: UUID
+    name: str
+    score: float
+    scored_at: Optional[datetime] = None
+
+
+class LeaderboardResponse(BaseModel):
+    items: list[LeaderboardEntry]
+
+
+class ScoreDistribution(BaseModel):
+    """Summary of a set of scores; percentiles are interpolated within 1-point buckets."""
+
+    vendors: int
+    mean_score: Optional[float] = None
+    p10: Optional[float] = None
+    p50: Optional[float] = None
+    p90: Optional[float] = None
+
+
+class CategoryScoreStats(ScoreDistribution):
+    category: str
+
+
+class ScoreStatsResponse(BaseModel):
+    """Current-score statistics per category, as of the last rollup refresh."""
+
+    items: list[CategoryScoreStats]
+    refreshed_at: Optional[datetime] = None
+
+
+class DailyScoreDistribution(ScoreDistribution):
+    day: date
+    # Vendors per bin of ``bin_width`` points, lowest bin first.
+    histogram: list[int]
+
+
+class ScoreHistogramResponse(BaseModel):
+    """Current-score distribution as it stood at the end of each day with a rollup refresh."""
+
+    category: Optional[str] = None
+    bin_width: int
+    days: list[DailyScoreDistribution]
+
+
+class ScoreRollupRefreshSummary(BaseModel):
+    """Result of folding changed vendor scores into the rollups."""
+
+    folded_vendors: int
+    day: date
+    duration_seconds: float
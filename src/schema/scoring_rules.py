@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from .vendor_category import VendorCategory
+
+
+def _default_category_weights() -> dict[VendorCategory, float]:
+    return {
+        VendorCategory.supplier: 1.0,
+        VendorCategory.distributor: 0.95,
+        VendorCategory.dealer: 0.9,
+        VendorCategory.manufacturer: 1.05,
+    }
+
+
+class ScoringRuleSet(BaseModel):
+    """One versioned set of scoring weights and penalties; the defaults are version ``v1``."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    version: str = Field(..., min_length=1, max_length=40, pattern=r"^[A-Za-z0-9._-]+$")
+    delivery_weight: float = Field(0.45, ge=0)
+    compliance_weight: float = Field(0.4, ge=0)
+    # Reliability points before complaint penalties.
+    reliability_points: float = Field(15.0, ge=0)
+    penalty_per_complaint: float = Field(1.25, ge=0)
+    max_complaint_penalty: float = Field(25.0, ge=0)
+    missing_documents_penalty: float = Field(10.0, ge=0)
+    category_weights: dict[VendorCategory, float] = Field(default_factory=_default_category_weights)
+    # Weight of categories missing from category_weights.
+    default_category_weight: float = Field(1.0, ge=0)
+
+
+# Built-in rule set every existing score was computed with before rule files existed.
+DEFAULT_RULE_SET_VERSION = "v1"
+
+
+class ScoringRuleFile(BaseModel):
+    """Contents of ``SCORING_RULES_PATH``: every known rule set and which one scores vendors."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    active: str
+    # Rule-set version -> share of vendors (picked by vendor id) scored with it instead of ``active``.
+    experiments: dict[str, float] = Field(default_factory=dict)
+    rule_sets: list[ScoringRuleSet] = Field(..., min_length=1)
+
+    @model_validator(mode="after")
+    def check_versions(self) -> "ScoringRuleFile":
+        versions = [rule_set.version for rule_set in self.rule_sets]
+        if len(set(versions)) != len(versions):
+            raise ValueError("rule set versions must be unique")
+        unknown = ({self.active} | self.experiments.keys()) - set(versions)
+        if unknown:
+            raise ValueError(f"unknown rule set versions: {', '.join(sorted(unknown))}")
+        if any(share < 0 for share in self.experiments.values()) or sum(self.experiments.values()) > 1:
+            raise ValueError("experiment shares must be non-negative and add up to at most 1")
+        # Scores stamped v1 must keep meaning the built-in weights.
+        default = ScoringRuleSet(version=DEFAULT_RULE_SET_VERSION)
+        if any(rule_set.version == default.version and rule_set != default for rule_set in self.rule_sets):
+            raise ValueError(f"rule set {default.version} is built in and cannot be redefined; use a new version")
+        return self
+
+
+class ScoringRulesResponse(BaseModel):
+    """Rule sets currently loaded by this worker."""
+
+    active: str
+    experiments: dict[str, float]
+    versions: list[str]
+    source: Optional[str] = None
+    loaded_at: datetime
@@ -6,6 +6,7 @@ from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, ConfigDict
+from typing_extensions import TypedDict
 
 
 class VendorCategory(str, Enum):
@@ -47,8 +48,47 @@ class VendorResponse(VendorBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class VendorRow(TypedDict):
+    """``VendorResponse`` as a plain dict, for serializing database rows without building models."""
+
+    name: str
+    category: str
+    id: UUID
+    created_at: datetime
+    updated_at: datetime
+    latest_score: Optional[float]
+
+
 class VendorListResponse(BaseModel):
     """Paginated vendor list payload."""
 
     items: list[VendorResponse]
+    # Items on this page.
     count: int
+    # Pass back as ``after`` for the next page; None on the last page.
+    next_cursor: Optional[str] = None
+
+
+VENDOR_BATCH_GET_MAX_IDS = 5_000
+
+
+class VendorBatchGetRequest(BaseModel):
+    """Vendor ids to resolve in one call; duplicates are answered once per occurrence."""
+
+    ids: list[UUID] = Field(..., min_length=1, max_length=VENDOR_BATCH_GET_MAX_IDS)
+
+
+class VendorBatchGetItem(BaseModel):
+    """One requested id, with the vendor when it exists."""
+
+    id: UUID
+    found: bool
+    vendor: Optional[VendorResponse] = None
+
+
+class VendorBatchGetResponse(BaseModel):
+    """Batch lookup result; ``items`` follow the order of the requested ids."""
+
+    items: list[VendorBatchGetItem]
+    found: int = Field(..., ge=0)
+    not_found: int = Field(..., ge=0)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
@@ -37,3 +37,56 @@ class VendorMetricResponse(VendorMetricBase):
     id: UUID
     vendor_id: UUID
     model_config = ConfigDict(from_attributes=True)
+
+
+# Upper bound on metrics accepted by one batch request.
+METRIC_BATCH_MAX_ITEMS = 10_000
+
+
+class VendorMetricBatchItem(VendorMetricCreate):
+    """A metric submission addressed to a vendor, as sent to ``POST /metrics:batch``."""
+
+    vendor_id: UUID
+
+
+class VendorMetricBatchRequest(BaseModel):
+    """Batch of metric submissions; items are validated one by one so bad rows are reported, not fatal."""
+
+    items: list[dict[str, Any]] = Field(..., min_length=1, max_length=METRIC_BATCH_MAX_ITEMS)
+
+
+class VendorMetricBatchItemResult(BaseModel):
+    """Outcome of a single batch item, in request order."""
+
+    index: int
+    status: Literal["created", "duplicate", "rejected"]
+    vendor_id: Optional[UUID] = None
+    metric_id: Optional[UUID] = None
+    detail: Optional[str] = None
+
+
+class VendorMetricBatchResponse(BaseModel):
+    """Per-item results and totals for a metric batch."""
+
+    created: int = Field(..., ge=0)
+    duplicates: int = Field(0, ge=0)
+    rejected: int = Field(..., ge=0)
+    rescored_vendors: int = Field(..., ge=0)
+    items: list[VendorMetricBatchItemResult]
+
+
+class MetricImportRejection(BaseModel):
+    """A line of an import stream that was not loaded."""
+
+    line: int = Field(..., ge=1)
+    detail: str
+
+
+class MetricImportSummary(BaseModel):
+    """Progress and outcome of a streaming metric import."""
+
+    lines_read: int = Field(0, ge=0)
+    imported: int = Field(0, ge=0)
+    duplicates: int = Field(0, ge=0)
+    rejected: int = Field(0, ge=0)
+    errors: list[MetricImportRejection] = Field(default_factory=list)
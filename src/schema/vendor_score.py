@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, ConfigDict
+from typing_extensions import TypedDict
 
 
 class VendorScoreResponse(BaseModel):
@@ -13,11 +15,34 @@ class VendorScoreResponse(BaseModel):
     vendor_id: UUID
     calculated_at: datetime
     score: float = Field(..., ge=0, le=100)
+    scoring_version: str
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class VendorScoreRow(TypedDict):
+    """``VendorScoreResponse`` as a plain dict, for serializing database rows without building models."""
+
+    id: UUID
+    vendor_id: UUID
+    calculated_at: datetime
+    score: float
+    scoring_version: str
+
+
+class VendorScorePage(BaseModel):
+    """One page of score history plus the cursor of the next page, if any."""
+
+    items: list[VendorScoreResponse]
+    next_cursor: Optional[str] = None
+
+
 class VendorScoreRecomputeSummary(BaseModel):
     """Summary payload for bulk recomputation requests."""
 
     processed_vendors: int = Field(..., ge=0)
+    recomputed_vendors: int = Field(0, ge=0)
+    # Vendors whose latest metric and category were already scored.
+    skipped_vendors: int = Field(0, ge=0)
+    duration_seconds: float = Field(0.0, ge=0)
+    rows_per_second: float = Field(0.0, ge=0)
@@ -2,25 +2,98 @@ from .vendor_service import (
     create_vendor,
     update_vendor,
     get_vendor_latest_score,
+    list_vendors,
+    batch_get_vendors,
     list_vendor_scores,
+    get_vendor_score_page_json,
 )
-from .metric_service import create_metric, get_latest_metric
+from .metric_service import create_metric, get_latest_metric, metric_is_scored
 from .scoring_service import (
     compute_score,
+    score_metric_values,
+    compute_scores_batch,
+    encode_categories,
     record_score_snapshot,
     recompute_latest_score,
     recompute_all_vendor_scores,
+    bulk_recompute_vendor_scores,
 )
+from .scoring_rule_service import compile_rule_set, get_scoring_rules, reload_scoring_rules, scoring_rules
+from .score_aggregate_service import apply_metric_aggregates, rebuild_score_aggregates
+from .metric_batch_service import create_metrics_batch
+from .metric_import_service import MetricImporter, import_metric_lines
+from .partition_service import run_partition_maintenance
+from .recompute_job_service import (
+    create_recompute_job,
+    get_recompute_job,
+    job_shard_ids,
+    request_job_cancel,
+    resume_job,
+    interrupted_shard_ids,
+    submit_shards,
+    shutdown_job_executor,
+)
+from .score_replay_service import (
+    create_score_replay,
+    get_score_replay,
+    resume_score_replay,
+    run_score_replay,
+    submit_score_replay,
+)
+from .score_export_service import open_score_export
+from .score_rollup_service import get_leaderboard, get_score_histogram, get_score_stats, refresh_score_rollups
+from .parallel_recompute_service import parallel_recompute_vendor_scores
+from .scheduler_service import build_scheduler, list_scheduled_runs, run_scheduled_job
 
 __all__ = [
     "create_vendor",
     "update_vendor",
     "get_vendor_latest_score",
+    "list_vendors",
+    "batch_get_vendors",
     "list_vendor_scores",
+    "get_vendor_score_page_json",
     "create_metric",
     "get_latest_metric",
+    "metric_is_scored",
+    "apply_metric_aggregates",
+    "rebuild_score_aggregates",
+    "create_metrics_batch",
+    "MetricImporter",
+    "import_metric_lines",
     "compute_score",
+    "score_metric_values",
+    "compute_scores_batch",
+    "encode_categories",
+    "compile_rule_set",
+    "get_scoring_rules",
+    "reload_scoring_rules",
+    "scoring_rules",
     "record_score_snapshot",
     "recompute_latest_score",
     "recompute_all_vendor_scores",
-]
\ No newline at end of file
+    "bulk_recompute_vendor_scores",
+    "run_partition_maintenance",
+    "create_recompute_job",
+    "get_recompute_job",
+    "job_shard_ids",
+    "request_job_cancel",
+    "resume_job",
+    "interrupted_shard_ids",
+    "submit_shards",
+    "shutdown_job_executor",
+    "create_score_replay",
+    "get_score_replay",
+    "resume_score_replay",
+    "run_score_replay",
+    "submit_score_replay",
+    "open_score_export",
+    "get_leaderboard",
+    "get_score_stats",
+    "get_score_histogram",
+    "refresh_score_rollups",
+    "parallel_recompute_vendor_scores",
+    "build_scheduler",
+    "list_scheduled_runs",
+    "run_scheduled_job",
+]
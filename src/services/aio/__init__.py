@@ -0,0 +1,34 @@
+"""Async counterparts of the services, used when ``DATABASE_ASYNC`` is enabled."""
+
+from .vendor_service import (
+    create_vendor,
+    update_vendor,
+    get_vendor_latest_score,
+    list_vendors,
+    batch_get_vendors,
+    list_vendor_scores,
+    get_vendor_score_page_json,
+)
+from .metric_service import create_metric, get_latest_metric
+from .scoring_service import (
+    record_score_snapshot,
+    recompute_latest_score,
+    recompute_all_vendor_scores,
+    bulk_recompute_vendor_scores,
+)
+
+__all__ = [
+    "create_vendor",
+    "update_vendor",
+    "get_vendor_latest_score",
+    "list_vendors",
+    "batch_get_vendors",
+    "list_vendor_scores",
+    "get_vendor_score_page_json",
+    "create_metric",
+    "get_latest_metric",
+    "record_score_snapshot",
+    "recompute_latest_score",
+    "recompute_all_vendor_scores",
+    "bulk_recompute_vendor_scores",
+]
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from src.models import VendorMetricModel, VendorModel
+from src.schema import VendorMetricCreate
+from src.services.metric_service import (
+	ensure_same_measurement,
+	insert_metric_stmt,
+	latest_metric_stmt,
+	metric_at_stmt,
+	metric_values,
+)
+from src.services.score_aggregate_service import (
+	lock_missing_aggregates_stmt,
+	merge_aggregates_stmt,
+	metric_aggregate_row,
+	missing_aggregates_stmt,
+	unmerged_partials,
+)
+from src.utils.cache import ainvalidate_vendors
+
+
+async def create_metric(
+	session: AsyncSession,
+	vendor: VendorModel,
+	payload: VendorMetricCreate,
+	*,
+	raw_payload: dict[str, Any] | None = None,
+) -> tuple[VendorMetricModel, bool]:
+	"""Insert a vendor metric submission and fold it into the vendor's decayed aggregate.
+
+	Resubmitting a vendor's metric for the same timestamp returns the stored
+	row and False without writing anything, as in the sync service.
+	"""
+
+	values = metric_values(vendor, payload, raw_payload=raw_payload)
+
+	try:
+		metric = (await session.execute(insert_metric_stmt(values))).scalars().first()
+		if metric is None:
+			metric = (await session.execute(metric_at_stmt(vendor.id, payload.timestamp))).scalar_one()
+			# nothing was written, so there is nothing to commit
+			ensure_same_measurement(metric, values)
+			return metric, False
+
+		await session.execute(lock_missing_aggregates_stmt([vendor.id]))
+		rebuilt = (await session.execute(missing_aggregates_stmt([vendor.id]))).scalars().all()
+		partials = unmerged_partials([metric_aggregate_row(metric)], rebuilt)
+		if partials:
+			await session.execute(merge_aggregates_stmt(), partials)
+		await session.commit()
+		await ainvalidate_vendors(vendor.id)
+		await session.refresh(metric)
+		return metric, True
+
+	except IntegrityError as exc:
+		await session.rollback()
+		raise HTTPException(status_code=400, detail="Invalid vendor metric submission.") from exc
+
+	except SQLAlchemyError as exc:
+		await session.rollback()
+		raise HTTPException(status_code=500, detail="Failed to record vendor metric.") from exc
+
+
+async def get_latest_metric(session: AsyncSession, vendor_id: UUID) -> VendorMetricModel | None:
+	"""Return the newest metric for a vendor by timestamp."""
+
+	try:
+		return (await session.execute(latest_metric_stmt(vendor_id))).scalars().first()
+
+	except SQLAlchemyError as exc:
+		raise HTTPException(status_code=500, detail="Failed to fetch latest vendor metric.") from exc
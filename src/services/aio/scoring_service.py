@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Collection
+from datetime import datetime, timezone
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.models import VendorMetricModel, VendorModel, VendorScoreModel
+from src.schema import VendorScoreRecomputeSummary
+from src.services.metric_service import latest_metric_stmt
+from src.services.score_aggregate_service import decayed_metrics_stmt, rebuild_aggregates_stmt
+from src.services.score_rollup_service import refresh_rollups_after_recompute
+from src.services.scoring_rule_service import scoring_rules
+from src.services.scoring_service import (
+    BULK_RECOMPUTE_CHUNK_SIZE,
+    build_score_snapshot,
+    compute_score,
+    latest_score_params,
+    metric_watermark,
+    plan_score_chunk,
+    recompute_summary,
+    scoring_inputs_stmt,
+    scoring_watermark,
+    snapshot_params,
+    sync_vendor_latest_score,
+    vendor_latest_score_stmt,
+)
+from src.utils.cache import ainvalidate_all_vendors, ainvalidate_vendors
+from src.utils.validate_db_url import get_scoring_settings
+
+
+async def record_score_snapshot(
+    session: AsyncSession,
+    vendor: VendorModel,
+    score_value: float,
+    *,
+    metric: VendorMetricModel | None = None,
+    watermark: dict | None = None,
+    scoring_version: str | None = None,
+) -> VendorScoreModel:
+    """Record a recent score calculated for a vendor and make it the vendor's current score."""
+
+    snapshot = build_score_snapshot(vendor, score_value, scoring_version)
+    watermark = watermark or metric_watermark(vendor, metric)
+    params = snapshot_params(vendor, snapshot, watermark)
+
+    try:
+        session.add(snapshot)
+        await session.execute(vendor_latest_score_stmt(), latest_score_params([params]))
+        await session.commit()
+        await ainvalidate_vendors(vendor.id)
+        await session.refresh(snapshot)
+        sync_vendor_latest_score(vendor, snapshot, watermark)
+        return snapshot
+
+    except SQLAlchemyError as exc:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to record vendor score snapshot.") from exc
+
+
+async def recompute_latest_score(session: AsyncSession, vendor: VendorModel) -> VendorScoreModel | None:
+    """Recompute the score using the most recent vendor metric, or the decayed history in decayed mode."""
+
+    if get_scoring_settings().mode == "decayed":
+        return await recompute_decayed_score(session, vendor)
+
+    try:
+        metric = (await session.execute(latest_metric_stmt(vendor.id))).scalars().first()
+
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=500, detail="Failed to fetch vendor metrics for scoring.") from exc
+
+    if metric is None:
+        return None
+
+    rules = scoring_rules.for_vendor(vendor.id)
+    score_value = compute_score(metric, vendor, rules)
+    return await record_score_snapshot(session, vendor, score_value, metric=metric, scoring_version=rules.version)
+
+
+async def recompute_decayed_score(session: AsyncSession, vendor: VendorModel) -> VendorScoreModel | None:
+    """Recompute the score from the vendor's running decayed aggregate."""
+
+    try:
+        await session.execute(rebuild_aggregates_stmt(vendor_ids=[vendor.id], stale_only=True))
+        row = (await session.execute(decayed_metrics_stmt(vendor_ids=[vendor.id]))).first()
+
+    except SQLAlchemyError as exc:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to fetch vendor metrics for scoring.") from exc
+
+    if row is None:
+        return None
+
+    rules = scoring_rules.for_vendor(vendor.id)
+    score_value = rules.score(
+        row.on_time_delivery_rate, row.compliance_score, row.complaint_count, row.missing_documents, row.category
+    )
+    watermark = scoring_watermark(row.metric_id, row.metric_timestamp, row.category)
+    return await record_score_snapshot(
+        session, vendor, score_value, watermark=watermark, scoring_version=rules.version
+    )
+
+
+async def recompute_score_chunk(
+    session: AsyncSession,
+    *,
+    calculated_at: datetime,
+    after: UUID | None = None,
+    vendor_ids: Collection[UUID] | None = None,
+    limit: int = BULK_RECOMPUTE_CHUNK_SIZE,
+    force: bool = False,
+) -> tuple[int, int, UUID | None]:
+    """Score the next chunk of vendors and insert their snapshots without committing."""
+
+    result = await session.execute(scoring_inputs_stmt(after=after, vendor_ids=vendor_ids, limit=limit))
+    rows = result.all()
+    if not rows:
+        return 0, 0, None
+
+    snapshots, params = plan_score_chunk(rows, calculated_at, force=force)
+    if snapshots:
+        await session.execute(insert(VendorScoreModel), snapshots)
+        await session.execute(vendor_latest_score_stmt(), params)
+    return len(snapshots), len(rows) - len(snapshots), rows[-1].vendor_id
+
+
+async def bulk_recompute_vendor_scores(
+    session: AsyncSession,
+    *,
+    vendor_ids: Collection[UUID] | None = None,
+    chunk_size: int = BULK_RECOMPUTE_CHUNK_SIZE,
+    force: bool = False,
+) -> VendorScoreRecomputeSummary:
+    """Recompute scores set-based in chunks and commit every snapshot in one transaction."""
+
+    started = time.perf_counter()
+    calculated_at = datetime.now(timezone.utc)
+    recomputed = skipped = 0
+    cursor: UUID | None = None
+
+    try:
+        if get_scoring_settings().mode == "decayed":
+            await session.execute(rebuild_aggregates_stmt(vendor_ids=vendor_ids, stale_only=True))
+        while True:
+            written, unchanged, cursor = await recompute_score_chunk(
+                session,
+                calculated_at=calculated_at,
+                after=cursor,
+                vendor_ids=vendor_ids,
+                limit=chunk_size,
+                force=force,
+            )
+            recomputed += written
+            skipped += unchanged
+            if cursor is None or written + unchanged < chunk_size:
+                break
+        await session.commit()
+
+    except SQLAlchemyError as exc:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to recompute vendor scores.") from exc
+
+    if vendor_ids is None:
+        await ainvalidate_all_vendors()
+    else:
+        await ainvalidate_vendors(*vendor_ids)
+    if recomputed:
+        await session.run_sync(refresh_rollups_after_recompute)
+
+    return recompute_summary(recomputed, skipped, started)
+
+
+async def recompute_all_vendor_scores(session: AsyncSession, *, force: bool = False) -> int:
+    """Recalculate scores for all vendors; returns number of processed vendors."""
+
+    return (await bulk_recompute_vendor_scores(session, force=force)).processed_vendors
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from fastapi import HTTPException
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from src.models import VendorModel, VendorScoreModel
+from src.schema import VendorBatchGetResponse, VendorCreate, VendorListResponse, VendorUpdate
+from src.services.vendor_service import (
+    apply_vendor_update,
+    build_batch_get_response,
+    build_score_page_json,
+    build_vendor_page,
+    latest_score_stmt,
+    score_rows_stmt,
+    split_score_page_json,
+    vendor_scores_stmt,
+    vendors_by_ids_stmt,
+    vendors_stmt,
+)
+from src.utils.cache import ainvalidate_vendors, vendor_cache
+from src.utils.validate_vendor import ensure_vendor_exists_async
+
+
+async def create_vendor(session: AsyncSession, payload: VendorCreate) -> VendorModel:
+    """Create an entry for a new vendor and return it."""
+    try:
+        vendor = VendorModel(name=payload.name, category=payload.category.value)
+        session.add(vendor)
+        await session.commit()
+        await session.refresh(vendor)
+        return vendor
+
+    except IntegrityError as exc:
+        await session.rollback()
+        raise HTTPException(status_code=409, detail="Vendor already exists.") from exc
+
+    except SQLAlchemyError as exc:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to create vendor.") from exc
+
+
+async def update_vendor(session: AsyncSession, vendor: VendorModel, payload: VendorUpdate) -> VendorModel:
+    """Apply updates to an existing vendor."""
+    apply_vendor_update(vendor, payload)
+
+    try:
+        session.add(vendor)
+        await session.commit()
+        await ainvalidate_vendors(vendor.id)
+        await session.refresh(vendor)
+        return vendor
+
+    except SQLAlchemyError as exc:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to update vendor.") from exc
+
+
+async def get_vendor_latest_score(session: AsyncSession, vendor_id: UUID) -> Optional[VendorScoreModel]:
+    """Return the most recent score for a vendor."""
+    try:
+        return (await session.execute(latest_score_stmt(vendor_id))).scalars().first()
+
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=500, detail="Failed to fetch latest vendor score.") from exc
+
+
+async def list_vendors(
+    session: AsyncSession,
+    *,
+    limit: int = 50,
+    after: tuple[str, UUID] | None = None,
+    category: str | None = None,
+    name_prefix: str | None = None,
+    search: str | None = None,
+    min_score: float | None = None,
+    max_score: float | None = None,
+) -> VendorListResponse:
+    """Return one page of vendors with their latest scores in a single query."""
+    stmt = vendors_stmt(
+        limit=limit + 1,
+        after=after,
+        category=category,
+        name_prefix=name_prefix,
+        search=search,
+        min_score=min_score,
+        max_score=max_score,
+    )
+    try:
+        result = await session.execute(stmt)
+        vendors = list(result.scalars())
+
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=500, detail="Failed to list vendors.") from exc
+
+    return build_vendor_page(vendors, limit)
+
+
+async def batch_get_vendors(session: AsyncSession, vendor_ids: Sequence[UUID]) -> VendorBatchGetResponse:
+    """Resolve many vendors and their latest scores with a single query."""
+    try:
+        result = await session.execute(vendors_by_ids_stmt(vendor_ids))
+        vendors = result.scalars().all()
+
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=500, detail="Failed to fetch vendors.") from exc
+
+    return build_batch_get_response(vendor_ids, vendors)
+
+
+async def list_vendor_scores(
+    session: AsyncSession,
+    vendor_id: UUID,
+    *,
+    limit: int = 10,
+    offset: int = 0,
+    after: tuple[datetime, UUID] | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    scoring_version: str | None = None,
+    replayed: bool = False,
+) -> list[VendorScoreModel]:
+    """Return list of vendor score history."""
+    stmt = vendor_scores_stmt(
+        vendor_id,
+        limit=limit,
+        offset=offset,
+        after=after,
+        start=start,
+        end=end,
+        scoring_version=scoring_version,
+        replayed=replayed,
+    )
+    try:
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=500, detail="Failed to fetch vendor score history.") from exc
+
+
+async def get_vendor_score_page_json(
+    session: AsyncSession,
+    vendor_id: UUID,
+    *,
+    limit: int = 10,
+    offset: int = 0,
+    after: tuple[datetime, UUID] | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    scoring_version: str | None = None,
+    replayed: bool = False,
+) -> tuple[bytes, Optional[str]]:
+    """Return a page of score history as JSON bytes plus the next cursor; 404s for unknown vendors."""
+
+    async def load() -> bytes:
+        await ensure_vendor_exists_async(session, vendor_id)
+        stmt = score_rows_stmt(
+            vendor_id,
+            limit=limit + 1,
+            offset=offset,
+            after=after,
+            start=start,
+            end=end,
+            scoring_version=scoring_version,
+            replayed=replayed,
+        )
+        try:
+            rows = (await session.execute(stmt)).all()
+
+        except SQLAlchemyError as exc:
+            raise HTTPException(status_code=500, detail="Failed to fetch vendor score history.") from exc
+        return build_score_page_json(rows, limit)
+
+    page = await vendor_cache.aget_or_load_raw(
+        "score-page", vendor_id, load, limit, offset, after, start, end, scoring_version, replayed
+    )
+    return split_score_page_json(page)
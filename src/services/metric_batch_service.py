@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import Insert, Row, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from src.models import VendorMetricModel, VendorModel
+from src.schema import (
+    VendorMetricBatchItem,
+    VendorMetricBatchItemResult,
+    VendorMetricBatchResponse,
+    VendorMetricCreate,
+)
+from src.services.metric_service import MEASUREMENT_CONFLICT_DETAIL, METRIC_VALUE_FIELDS, same_measurement
+from src.services.score_aggregate_service import apply_metric_aggregates
+from src.services.scoring_service import recompute_vendor_scores_in_transaction
+from src.utils.cache import invalidate_vendors
+
+
+VENDOR_MISMATCH_DETAIL = "vendor_id does not match the vendor in the path"
+
+
+def _validation_detail(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+def metric_row(vendor_id: UUID, payload: VendorMetricCreate) -> dict[str, Any]:
+    """Build an insertable metric row, defaulting ``raw_payload`` like the single-metric endpoint."""
+    raw_payload = payload.raw_payload
+    if raw_payload is None:
+        raw_payload = payload.model_dump(mode="json", exclude={"raw_payload", "vendor_id"})
+
+    return {
+        "id": uuid.uuid4(),
+        "vendor_id": vendor_id,
+        "timestamp": payload.timestamp,
+        "on_time_delivery_rate": payload.on_time_delivery_rate,
+        "complaint_count": payload.complaint_count,
+        "missing_documents": payload.missing_documents,
+        "compliance_score": payload.compliance_score,
+        "raw_payload": raw_payload,
+    }
+
+
+def insert_metrics_stmt() -> Insert:
+    """executemany insert of metric rows skipping those already recorded; returns the ids inserted."""
+    return (
+        insert(VendorMetricModel)
+        .on_conflict_do_nothing(index_elements=[VendorMetricModel.vendor_id, VendorMetricModel.timestamp])
+        .returning(VendorMetricModel.id)
+    )
+
+
+def stored_metrics(session: Session, rows: list[dict[str, Any]]) -> dict[tuple[UUID, datetime], Row]:
+    """Id and measured values of the metrics already recorded at the ``(vendor_id, timestamp)`` of ``rows``."""
+    if not rows:
+        return {}
+    keys = {(row["vendor_id"], row["timestamp"]) for row in rows}
+    stored = session.execute(
+        select(
+            VendorMetricModel.vendor_id,
+            VendorMetricModel.timestamp,
+            VendorMetricModel.id,
+            *(getattr(VendorMetricModel, field) for field in METRIC_VALUE_FIELDS),
+        ).where(tuple_(VendorMetricModel.vendor_id, VendorMetricModel.timestamp).in_(keys))
+    )
+    return {(metric.vendor_id, metric.timestamp): metric for metric in stored}
+
+
+def create_metrics_batch(
+    session: Session,
+    items: list[dict[str, Any]],
+    *,
+    vendor_id: UUID | None = None,
+) -> VendorMetricBatchResponse:
+    """Validate, insert and score a batch of metrics in one transaction.
+
+    Items are validated individually; vendors are checked with one query, all
+    accepted rows go out in a single executemany insert and each affected
+    vendor is rescored once. Items a vendor already has a metric for at that
+    timestamp are reported as duplicates with the stored metric's id and not
+    written again, or rejected when their values differ from it. When
+    ``vendor_id`` is given every item belongs to that vendor; an item that
+    names a different ``vendor_id`` is rejected rather than redirected.
+    """
+
+    results: list[VendorMetricBatchItemResult] = []
+    accepted: list[tuple[int, UUID, VendorMetricCreate]] = []
+
+    for index, item in enumerate(items):
+        try:
+            if vendor_id is None:
+                payload = VendorMetricBatchItem.model_validate(item)
+                accepted.append((index, payload.vendor_id, payload))
+            elif "vendor_id" in item:
+                payload = VendorMetricBatchItem.model_validate(item)
+                if payload.vendor_id != vendor_id:
+                    results.append(
+                        VendorMetricBatchItemResult(
+                            index=index, status="rejected", vendor_id=payload.vendor_id, detail=VENDOR_MISMATCH_DETAIL
+                        )
+                    )
+                    continue
+                accepted.append((index, vendor_id, payload))
+            else:
+                accepted.append((index, vendor_id, VendorMetricCreate.model_validate(item)))
+        except ValidationError as exc:
+            results.append(
+                VendorMetricBatchItemResult(index=index, status="rejected", detail=_validation_detail(exc))
+            )
+
+    requested_vendor_ids = {item_vendor_id for _, item_vendor_id, _ in accepted}
+
+    try:
+        known_vendor_ids = set()
+        if requested_vendor_ids:
+            known_vendor_ids = set(
+                session.execute(
+                    select(VendorModel.id).where(VendorModel.id.in_(requested_vendor_ids))
+                ).scalars()
+            )
+
+        candidates: list[tuple[int, dict[str, Any]]] = []
+        for index, item_vendor_id, payload in accepted:
+            if item_vendor_id not in known_vendor_ids:
+                results.append(
+                    VendorMetricBatchItemResult(
+                        index=index, status="rejected", vendor_id=item_vendor_id, detail="Vendor not found"
+                    )
+                )
+                continue
+            candidates.append((index, metric_row(item_vendor_id, payload)))
+
+        rows: list[dict[str, Any]] = []
+        rescored = 0
+        if candidates:
+            inserted_ids = set(
+                session.execute(insert_metrics_stmt(), [row for _, row in candidates]).scalars()
+            )
+            rows = [row for _, row in candidates if row["id"] in inserted_ids]
+            stored = stored_metrics(session, [row for _, row in candidates if row["id"] not in inserted_ids])
+            for index, row in candidates:
+                detail = None
+                if row["id"] in inserted_ids:
+                    status, metric_id = "created", row["id"]
+                else:
+                    # stored earlier, or by an item before this one in the same batch
+                    metric = stored[(row["vendor_id"], row["timestamp"])]
+                    metric_id = metric.id
+                    if same_measurement(metric, row):
+                        status = "duplicate"
+                    else:
+                        status, detail = "rejected", MEASUREMENT_CONFLICT_DETAIL
+                results.append(
+                    VendorMetricBatchItemResult(
+                        index=index, status=status, vendor_id=row["vendor_id"], metric_id=metric_id, detail=detail
+                    )
+                )
+
+        if rows:
+            apply_metric_aggregates(session, rows)
+            rescored, _ = recompute_vendor_scores_in_transaction(
+                session,
+                calculated_at=datetime.now(timezone.utc),
+                vendor_ids={row["vendor_id"] for row in rows},
+            )
+        session.commit()
+
+    except IntegrityError as exc:
+        session.rollback()
+        raise HTTPException(status_code=400, detail="Invalid vendor metric batch.") from exc
+
+    except SQLAlchemyError as exc:
+        session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to record vendor metric batch.") from exc
+
+    invalidate_vendors(*{row["vendor_id"] for row in rows})
+
+    results.sort(key=lambda result: result.index)
+    return VendorMetricBatchResponse(
+        created=len(rows),
+        duplicates=sum(result.status == "duplicate" for result in results),
+        rejected=sum(result.status == "rejected" for result in results),
+        rescored_vendors=rescored,
+        items=results,
+    )
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import csv
+import json
+from collections.abc import Callable, Iterable
+from typing import Any, Literal
+from uuid import UUID
+
+import psycopg
+from fastapi import HTTPException
+from psycopg.types.json import Json
+from pydantic import ValidationError
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.models import VendorModel
+from src.schema import MetricImportRejection, MetricImportSummary, VendorMetricBatchItem
+from src.services.metric_batch_service import metric_row, stored_metrics
+from src.services.metric_service import MEASUREMENT_CONFLICT_DETAIL, same_measurement
+from src.services.score_aggregate_service import AGGREGATE_SUM_COLUMNS, apply_metric_aggregates
+
+ImportFormat = Literal["ndjson", "csv"]
+
+# Rows buffered before a COPY round trip; bounds importer memory.
+IMPORT_FLUSH_ROWS = 5_000
+# Known vendor ids cached between flushes before the cache is reset.
+IMPORT_VENDOR_CACHE_SIZE = 100_000
+# Rejections kept verbatim in the summary; the count keeps growing past it.
+IMPORT_MAX_REPORTED_ERRORS = 100
+
+COPY_COLUMNS = (
+    "id",
+    "vendor_id",
+    "timestamp",
+    "on_time_delivery_rate",
+    "complaint_count",
+    "missing_documents",
+    "compliance_score",
+    "raw_payload",
+)
+# COPY cannot skip conflicting rows, so each flush is copied into a per-connection
+# staging table and merged from there, skipping metrics that are already recorded.
+STAGE_TABLE = "vendor_metrics_import"
+CREATE_STAGE_STATEMENT = text(
+    f"CREATE TEMPORARY TABLE IF NOT EXISTS {STAGE_TABLE} (LIKE vendor_metrics) ON COMMIT DELETE ROWS"
+)
+COPY_STATEMENT = f"COPY {STAGE_TABLE} ({', '.join(COPY_COLUMNS)}) FROM STDIN"
+MERGE_STAGE_STATEMENT = text(
+    f"INSERT INTO vendor_metrics ({', '.join(COPY_COLUMNS)}) "
+    f"SELECT {', '.join(COPY_COLUMNS)} FROM {STAGE_TABLE} "
+    'ON CONFLICT (vendor_id, "timestamp") DO NOTHING '
+    f"RETURNING id, vendor_id, \"timestamp\", {', '.join(AGGREGATE_SUM_COLUMNS.values())}"
+)
+
+
+class MetricImporter:
+    """Incremental NDJSON/CSV parser that loads ``vendor_metrics`` through ``COPY``.
+
+    Lines are pushed with ``feed_line``; validated rows are buffered up to
+    ``flush_rows`` and written (and committed) by ``flush``, so memory stays
+    bounded regardless of the size of the stream.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        fmt: ImportFormat,
+        *,
+        flush_rows: int = IMPORT_FLUSH_ROWS,
+        on_progress: Callable[[MetricImportSummary], None] | None = None,
+    ) -> None:
+        self.session = session
+        self.fmt = fmt
+        self.flush_rows = flush_rows
+        self.on_progress = on_progress
+        self.summary = MetricImportSummary()
+        self._csv_header: list[str] | None = None
+        # Lines of a CSV record whose quoted field continues on the next line.
+        self._csv_partial: str | None = None
+        self._csv_record_line = 0
+        self._pending: list[tuple[int, dict[str, Any]]] = []
+        self._known_vendor_ids: set[UUID] = set()
+
+    def _reject(self, line_number: int, detail: str) -> None:
+        self.summary.rejected += 1
+        if len(self.summary.errors) < IMPORT_MAX_REPORTED_ERRORS:
+            self.summary.errors.append(MetricImportRejection(line=line_number, detail=detail))
+
+    def _parse(self, line: str) -> dict[str, Any] | None:
+        if self.fmt == "ndjson":
+            item = json.loads(line)
+            if not isinstance(item, dict):
+                raise ValueError("expected a JSON object")
+            return item
+
+        values = next(csv.reader([line]))
+        if self._csv_header is None:
+            self._csv_header = [value.strip() for value in values]
+            return None
+        if len(values) != len(self._csv_header):
+            raise ValueError(f"expected {len(self._csv_header)} columns, got {len(values)}")
+        return dict(zip(self._csv_header, values))
+
+    def _csv_record(self, line: str) -> str | None:
+        """Join physical lines into one CSV record; None while a quoted field is still open.
+
+        A record is complete once it holds an even number of quote characters
+        (escaped quotes come in pairs), so a quoted field may span lines even
+        when they arrive in separate ``feed_line`` calls.
+        """
+
+        line = line.rstrip("\r\n")
+        if self._csv_partial is None:
+            self._csv_record_line = self.summary.lines_read
+        else:
+            line = f"{self._csv_partial}\n{line}"
+        if line.count('"') % 2:
+            self._csv_partial = line
+            return None
+        self._csv_partial = None
+        return line
+
+    def feed_line(self, line: str) -> bool:
+        """Parse and validate one line; returns True once ``flush`` should be called."""
+
+        self.summary.lines_read += 1
+        line_number = self.summary.lines_read
+        if self.fmt == "csv":
+            line = self._csv_record(line)
+            if line is None:
+                return False
+            # errors are reported against the record's first line
+            line_number = self._csv_record_line
+        line = line.strip()
+        if not line:
+            return False
+
+        try:
+            item = self._parse(line)
+            if item is None:
+                return False
+            payload = VendorMetricBatchItem.model_validate(item)
+
+        except ValidationError as exc:
+            self._reject(line_number, "; ".join(error["msg"] for error in exc.errors()))
+            return False
+
+        except ValueError as exc:
+            self._reject(line_number, str(exc))
+            return False
+
+        self._pending.append((line_number, metric_row(payload.vendor_id, payload)))
+        return len(self._pending) >= self.flush_rows
+
+    def feed_lines(self, lines: Iterable[str]) -> None:
+        """Feed several lines, flushing whenever the buffer fills."""
+
+        for line in lines:
+            if self.feed_line(line):
+                self.flush()
+
+    def _filter_unknown_vendors(self, rows: list[tuple[int, dict[str, Any]]]) -> list[tuple[int, dict[str, Any]]]:
+        unknown = {row["vendor_id"] for _, row in rows} - self._known_vendor_ids
+        if unknown:
+            found = set(
+                self.session.execute(select(VendorModel.id).where(VendorModel.id.in_(unknown))).scalars()
+            )
+            if len(self._known_vendor_ids) + len(found) > IMPORT_VENDOR_CACHE_SIZE:
+                self._known_vendor_ids.clear()
+            self._known_vendor_ids |= found
+
+        accepted = []
+        for line_number, row in rows:
+            if row["vendor_id"] in self._known_vendor_ids:
+                accepted.append((line_number, row))
+            else:
+                self._reject(line_number, "Vendor not found")
+        return accepted
+
+    def flush(self) -> None:
+        """COPY the buffered rows, merge the new ones into the decayed aggregates and commit.
+
+        Rows whose vendor already has a metric at that timestamp, in the table
+        or earlier in the same flush, are skipped: counted as duplicates when
+        they repeat its values and rejected when they differ from them.
+        """
+
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        try:
+            accepted = self._filter_unknown_vendors(pending)
+            rows = [row for _, row in accepted]
+            inserted = []
+            conflicts = []
+            if rows:
+                self.session.execute(CREATE_STAGE_STATEMENT)
+                raw_connection = self.session.connection().connection.driver_connection
+                with raw_connection.cursor() as cursor, cursor.copy(COPY_STATEMENT) as copy:
+                    for row in rows:
+                        copy.write_row(
+                            [Json(row[column]) if column == "raw_payload" else row[column] for column in COPY_COLUMNS]
+                        )
+                inserted = self.session.execute(MERGE_STAGE_STATEMENT).mappings().all()
+                apply_metric_aggregates(self.session, inserted)
+                inserted_ids = {metric["id"] for metric in inserted}
+                skipped = [(line_number, row) for line_number, row in accepted if row["id"] not in inserted_ids]
+                stored = stored_metrics(self.session, [row for _, row in skipped])
+                conflicts = [
+                    line_number
+                    for line_number, row in skipped
+                    if not same_measurement(stored[(row["vendor_id"], row["timestamp"])], row)
+                ]
+            self.session.commit()
+
+        except (SQLAlchemyError, psycopg.Error) as exc:
+            self.session.rollback()
+            raise HTTPException(status_code=500, detail="Failed to import vendor metrics.") from exc
+
+        for line_number in conflicts:
+            self._reject(line_number, MEASUREMENT_CONFLICT_DETAIL)
+        self.summary.imported += len(inserted)
+        self.summary.duplicates += len(rows) - len(inserted) - len(conflicts)
+        if self.on_progress is not None:
+            self.on_progress(self.summary)
+
+    def finish(self) -> MetricImportSummary:
+        """Flush the remaining rows and return the final summary."""
+
+        if self._csv_partial is not None:
+            self._csv_partial = None
+            self._reject(self._csv_record_line, "unterminated quoted field")
+        self.flush()
+        return self.summary
+
+
+def import_metric_lines(
+    session: Session,
+    lines: Iterable[str],
+    fmt: ImportFormat,
+    *,
+    flush_rows: int = IMPORT_FLUSH_ROWS,
+    on_progress: Callable[[MetricImportSummary], None] | None = None,
+) -> MetricImportSummary:
+    """Stream ``lines`` into ``vendor_metrics`` with bounded memory."""
+
+    importer = MetricImporter(session, fmt, flush_rows=flush_rows, on_progress=on_progress)
+    importer.feed_lines(lines)
+    return importer.finish()
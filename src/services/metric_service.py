@@ -1,15 +1,112 @@
 from __future__ import annotations
 
+import uuid
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import Insert, Select, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from src.models import VendorMetricModel, VendorModel
 from src.schema import VendorMetricCreate
+from src.services.score_aggregate_service import apply_metric_aggregates, metric_aggregate_row
+from src.utils.cache import invalidate_vendors
+
+
+# The measured values; a resubmission must repeat them to count as a retry.
+METRIC_VALUE_FIELDS = ("on_time_delivery_rate", "complaint_count", "missing_documents", "compliance_score")
+
+
+def metric_values(
+	vendor: VendorModel,
+	payload: VendorMetricCreate,
+	*,
+	raw_payload: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+	"""Column values of a metric row from a submission."""
+
+	return {
+		"id": uuid.uuid4(),
+		"vendor_id": vendor.id,
+		"timestamp": payload.timestamp,
+		"on_time_delivery_rate": payload.on_time_delivery_rate,
+		"complaint_count": payload.complaint_count,
+		"missing_documents": payload.missing_documents,
+		"compliance_score": payload.compliance_score,
+		"raw_payload": raw_payload,
+	}
+
+
+def build_metric(
+	vendor: VendorModel,
+	payload: VendorMetricCreate,
+	*,
+	raw_payload: dict[str, Any] | None = None,
+) -> VendorMetricModel:
+	"""Build an unsaved metric row from a submission."""
+
+	return VendorMetricModel(**metric_values(vendor, payload, raw_payload=raw_payload))
+
+
+def insert_metric_stmt(values: dict[str, Any]) -> Insert:
+	"""Insert a metric unless its vendor already has one at that timestamp; returns the new row only.
+
+	The conflict is resolved on ``ix_vendor_metrics_vendor_id_timestamp``, so a
+	resubmission costs one index probe and writes nothing.
+	"""
+
+	return (
+		insert(VendorMetricModel)
+		.values(values)
+		.on_conflict_do_nothing(index_elements=[VendorMetricModel.vendor_id, VendorMetricModel.timestamp])
+		.returning(VendorMetricModel)
+	)
+
+
+def metric_at_stmt(vendor_id: UUID, timestamp: datetime) -> Select:
+	"""Select a vendor's metric at exactly ``timestamp``, by its natural key."""
+
+	return select(VendorMetricModel).where(
+		VendorMetricModel.vendor_id == vendor_id, VendorMetricModel.timestamp == timestamp
+	)
+
+
+# Why a resubmission with other values than the stored metric is refused.
+MEASUREMENT_CONFLICT_DETAIL = "A metric with different values is already recorded for this vendor and timestamp."
+
+
+def same_measurement(metric: Any, values: dict[str, Any]) -> bool:
+	"""Whether ``values`` repeat the measured values of ``metric`` (a model or a row)."""
+
+	return all(getattr(metric, field) == values[field] for field in METRIC_VALUE_FIELDS)
+
+
+def ensure_same_measurement(metric: VendorMetricModel, values: dict[str, Any]) -> None:
+	"""Refuse a resubmission whose values differ from the metric already stored for its timestamp."""
+
+	if not same_measurement(metric, values):
+		raise HTTPException(status_code=409, detail=MEASUREMENT_CONFLICT_DETAIL)
+
+
+def metric_is_scored(vendor: VendorModel, metric: VendorMetricModel) -> bool:
+	"""Whether the vendor's current score already accounts for ``metric`` or a newer one."""
+
+	return vendor.last_scored_metric_at is not None and vendor.last_scored_metric_at >= metric.timestamp
+
+
+def latest_metric_stmt(vendor_id: UUID) -> Select:
+	"""Select the newest metric for a vendor by timestamp."""
+
+	return (
+		select(VendorMetricModel)
+		.where(VendorMetricModel.vendor_id == vendor_id)
+		.order_by(VendorMetricModel.timestamp.desc())
+		.limit(1)
+	)
 
 
 def create_metric(
@@ -18,24 +115,29 @@ def create_metric(
 	payload: VendorMetricCreate,
 	*,
 	raw_payload: dict[str, Any] | None = None,      # Can be passed only as Keyword Argument
-) -> VendorMetricModel:
-	"""Insert a vendor metric submission."""
-
-	metric = VendorMetricModel(
-		vendor_id=vendor.id,
-		timestamp=payload.timestamp,
-		on_time_delivery_rate=payload.on_time_delivery_rate,
-		complaint_count=payload.complaint_count,
-		missing_documents=payload.missing_documents,
-		compliance_score=payload.compliance_score,
-		raw_payload=raw_payload,
-	)
+) -> tuple[VendorMetricModel, bool]:
+	"""Insert a vendor metric submission and fold it into the vendor's decayed aggregate.
+
+	A vendor has at most one metric per timestamp. Resubmitting one returns the
+	stored row and False without writing anything, so a retried request is
+	harmless; a resubmission with different values is a 409.
+	"""
+
+	values = metric_values(vendor, payload, raw_payload=raw_payload)
 
 	try:
-		session.add(metric)
+		metric = session.execute(insert_metric_stmt(values)).scalars().first()
+		if metric is None:
+			metric = session.execute(metric_at_stmt(vendor.id, payload.timestamp)).scalar_one()
+			# nothing was written, so there is nothing to commit
+			ensure_same_measurement(metric, values)
+			return metric, False
+
+		apply_metric_aggregates(session, [metric_aggregate_row(metric)])
 		session.commit()
+		invalidate_vendors(vendor.id)
 		session.refresh(metric)
-		return metric
+		return metric, True
 
 	except IntegrityError as exc:
 		session.rollback()
@@ -49,15 +151,8 @@ def create_metric(
 def get_latest_metric(session: Session, vendor_id: UUID) -> VendorMetricModel | None:
 	"""Return the newest metric for a vendor by timestamp."""
 
-	stmt = (
-		select(VendorMetricModel)
-		.where(VendorMetricModel.vendor_id == vendor_id)
-		.order_by(VendorMetricModel.timestamp.desc())
-		.limit(1)
-	)
-
 	try:
-		return session.execute(stmt).scalars().first()
+		return session.execute(latest_metric_stmt(vendor_id)).scalars().first()
 
 	except SQLAlchemyError as exc:
 		raise HTTPException(status_code=500, detail="Failed to fetch latest vendor metric.") from exc
\ No newline at end of file
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from uuid import UUID
+
+from fastapi import HTTPException
+
+from src.schema import VendorScoreRecomputeSummary
+from src.services.recompute_job_service import lower_bound_cursor, uuid_shard_bounds
+from src.services.score_rollup_service import refresh_rollups_after_recompute
+from src.services.scoring_service import (
+    BULK_RECOMPUTE_CHUNK_SIZE,
+    prepare_scoring_inputs,
+    recompute_score_chunk,
+    recompute_summary,
+)
+from src.utils.cache import invalidate_all_vendors
+
+
+def recompute_vendor_range(
+    lower_bound: UUID,
+    upper_bound: UUID | None,
+    *,
+    force: bool = False,
+    chunk_size: int = BULK_RECOMPUTE_CHUNK_SIZE,
+) -> tuple[int, int]:
+    """Recompute the vendors in ``[lower_bound, upper_bound)`` in one transaction; returns ``(recomputed, skipped)``.
+
+    Runs inside a pool worker: the spawned process imports its own engine, so
+    no connection is shared with the parent or other shards.
+    """
+
+    from src.database.databases import SessionLocal
+
+    calculated_at = datetime.now(timezone.utc)
+    recomputed = skipped = 0
+    cursor = lower_bound_cursor(lower_bound)
+    with SessionLocal() as session:
+        prepare_scoring_inputs(session, after=cursor, before=upper_bound)
+        while True:
+            written, unchanged, cursor = recompute_score_chunk(
+                session,
+                calculated_at=calculated_at,
+                after=cursor,
+                before=upper_bound,
+                limit=chunk_size,
+                force=force,
+            )
+            recomputed += written
+            skipped += unchanged
+            if cursor is None or written + unchanged < chunk_size:
+                break
+        session.commit()
+    return recomputed, skipped
+
+
+def parallel_recompute_vendor_scores(
+    *,
+    parallelism: int,
+    force: bool = False,
+    chunk_size: int = BULK_RECOMPUTE_CHUNK_SIZE,
+) -> VendorScoreRecomputeSummary:
+    """Recompute every vendor with one UUID range per worker process and merge the counts.
+
+    Each shard commits on its own, so a failed shard leaves the others'
+    snapshots in place; rerunning is safe because unchanged vendors are skipped.
+    """
+
+    started = time.perf_counter()
+    bounds = uuid_shard_bounds(parallelism)
+
+    # spawn: workers must not inherit the parent's pooled connections or threads.
+    with ProcessPoolExecutor(max_workers=parallelism, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = [
+            pool.submit(recompute_vendor_range, lower, upper, force=force, chunk_size=chunk_size)
+            for lower, upper in bounds
+        ]
+        try:
+            counts = [future.result() for future in futures]
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail="Failed to recompute vendor scores.") from exc
+        finally:
+            invalidate_all_vendors()
+
+    recomputed = sum(r for r, _ in counts)
+    if recomputed:
+        from src.database.databases import SessionLocal
+
+        with SessionLocal() as session:
+            refresh_rollups_after_recompute(session)
+    return recompute_summary(recomputed, sum(s for _, s in counts), started)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import os
+import re
+from datetime import datetime, timezone
+
+import psycopg
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.schema import PartitionMaintenanceSummary
+from src.utils.validate_db_url import PartitionSettings, get_partition_settings
+
+# Range-partitioned tables and their partition key column.
+PARTITIONED_TABLES = {
+    "vendor_metrics": "timestamp",
+    "vendor_scores": "calculated_at",
+}
+
+# pg_advisory_xact_lock key serialising maintenance across workers.
+PARTITION_MAINTENANCE_LOCK_KEY = 7_310_001
+
+
+def month_floor(value: datetime) -> datetime:
+    """First instant (UTC) of the month containing ``value``."""
+
+    return value.astimezone(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def list_month_partitions(session: Session, table: str) -> dict[datetime, str]:
+    """Attached monthly partitions of ``table`` keyed by the month they cover."""
+
+    names = session.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:parent AS regclass)"
+        ),
+        {"parent": table},
+    ).scalars()
+
+    pattern = re.compile(rf"^{table}_p(\d{{4}})_(\d{{2}})$")
+    partitions = {}
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            partitions[datetime(int(match[1]), int(match[2]), 1, tzinfo=timezone.utc)] = name
+    return partitions
+
+
+def create_month_partition(session: Session, table: str, month: datetime) -> str:
+    """Create and attach the partition for ``month``, moving matching rows out of the default partition."""
+
+    column = PARTITIONED_TABLES[table]
+    name = partition_name(table, month)
+    bounds = {"lower": month, "upper": add_months(month, 1)}
+
+    session.execute(text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    session.execute(
+        text(
+            f'WITH moved AS (DELETE FROM {table}_default WHERE "{column}" >= :lower AND "{column}" < :upper '
+            f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+        ),
+        bounds,
+    )
+    session.execute(
+        text(
+            f"ALTER TABLE {table} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{bounds['lower'].isoformat()}') TO ('{bounds['upper'].isoformat()}')"
+        )
+    )
+    return name
+
+
+def ensure_partitions(session: Session, *, now: datetime, months_ahead: int) -> list[str]:
+    """Create partitions for the coming months and for any month that landed in a default partition."""
+
+    created = []
+    current = month_floor(now)
+    for table, column in PARTITIONED_TABLES.items():
+        existing = list_month_partitions(session, table)
+        wanted = {add_months(current, offset) for offset in range(months_ahead + 1)}
+        wanted |= {
+            month_floor(month)
+            for month in session.execute(
+                text(f"SELECT DISTINCT date_trunc('month', \"{column}\", 'UTC') FROM {table}_default")
+            ).scalars()
+        }
+        for month in sorted(wanted - existing.keys()):
+            created.append(create_month_partition(session, table, month))
+    return created
+
+
+def _archive_partition(session: Session, name: str, archive_dir: str) -> None:
+    os.makedirs(archive_dir, exist_ok=True)
+    raw_connection = session.connection().connection.driver_connection
+    with open(os.path.join(archive_dir, f"{name}.csv"), "wb") as archive:
+        with raw_connection.cursor() as cursor, cursor.copy(f"COPY {name} TO STDOUT WITH (FORMAT csv, HEADER)") as copy:
+            for data in copy:
+                archive.write(data)
+
+
+def expire_partitions(
+    session: Session, *, now: datetime, settings: PartitionSettings, summary: PartitionMaintenanceSummary
+) -> None:
+    """Detach and drop (optionally archiving first) partitions older than the retention window."""
+
+    retention = {
+        "vendor_metrics": settings.metrics_retention_months,
+        "vendor_scores": settings.scores_retention_months,
+    }
+    for table, months in retention.items():
+        if months is None:
+            continue
+        cutoff = add_months(month_floor(now), -months)
+        for month, name in sorted(list_month_partitions(session, table).items()):
+            if add_months(month, 1) > cutoff:
+                break
+            if settings.archive_dir:
+                _archive_partition(session, name, settings.archive_dir)
+                summary.archived.append(name)
+            session.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+            session.execute(text(f"DROP TABLE {name}"))
+            summary.dropped.append(name)
+
+
+def run_partition_maintenance(
+    session: Session,
+    *,
+    now: datetime | None = None,
+    settings: PartitionSettings | None = None,
+    apply_retention: bool = True,
+) -> PartitionMaintenanceSummary:
+    """Create upcoming partitions and enforce retention in one transaction, one worker at a time."""
+
+    now = now or datetime.now(timezone.utc)
+    settings = settings or get_partition_settings()
+    summary = PartitionMaintenanceSummary()
+
+    try:
+        session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_MAINTENANCE_LOCK_KEY})
+        summary.created = ensure_partitions(session, now=now, months_ahead=settings.months_ahead)
+        if apply_retention:
+            expire_partitions(session, now=now, settings=settings, summary=summary)
+        session.commit()
+
+    except (SQLAlchemyError, psycopg.Error, OSError) as exc:
+        session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to maintain partitions.") from exc
+
+    return summary
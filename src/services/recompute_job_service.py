@@ -0,0 +1,408 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.models import RecomputeJobModel, RecomputeJobShardModel
+from src.schema import RecomputeJobResponse, RecomputeJobShardResponse
+from src.services.score_rollup_service import refresh_rollups_after_recompute
+from src.services.scoring_service import BULK_RECOMPUTE_CHUNK_SIZE, prepare_scoring_inputs, recompute_score_chunk
+from src.utils.cache import invalidate_all_vendors
+from src.utils.validate_db_url import get_job_settings
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("succeeded", "failed", "cancelled")
+
+_UUID_SPACE = 1 << 128
+
+
+def uuid_shard_bounds(shards: int) -> list[tuple[UUID, UUID | None]]:
+    """Split the UUID space into ``shards`` equal ``[lower, upper)`` ranges; the last is unbounded."""
+
+    edges = [UUID(int=index * _UUID_SPACE // shards) for index in range(shards)]
+    return [(lower, edges[index + 1] if index + 1 < shards else None) for index, lower in enumerate(edges)]
+
+
+def lower_bound_cursor(lower_bound: UUID) -> UUID | None:
+    """Exclusive keyset cursor equivalent to an inclusive ``lower_bound``."""
+
+    if lower_bound.int == 0:
+        return None
+    return UUID(int=lower_bound.int - 1)
+
+
+def shard_cursor(shard: RecomputeJobShardModel) -> UUID | None:
+    """Exclusive keyset cursor the shard resumes from."""
+
+    if shard.checkpoint is not None:
+        return shard.checkpoint
+    return lower_bound_cursor(shard.lower_bound)
+
+
+def create_recompute_job(session: Session, *, force: bool = False, shards: int | None = None) -> RecomputeJobModel:
+    """Persist a queued job and its shards; executing them is up to ``submit_shards``."""
+
+    shards = shards or get_job_settings().default_shards
+    job = RecomputeJobModel(force=force, shard_count=shards, status="queued", cancel_requested=False)
+
+    try:
+        session.add(job)
+        session.flush()
+        session.add_all(
+            RecomputeJobShardModel(
+                job_id=job.id,
+                shard_index=index,
+                lower_bound=lower,
+                upper_bound=upper,
+                status="queued",
+                recomputed_vendors=0,
+                skipped_vendors=0,
+                busy_seconds=0.0,
+            )
+            for index, (lower, upper) in enumerate(uuid_shard_bounds(shards))
+        )
+        session.commit()
+        session.refresh(job)
+        return job
+
+    except SQLAlchemyError as exc:
+        session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to create recompute job.") from exc
+
+
+def load_job(session: Session, job_id: UUID) -> RecomputeJobModel:
+    job = session.get(RecomputeJobModel, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+def job_shard_ids(session: Session, job_id: UUID) -> list[UUID]:
+    return list(
+        session.execute(
+            select(RecomputeJobShardModel.id)
+            .where(RecomputeJobShardModel.job_id == job_id)
+            .where(RecomputeJobShardModel.status == "queued")
+            .order_by(RecomputeJobShardModel.shard_index)
+        ).scalars()
+    )
+
+
+def claim_shard(session: Session, shard_id: UUID, *, stale_after: float) -> UUID | None:
+    """Take ownership of a queued (or abandoned running) shard; returns the claim token."""
+
+    now = datetime.now(timezone.utc)
+    token = uuid.uuid4()
+    shards = RecomputeJobShardModel.__table__
+    claimed = session.execute(
+        update(shards)
+        .where(shards.c.id == shard_id)
+        .where(
+            or_(
+                shards.c.status == "queued",
+                (shards.c.status == "running") & (shards.c.heartbeat_at < now - timedelta(seconds=stale_after)),
+            )
+        )
+        .values(status="running", claim_token=token, started_at=now, heartbeat_at=now, error=None)
+        .returning(shards.c.job_id)
+    ).scalar_one_or_none()
+    if claimed is None:
+        session.rollback()
+        return None
+
+    jobs = RecomputeJobModel.__table__
+    session.execute(
+        update(jobs)
+        .where(jobs.c.id == claimed)
+        .where(jobs.c.status == "queued")
+        .values(status="running", started_at=now)
+    )
+    session.commit()
+    return token
+
+
+def _finish_shard(session: Session, shard_id: UUID, token: UUID, status: str, error: str | None = None) -> None:
+    shards = RecomputeJobShardModel.__table__
+    session.execute(
+        update(shards)
+        .where(shards.c.id == shard_id)
+        .where(shards.c.claim_token == token)
+        .values(status=status, error=error, finished_at=datetime.now(timezone.utc))
+    )
+    session.commit()
+
+
+def refresh_job_status(session: Session, job_id: UUID) -> None:
+    """Derive the job status from its shards once none of them is pending."""
+
+    job = session.execute(
+        select(RecomputeJobModel).where(RecomputeJobModel.id == job_id).with_for_update()
+    ).scalar_one()
+    statuses = set(
+        session.execute(
+            select(RecomputeJobShardModel.status).where(RecomputeJobShardModel.job_id == job_id)
+        ).scalars()
+    )
+
+    if statuses & {"queued", "running"}:
+        session.commit()
+        return
+
+    if "failed" in statuses:
+        job.status = "failed"
+    elif "cancelled" in statuses:
+        job.status = "cancelled"
+    else:
+        job.status = "succeeded"
+    job.finished_at = datetime.now(timezone.utc)
+    session.commit()
+
+
+def run_recompute_shard(session: Session, shard_id: UUID, *, chunk_size: int = BULK_RECOMPUTE_CHUNK_SIZE) -> int:
+    """Process one shard chunk by chunk, committing each chunk with its checkpoint; returns the vendors rescored.
+
+    Snapshot inserts and the checkpoint advance share a transaction, so a
+    crash loses at most the chunk in flight and a resume never writes a chunk
+    twice. Cancellation is checked between chunks. Cached vendor reads are
+    left to the caller: a worker process can only invalidate its own memory cache.
+    """
+
+    token = claim_shard(session, shard_id, stale_after=get_job_settings().stale_after_seconds)
+    if token is None:
+        return 0
+
+    shard = session.get(RecomputeJobShardModel, shard_id)
+    job = session.get(RecomputeJobModel, shard.job_id)
+    shards = RecomputeJobShardModel.__table__
+    cursor = shard_cursor(shard)
+    recomputed = 0
+
+    try:
+        prepare_scoring_inputs(session, after=cursor, before=shard.upper_bound)
+        session.commit()
+
+        while True:
+            session.refresh(job, ["cancel_requested"])
+            if job.cancel_requested:
+                _finish_shard(session, shard_id, token, "cancelled")
+                break
+
+            started = time.perf_counter()
+            written, unchanged, last_vendor_id = recompute_score_chunk(
+                session,
+                calculated_at=datetime.now(timezone.utc),
+                after=cursor,
+                before=shard.upper_bound,
+                limit=chunk_size,
+                force=job.force,
+            )
+            advanced = session.execute(
+                update(shards)
+                .where(shards.c.id == shard_id)
+                .where(shards.c.claim_token == token)
+                .values(
+                    checkpoint=last_vendor_id if last_vendor_id is not None else shards.c.checkpoint,
+                    recomputed_vendors=shards.c.recomputed_vendors + written,
+                    skipped_vendors=shards.c.skipped_vendors + unchanged,
+                    busy_seconds=shards.c.busy_seconds + (time.perf_counter() - started),
+                    heartbeat_at=datetime.now(timezone.utc),
+                )
+            ).rowcount
+            if not advanced:
+                # Another worker resumed this shard; its run owns the remaining chunks.
+                session.rollback()
+                return recomputed
+            session.commit()
+            recomputed += written
+
+            if last_vendor_id is None or written + unchanged < chunk_size:
+                _finish_shard(session, shard_id, token, "succeeded")
+                break
+            cursor = last_vendor_id
+
+    except Exception as exc:
+        session.rollback()
+        logger.exception("Recompute shard %s failed", shard_id)
+        _finish_shard(session, shard_id, token, "failed", error=f"{type(exc).__name__}: {exc}")
+
+    if recomputed:
+        refresh_rollups_after_recompute(session)
+    refresh_job_status(session, shard.job_id)
+    return recomputed
+
+
+def request_job_cancel(session: Session, job_id: UUID) -> RecomputeJobModel:
+    """Flag a job for cancellation; running shards stop after their current chunk."""
+
+    job = load_job(session, job_id)
+    if job.status in TERMINAL_STATUSES:
+        raise HTTPException(status_code=409, detail=f"Job already {job.status}")
+
+    try:
+        job.cancel_requested = True
+        session.execute(
+            update(RecomputeJobShardModel)
+            .where(RecomputeJobShardModel.job_id == job_id)
+            .where(RecomputeJobShardModel.status == "queued")
+            .values(status="cancelled", finished_at=datetime.now(timezone.utc))
+        )
+        session.commit()
+        refresh_job_status(session, job_id)
+        session.refresh(job)
+        return job
+
+    except SQLAlchemyError as exc:
+        session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to cancel recompute job.") from exc
+
+
+def resume_job(session: Session, job_id: UUID) -> list[UUID]:
+    """Requeue every unfinished shard of a job from its checkpoint; returns the shard ids to submit.
+
+    Shards still marked running are taken over too (their claim is revoked),
+    so this also recovers a job whose worker crashed.
+    """
+
+    job = load_job(session, job_id)
+    if job.status == "succeeded":
+        raise HTTPException(status_code=409, detail="Job already succeeded")
+
+    try:
+        session.execute(
+            update(RecomputeJobShardModel)
+            .where(RecomputeJobShardModel.job_id == job_id)
+            .where(RecomputeJobShardModel.status != "succeeded")
+            .values(status="queued", claim_token=None, error=None, finished_at=None)
+        )
+        job.status = "queued"
+        job.cancel_requested = False
+        job.finished_at = None
+        session.commit()
+        return job_shard_ids(session, job_id)
+
+    except SQLAlchemyError as exc:
+        session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to resume recompute job.") from exc
+
+
+def interrupted_shard_ids(session: Session) -> list[UUID]:
+    """Queued shards, and running shards whose worker stopped heart-beating, of live jobs."""
+
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=get_job_settings().stale_after_seconds)
+    return list(
+        session.execute(
+            select(RecomputeJobShardModel.id)
+            .join(RecomputeJobModel, RecomputeJobModel.id == RecomputeJobShardModel.job_id)
+            .where(RecomputeJobModel.cancel_requested.is_(False))
+            .where(
+                or_(
+                    RecomputeJobShardModel.status == "queued",
+                    (RecomputeJobShardModel.status == "running")
+                    & (RecomputeJobShardModel.heartbeat_at < stale_before),
+                )
+            )
+        ).scalars()
+    )
+
+
+def get_recompute_job(session: Session, job_id: UUID) -> RecomputeJobResponse:
+    """Job state with progress, throughput and errors aggregated over its shards."""
+
+    job = load_job(session, job_id)
+    try:
+        shards = list(
+            session.execute(
+                select(RecomputeJobShardModel)
+                .where(RecomputeJobShardModel.job_id == job_id)
+                .order_by(RecomputeJobShardModel.shard_index)
+            ).scalars()
+        )
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=500, detail="Failed to fetch recompute job.") from exc
+
+    recomputed = sum(shard.recomputed_vendors for shard in shards)
+    skipped = sum(shard.skipped_vendors for shard in shards)
+    elapsed = 0.0
+    if job.started_at is not None:
+        elapsed = ((job.finished_at or datetime.now(timezone.utc)) - job.started_at).total_seconds()
+
+    return RecomputeJobResponse(
+        id=job.id,
+        status=job.status,
+        force=job.force,
+        cancel_requested=job.cancel_requested,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        processed_vendors=recomputed + skipped,
+        recomputed_vendors=recomputed,
+        skipped_vendors=skipped,
+        rows_per_second=round((recomputed + skipped) / elapsed, 2) if elapsed > 0 else 0.0,
+        errors=[f"shard {shard.shard_index}: {shard.error}" for shard in shards if shard.error],
+        shards=[RecomputeJobShardResponse.model_validate(shard) for shard in shards],
+    )
+
+
+def _run_shard_in_worker(shard_id: UUID) -> int:
+    """Process-pool entry point; the worker process builds its own engine on import."""
+
+    from src.database.databases import SessionLocal
+
+    session = SessionLocal()
+    try:
+        return run_recompute_shard(session, shard_id)
+    finally:
+        session.close()
+
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def get_job_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # spawn: workers must not inherit the parent's pooled connections or threads.
+        _executor = ProcessPoolExecutor(
+            max_workers=get_job_settings().max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def _on_shard_done(future: Future) -> None:
+    """Runs in the API process, whose vendor cache the shard's rescores made stale."""
+
+    if future.cancelled():
+        return
+    if future.exception() is not None:
+        logger.error("Recompute shard worker crashed", exc_info=future.exception())
+        # chunks committed before the crash are visible already
+        invalidate_all_vendors()
+    elif future.result():
+        invalidate_all_vendors()
+
+
+def submit_shards(shard_ids: list[UUID]) -> None:
+    executor = get_job_executor()
+    for shard_id in shard_ids:
+        executor.submit(_run_shard_in_worker, shard_id).add_done_callback(_on_shard_done)
+
+
+def shutdown_job_executor() -> None:
+    """Stop the pool without waiting; unfinished shards resume from their checkpoints later."""
+
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
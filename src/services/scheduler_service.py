@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.cron import CronTrigger
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.models import ScheduledRunModel
+from src.services.partition_service import run_partition_maintenance
+from src.services.scoring_service import bulk_recompute_vendor_scores
+from src.utils.validate_db_url import SchedulerSettings, get_scheduler_settings
+
+logger = logging.getLogger(__name__)
+
+# pg_try_advisory_lock keys; one per scheduled job so different jobs can overlap.
+SCHEDULED_JOB_LOCK_KEYS = {
+    "recompute_vendor_scores": 7_310_002,
+    "partition_maintenance": 7_310_003,
+}
+
+
+def _recompute(session: Session) -> BaseModel:
+    return bulk_recompute_vendor_scores(session)
+
+
+def _maintain_partitions(session: Session) -> BaseModel:
+    return run_partition_maintenance(session)
+
+
+SCHEDULED_JOBS: dict[str, Callable[[Session], BaseModel]] = {
+    "recompute_vendor_scores": _recompute,
+    "partition_maintenance": _maintain_partitions,
+}
+
+
+def record_scheduled_run(
+    session: Session,
+    job_name: str,
+    *,
+    started_at: datetime,
+    duration: float,
+    summary: BaseModel | None = None,
+    error: str | None = None,
+) -> ScheduledRunModel:
+    counts = summary.model_dump() if summary is not None else {}
+    run = ScheduledRunModel(
+        job_name=job_name,
+        status="failed" if error else "succeeded",
+        started_at=started_at,
+        finished_at=datetime.now(timezone.utc),
+        duration_seconds=round(duration, 6),
+        processed_vendors=counts.get("processed_vendors"),
+        recomputed_vendors=counts.get("recomputed_vendors"),
+        skipped_vendors=counts.get("skipped_vendors"),
+        error=error,
+    )
+    session.add(run)
+    session.commit()
+    session.refresh(run)
+    return run
+
+
+def run_scheduled_job(engine: Engine, job_name: str) -> ScheduledRunModel | None:
+    """Run ``job_name`` unless another worker holds its advisory lock; returns the history row.
+
+    The session-level lock lives on a dedicated connection for the whole run,
+    so it survives the job's own commits; the job's session is bound to that
+    same connection.
+    """
+
+    lock_key = SCHEDULED_JOB_LOCK_KEYS[job_name]
+    with engine.connect() as connection:
+        acquired = connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": lock_key}).scalar()
+        connection.commit()
+        if not acquired:
+            logger.info("Scheduled %s skipped: running on another worker", job_name)
+            return None
+
+        try:
+            with Session(bind=connection, autoflush=False) as session:
+                started_at = datetime.now(timezone.utc)
+                started = time.perf_counter()
+                try:
+                    summary = SCHEDULED_JOBS[job_name](session)
+                except (HTTPException, SQLAlchemyError) as exc:
+                    session.rollback()
+                    logger.exception("Scheduled %s failed", job_name)
+                    detail = exc.detail if isinstance(exc, HTTPException) else str(exc)
+                    return record_scheduled_run(
+                        session, job_name, started_at=started_at, duration=time.perf_counter() - started, error=detail
+                    )
+                return record_scheduled_run(
+                    session, job_name, started_at=started_at, duration=time.perf_counter() - started, summary=summary
+                )
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": lock_key})
+            connection.commit()
+
+
+def cron_trigger(expression: str, *, timezone: str, jitter: int | None = None) -> CronTrigger:
+    """``CronTrigger.from_crontab`` with jitter, which ``from_crontab`` does not accept."""
+
+    values = expression.split()
+    if len(values) != 5:
+        raise ValueError(f"Wrong number of fields in cron expression {expression!r}")
+    minute, hour, day, month, day_of_week = values
+    return CronTrigger(
+        minute=minute, hour=hour, day=day, month=month, day_of_week=day_of_week, timezone=timezone, jitter=jitter
+    )
+
+
+def build_scheduler(engine: Engine, settings: SchedulerSettings | None = None) -> BackgroundScheduler:
+    """Scheduler with one cron job per configured expression; the caller starts it."""
+
+    settings = settings or get_scheduler_settings()
+    scheduler = BackgroundScheduler(timezone=settings.timezone)
+    crons = {
+        "recompute_vendor_scores": settings.recompute_cron,
+        "partition_maintenance": settings.partition_cron,
+    }
+    for job_name, cron in crons.items():
+        if not cron:
+            continue
+        scheduler.add_job(
+            run_scheduled_job,
+            cron_trigger(cron, timezone=settings.timezone, jitter=settings.jitter_seconds or None),
+            args=(engine, job_name),
+            id=job_name,
+            name=job_name,
+            # never overlap in this process, and collapse a backlog of missed runs into one
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=settings.misfire_grace_seconds,
+        )
+    return scheduler
+
+
+def list_scheduled_runs(session: Session, *, job_name: str | None = None, limit: int = 20) -> list[ScheduledRunModel]:
+    """Most recent scheduled runs first."""
+
+    stmt = select(ScheduledRunModel).order_by(ScheduledRunModel.started_at.desc()).limit(limit)
+    if job_name is not None:
+        stmt = stmt.where(ScheduledRunModel.job_name == job_name)
+    try:
+        return list(session.execute(stmt).scalars())
+
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=500, detail="Failed to fetch scheduled runs.") from exc
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Collection, Iterable, Mapping
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Insert, Select, case, exists, extract, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.models import VendorMetricModel, VendorModel, VendorScoreAggregateModel
+from src.utils.validate_db_url import get_scoring_settings
+
+# Decay exponents are capped so very old metrics get a tiny weight instead of
+# underflowing (Postgres raises on double precision underflow).
+MAX_HALF_LIVES = 1000.0
+
+AGGREGATE_SUM_COLUMNS = {
+    "on_time_delivery_sum": "on_time_delivery_rate",
+    "compliance_sum": "compliance_score",
+    "complaint_sum": "complaint_count",
+    "missing_documents_sum": "missing_documents",
+}
+
+
+def decay_weight(age_seconds: float, half_life_seconds: float) -> float:
+    """Weight of a metric ``age_seconds`` older than the newest one."""
+
+    return 0.5 ** min(age_seconds / half_life_seconds, MAX_HALF_LIVES)
+
+
+def _sql_decay_weight(age: ColumnElement, half_life_seconds: Any) -> ColumnElement:
+    return func.power(0.5, func.least(extract("epoch", age) / half_life_seconds, MAX_HALF_LIVES))
+
+
+def fold_metric_aggregates(
+    metrics: Iterable[Mapping[str, Any]], *, half_life_seconds: float | None = None
+) -> list[dict[str, Any]]:
+    """Fold metric rows into one partial aggregate per vendor, ready for ``merge_aggregates_stmt``.
+
+    Each vendor's partial is anchored at its newest metric; merging it into
+    the stored row only touches that row, so adding metrics never rescans history.
+    """
+
+    half_life_seconds = half_life_seconds or get_scoring_settings().half_life_seconds
+    by_vendor: dict[UUID, list[Mapping[str, Any]]] = {}
+    for metric in metrics:
+        by_vendor.setdefault(metric["vendor_id"], []).append(metric)
+
+    now = datetime.now(timezone.utc)
+    partials = []
+    for vendor_id, rows in by_vendor.items():
+        anchor = max(row["timestamp"] for row in rows)
+        weights = [decay_weight((anchor - row["timestamp"]).total_seconds(), half_life_seconds) for row in rows]
+        partial = {
+            "vendor_id": vendor_id,
+            "half_life_seconds": half_life_seconds,
+            "anchor_at": anchor,
+            "weight_sum": sum(weights),
+            "metric_count": len(rows),
+            "revision": uuid.uuid4(),
+            "updated_at": now,
+        }
+        for column, source in AGGREGATE_SUM_COLUMNS.items():
+            partial[column] = sum(weight * float(row[source]) for weight, row in zip(weights, rows))
+        partials.append(partial)
+    return partials
+
+
+def metric_aggregate_row(metric: VendorMetricModel) -> dict[str, Any]:
+    """The fields of a metric ``fold_metric_aggregates`` reads."""
+
+    return {"vendor_id": metric.vendor_id, "timestamp": metric.timestamp} | {
+        source: getattr(metric, source) for source in AGGREGATE_SUM_COLUMNS.values()
+    }
+
+
+def merge_aggregates_stmt() -> Insert:
+    """Upsert merging partial aggregates into ``vendor_score_aggregates``, for executemany use.
+
+    Both sides are re-anchored at the later of the two anchors before their
+    sums are added, which is exact for exponential decay whatever order
+    metrics arrive in. The stored half-life is kept, so a row built with a
+    stale half-life stays detectable by ``rebuild_aggregates_stmt``.
+    """
+
+    table = VendorScoreAggregateModel.__table__
+    stmt = insert(table)
+    anchor = func.greatest(table.c.anchor_at, stmt.excluded.anchor_at)
+    stored_weight = _sql_decay_weight(anchor - table.c.anchor_at, table.c.half_life_seconds)
+    incoming_weight = _sql_decay_weight(anchor - stmt.excluded.anchor_at, table.c.half_life_seconds)
+
+    merged = {
+        column: table.c[column] * stored_weight + stmt.excluded[column] * incoming_weight
+        for column in ("weight_sum", *AGGREGATE_SUM_COLUMNS)
+    }
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.vendor_id],
+        set_={
+            **merged,
+            "anchor_at": anchor,
+            "metric_count": table.c.metric_count + stmt.excluded.metric_count,
+            "revision": stmt.excluded.revision,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+
+
+def _lacks_current_aggregate(half_life_seconds: float) -> ColumnElement:
+    """Vendors without an aggregate built with ``half_life_seconds``."""
+
+    aggregates = VendorScoreAggregateModel.__table__
+    return ~exists().where(
+        aggregates.c.vendor_id == VendorModel.id,
+        aggregates.c.half_life_seconds == half_life_seconds,
+    )
+
+
+def lock_missing_aggregates_stmt(vendor_ids: Collection[UUID]) -> Select:
+    """Lock the vendor rows of ``vendor_ids`` whose aggregate ``missing_aggregates_stmt`` would build.
+
+    Two first submissions for a vendor would otherwise each build its
+    aggregate from their own snapshot, and the later upsert would replace the
+    earlier one with a history lacking its metric. Once the lock is granted
+    the rebuild's fresh snapshot sees the committed aggregate and skips it.
+    Vendors that already have one are not locked.
+    """
+
+    return (
+        select(VendorModel.id)
+        .where(VendorModel.id.in_(vendor_ids), _lacks_current_aggregate(get_scoring_settings().half_life_seconds))
+        .order_by(VendorModel.id)
+        .with_for_update()
+    )
+
+
+def missing_aggregates_stmt(vendor_ids: Collection[UUID]) -> Insert:
+    """Build the aggregates ``vendor_ids`` lack (or hold with a stale half-life) from their full history.
+
+    Returns the ids of the vendors built. Run after inserting new metrics and
+    ``lock_missing_aggregates_stmt``: the rebuild already counts them, so their
+    partials must not be merged into those vendors again. Merging into a
+    missing row instead would create one from the new metrics alone that
+    ``stale_only`` rebuilds then take as complete.
+    """
+
+    return rebuild_aggregates_stmt(vendor_ids=vendor_ids, stale_only=True).returning(
+        VendorScoreAggregateModel.vendor_id
+    )
+
+
+def unmerged_partials(metrics: Iterable[Mapping[str, Any]], rebuilt: Collection[UUID]) -> list[dict[str, Any]]:
+    """``fold_metric_aggregates`` of the metrics of vendors ``missing_aggregates_stmt`` did not build."""
+
+    return [partial for partial in fold_metric_aggregates(metrics) if partial["vendor_id"] not in rebuilt]
+
+
+def apply_metric_aggregates(session: Session, metrics: Iterable[Mapping[str, Any]]) -> None:
+    """Merge freshly inserted metrics into their vendors' aggregates without committing."""
+
+    metrics = list(metrics)
+    if not metrics:
+        return
+    vendor_ids = {metric["vendor_id"] for metric in metrics}
+    session.execute(lock_missing_aggregates_stmt(vendor_ids))
+    rebuilt = set(session.execute(missing_aggregates_stmt(vendor_ids)).scalars())
+    partials = unmerged_partials(metrics, rebuilt)
+    if partials:
+        session.execute(merge_aggregates_stmt(), partials)
+
+
+def rebuild_aggregates_stmt(
+    *,
+    half_life_seconds: float | None = None,
+    after: UUID | None = None,
+    before: UUID | None = None,
+    vendor_ids: Collection[UUID] | None = None,
+    stale_only: bool = False,
+) -> Insert:
+    """Recompute aggregates from the full metric history in one set-based statement.
+
+    ``stale_only`` limits it to vendors without an aggregate built with the
+    current half-life, i.e. vendors never aggregated or after a half-life change.
+    """
+
+    half_life_seconds = half_life_seconds or get_scoring_settings().half_life_seconds
+    metrics = VendorMetricModel.__table__
+    aggregates = VendorScoreAggregateModel.__table__
+
+    vendors = select(VendorModel.id)
+    if after is not None:
+        vendors = vendors.where(VendorModel.id > after)
+    if before is not None:
+        vendors = vendors.where(VendorModel.id < before)
+    if vendor_ids is not None:
+        vendors = vendors.where(VendorModel.id.in_(vendor_ids))
+    if stale_only:
+        vendors = vendors.where(_lacks_current_aggregate(half_life_seconds))
+
+    anchor = func.max(metrics.c.timestamp).over(partition_by=metrics.c.vendor_id)
+    weighted = (
+        select(
+            metrics.c.vendor_id,
+            metrics.c.timestamp,
+            metrics.c.on_time_delivery_rate,
+            metrics.c.compliance_score,
+            metrics.c.complaint_count,
+            case((metrics.c.missing_documents, 1.0), else_=0.0).label("missing_documents"),
+            _sql_decay_weight(anchor - metrics.c.timestamp, half_life_seconds).label("weight"),
+        )
+        .where(metrics.c.vendor_id.in_(vendors))
+        .subquery()
+    )
+    rebuilt = select(
+        weighted.c.vendor_id,
+        literal(half_life_seconds).label("half_life_seconds"),
+        func.max(weighted.c.timestamp).label("anchor_at"),
+        func.sum(weighted.c.weight).label("weight_sum"),
+        *(func.sum(weighted.c.weight * weighted.c[source]).label(column) for column, source in AGGREGATE_SUM_COLUMNS.items()),
+        func.count().label("metric_count"),
+        func.gen_random_uuid().label("revision"),
+        func.now().label("updated_at"),
+    ).group_by(weighted.c.vendor_id)
+
+    columns = [
+        "vendor_id",
+        "half_life_seconds",
+        "anchor_at",
+        "weight_sum",
+        *AGGREGATE_SUM_COLUMNS,
+        "metric_count",
+        "revision",
+        "updated_at",
+    ]
+    stmt = insert(aggregates).from_select(columns, rebuilt)
+    return stmt.on_conflict_do_update(
+        index_elements=[aggregates.c.vendor_id],
+        set_={column: stmt.excluded[column] for column in columns[1:]},
+    )
+
+
+def rebuild_score_aggregates(session: Session, **filters: Any) -> int:
+    """Run ``rebuild_aggregates_stmt`` without committing; returns the number of vendors rebuilt."""
+
+    rebuilt = rebuild_aggregates_stmt(**filters).returning(VendorScoreAggregateModel.vendor_id).cte("rebuilt")
+    return session.execute(select(func.count()).select_from(rebuilt)).scalar_one()
+
+
+def decayed_metrics_stmt(
+    *,
+    after: UUID | None = None,
+    before: UUID | None = None,
+    vendor_ids: Collection[UUID] | None = None,
+    limit: int | None = None,
+) -> Select:
+    """Decayed mean metric values of every vendor, shaped like ``latest_metrics_stmt``.
+
+    ``complaint_count`` is a decayed mean and ``missing_documents`` the decayed
+    share of metrics with missing documents. The aggregate's revision and
+    anchor stand in for the metric id and timestamp of the scoring watermark.
+    """
+
+    aggregates = VendorScoreAggregateModel.__table__
+    stmt = (
+        select(
+            aggregates.c.vendor_id,
+            *(
+                (aggregates.c[column] / aggregates.c.weight_sum).label(source)
+                for column, source in AGGREGATE_SUM_COLUMNS.items()
+            ),
+            VendorModel.category,
+            aggregates.c.revision.label("metric_id"),
+            aggregates.c.anchor_at.label("metric_timestamp"),
+            VendorModel.last_scored_metric_id,
+            VendorModel.last_scored_category,
+            VendorModel.last_scored_version,
+        )
+        .join(VendorModel, VendorModel.id == aggregates.c.vendor_id)
+        .order_by(aggregates.c.vendor_id)
+    )
+    if after is not None:
+        stmt = stmt.where(aggregates.c.vendor_id > after)
+    if before is not None:
+        stmt = stmt.where(aggregates.c.vendor_id < before)
+    if vendor_ids is not None:
+        stmt = stmt.where(aggregates.c.vendor_id.in_(vendor_ids))
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import csv
+import io
+import itertools
+import logging
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+import pyarrow
+import pyarrow.ipc
+from fastapi import HTTPException
+from pydantic import TypeAdapter
+from sqlalchemy import Row, Select, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.models import VendorModel, VendorScoreModel
+from src.schema import VendorScoreRow
+from src.services.vendor_service import replayed_scores_clause
+
+logger = logging.getLogger(__name__)
+
+ExportFormat = Literal["ndjson", "csv", "arrow"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+# Rows fetched per round trip of the server-side cursor, and encoded per chunk.
+EXPORT_BATCH_SIZE = 5_000
+
+# vendor_id filters travel in the query string, which servers cap at a few KB.
+EXPORT_MAX_VENDOR_IDS = 100
+
+EXPORT_COLUMNS = ("id", "vendor_id", "calculated_at", "score", "scoring_version")
+
+SCORE_ROW_ADAPTER = TypeAdapter(VendorScoreRow)
+
+
+def score_export_stmt(
+    *,
+    vendor_ids: Sequence[UUID] | None = None,
+    category: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    scoring_version: str | None = None,
+    replayed: bool = False,
+) -> Select:
+    """Select score history as plain rows, grouped by vendor and newest first within each.
+
+    The order is that of the vendor_scores history indexes, so
+    unfiltered and per-vendor exports stream out of a merge of per-partition
+    index scans without a sort. ``start`` is inclusive and ``end`` exclusive.
+    Live scores are exported unless ``replayed`` asks for replayed ones.
+    """
+    stmt = (
+        select(*(getattr(VendorScoreModel, column) for column in EXPORT_COLUMNS))
+        .where(replayed_scores_clause(replayed))
+        .order_by(VendorScoreModel.vendor_id, VendorScoreModel.calculated_at.desc(), VendorScoreModel.id.desc())
+    )
+    if vendor_ids is not None:
+        stmt = stmt.where(
+            VendorScoreModel.vendor_id
+            == any_(bindparam("vendor_ids", list(dict.fromkeys(vendor_ids)), type_=ARRAY(PG_UUID(as_uuid=True))))
+        )
+    if category is not None:
+        vendors_in_category = select(VendorModel.id).where(VendorModel.category == category)
+        stmt = stmt.where(VendorScoreModel.vendor_id.in_(vendors_in_category))
+    if start is not None:
+        stmt = stmt.where(VendorScoreModel.calculated_at >= start)
+    if end is not None:
+        stmt = stmt.where(VendorScoreModel.calculated_at < end)
+    if scoring_version is not None:
+        stmt = stmt.where(VendorScoreModel.scoring_version == scoring_version)
+    return stmt
+
+
+class NdjsonEncoder:
+    """One ``VendorScoreResponse``-shaped JSON object per line."""
+
+    def header(self) -> bytes:
+        return b""
+
+    def encode(self, rows: Sequence[Row]) -> bytes:
+        dump_json = SCORE_ROW_ADAPTER.dump_json
+        return b"".join([dump_json(row._asdict()) + b"\n" for row in rows])
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class CsvEncoder:
+    def __init__(self) -> None:
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue().encode()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def header(self) -> bytes:
+        self._writer.writerow(EXPORT_COLUMNS)
+        return self._drain()
+
+    def encode(self, rows: Sequence[Row]) -> bytes:
+        self._writer.writerows(
+            (row.id, row.vendor_id, row.calculated_at.isoformat(), row.score, row.scoring_version)
+            for row in rows
+        )
+        return self._drain()
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class ArrowEncoder:
+    """An Arrow IPC stream: the schema, then one record batch per cursor fetch."""
+
+    def __init__(self) -> None:
+        self._schema = pyarrow.schema(
+            [
+                ("id", pyarrow.string()),
+                ("vendor_id", pyarrow.string()),
+                ("calculated_at", pyarrow.timestamp("us", tz="UTC")),
+                ("score", pyarrow.float64()),
+                ("scoring_version", pyarrow.string()),
+            ]
+        )
+        self._sink = io.BytesIO()
+        self._writer = None
+
+    def _drain(self) -> bytes:
+        data = self._sink.getvalue()
+        self._sink.seek(0)
+        self._sink.truncate()
+        return data
+
+    def header(self) -> bytes:
+        self._writer = pyarrow.ipc.new_stream(self._sink, self._schema)
+        return self._drain()
+
+    def encode(self, rows: Sequence[Row]) -> bytes:
+        ids, vendor_ids, calculated_at, scores, versions = zip(*rows)
+        batch = pyarrow.record_batch(
+            [
+                pyarrow.array([str(value) for value in ids], pyarrow.string()),
+                pyarrow.array([str(value) for value in vendor_ids], pyarrow.string()),
+                pyarrow.array(calculated_at, self._schema.field("calculated_at").type),
+                pyarrow.array(scores, pyarrow.float64()),
+                pyarrow.array(versions, pyarrow.string()),
+            ],
+            schema=self._schema,
+        )
+        self._writer.write_batch(batch)
+        return self._drain()
+
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._drain()
+
+
+EXPORT_ENCODERS = {"ndjson": NdjsonEncoder, "csv": CsvEncoder, "arrow": ArrowEncoder}
+
+
+def iter_score_export(
+    bind: Engine, stmt: Select, fmt: ExportFormat, *, batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[bytes]:
+    """Yield ``stmt``'s rows encoded as ``fmt``, one chunk per server-side cursor fetch.
+
+    The query runs before the first chunk is yielded. The generator owns its
+    connection, which stays open only while the response is being consumed, so
+    memory is bounded by one batch regardless of the export's size and a slow
+    client simply pauses the cursor.
+    """
+
+    encoder = EXPORT_ENCODERS[fmt]()
+    with bind.connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=batch_size).execute(stmt)
+        yield encoder.header()
+        for rows in result.partitions():
+            yield encoder.encode(rows)
+        yield encoder.finish()
+
+
+def open_score_export(bind: Engine, fmt: ExportFormat, **filters) -> Iterator[bytes]:
+    """Start a score export, failing with a proper status while headers can still be sent.
+
+    Once the first chunk is out the status is committed; a database error after
+    that is logged and ends the body early.
+    """
+
+    chunks = iter_score_export(bind, score_export_stmt(**filters), fmt, batch_size=EXPORT_BATCH_SIZE)
+    try:
+        first = next(chunks)
+
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=500, detail="Failed to export vendor scores.") from exc
+    return itertools.chain((first,), _log_failures(chunks))
+
+
+def _log_failures(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    try:
+        yield from chunks
+    except SQLAlchemyError:
+        logger.exception("Score export failed mid-stream")
+        raise
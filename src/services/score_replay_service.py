@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import Sequence
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+from fastapi import HTTPException
+from sqlalchemy import Row, Select, and_, exists, insert, or_, select, tuple_, update
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from src.models import ScoreReplayModel, VendorMetricModel, VendorModel, VendorScoreModel
+from src.schema import ScoreReplayResponse
+from src.services.recompute_job_service import get_job_executor
+from src.services.score_aggregate_service import decay_weight
+from src.services.scoring_rule_service import CompiledRuleSet, encode_categories, scoring_rules
+from src.utils.cache import invalidate_all_vendors, invalidate_vendors
+from src.utils.validate_db_url import get_scoring_settings
+
+logger = logging.getLogger(__name__)
+
+# Metrics fetched per server-side cursor round trip and scored per commit.
+REPLAY_BATCH_SIZE = 5_000
+
+
+class DecayedSeries:
+    """Running decayed means of one vendor's metrics, fed oldest first.
+
+    Mirrors ``vendor_score_aggregates`` so replayed decayed scores match what
+    live scoring would have produced at each metric's timestamp.
+    """
+
+    def __init__(self, half_life_seconds: float, carry: dict[str, Any] | None = None) -> None:
+        self.half_life_seconds = half_life_seconds
+        self.vendor_id: UUID | None = None
+        self.anchor: datetime | None = None
+        self.sums = [0.0] * 5  # weight, delivery, compliance, complaints, missing documents
+        if carry:
+            self.vendor_id = UUID(carry["vendor_id"])
+            self.anchor = datetime.fromisoformat(carry["anchor"])
+            self.sums = list(carry["sums"])
+
+    def add(self, row: Row) -> tuple[float, float, float, float]:
+        if row.vendor_id != self.vendor_id:
+            self.vendor_id, self.anchor, self.sums = row.vendor_id, row.timestamp, [0.0] * 5
+
+        factor = decay_weight((row.timestamp - self.anchor).total_seconds(), self.half_life_seconds)
+        values = (
+            1.0,
+            row.on_time_delivery_rate,
+            row.compliance_score,
+            float(row.complaint_count),
+            float(row.missing_documents),
+        )
+        self.sums = [total * factor + value for total, value in zip(self.sums, values)]
+        self.anchor = row.timestamp
+
+        weight = self.sums[0]
+        return self.sums[1] / weight, self.sums[2] / weight, self.sums[3] / weight, self.sums[4] / weight
+
+    def carry(self) -> dict[str, Any] | None:
+        if self.vendor_id is None:
+            return None
+        return {"vendor_id": str(self.vendor_id), "anchor": self.anchor.isoformat(), "sums": self.sums}
+
+
+def replay_metrics_stmt(checkpoint: tuple[UUID, datetime, UUID] | None = None) -> Select:
+    """Every metric with its vendor's category, grouped by vendor and oldest first within a vendor.
+
+    Vendors come in descending id order: that is a backward scan of
+    ``ix_vendor_metrics_vendor_id_timestamp`` in every partition, merged
+    without sorting the whole table. ``checkpoint`` is the last replayed
+    ``(vendor_id, timestamp, id)``.
+    """
+
+    metrics = VendorMetricModel.__table__
+    stmt = (
+        select(
+            metrics.c.vendor_id,
+            metrics.c.id,
+            metrics.c.timestamp,
+            metrics.c.on_time_delivery_rate,
+            metrics.c.compliance_score,
+            metrics.c.complaint_count,
+            metrics.c.missing_documents,
+            VendorModel.category,
+        )
+        .join(VendorModel, VendorModel.id == metrics.c.vendor_id)
+        .order_by(metrics.c.vendor_id.desc(), metrics.c.timestamp, metrics.c.id)
+    )
+    if checkpoint is not None:
+        vendor_id, timestamp, metric_id = checkpoint
+        stmt = stmt.where(
+            or_(
+                metrics.c.vendor_id < vendor_id,
+                and_(
+                    metrics.c.vendor_id == vendor_id,
+                    tuple_(metrics.c.timestamp, metrics.c.id) > tuple_(timestamp, metric_id),
+                ),
+            )
+        )
+    return stmt
+
+
+def score_replay_rows(
+    rows: Sequence[Row], rules: CompiledRuleSet, *, series: DecayedSeries | None = None, replay_id: UUID | None = None
+) -> list[dict]:
+    """Score each metric as of its own timestamp with ``rules`` into insertable ``vendor_scores`` rows.
+
+    The rows carry ``replay_id`` so they stay out of the live score history.
+    Without ``series`` a metric is scored on its own, like ``SCORING_MODE=latest``.
+    """
+
+    if series is None:
+        columns = (
+            [row.on_time_delivery_rate for row in rows],
+            [row.compliance_score for row in rows],
+            [row.complaint_count for row in rows],
+            [row.missing_documents for row in rows],
+        )
+    else:
+        columns = tuple(zip(*(series.add(row) for row in rows)))
+
+    scores = rules.score_batch(
+        *(np.array(column, dtype=np.float64) for column in columns),
+        encode_categories(row.category for row in rows),
+    )
+    return [
+        {
+            "vendor_id": row.vendor_id,
+            "calculated_at": row.timestamp,
+            "score": score,
+            "scoring_version": rules.version,
+            "replay_id": replay_id,
+        }
+        for row, score in zip(rows, scores.tolist())
+    ]
+
+
+def create_score_replay(session: Session, scoring_version: str, *, mode: str | None = None) -> ScoreReplayModel:
+    """Persist a queued replay of the loaded rule set ``scoring_version``; one replay per version.
+
+    Versions that score live traffic (active, in an experiment, or already in
+    the score history) are refused, so replayed and live scores never share a
+    version.
+    """
+
+    loaded = scoring_rules.describe()
+    if scoring_version not in loaded.versions:
+        raise HTTPException(status_code=400, detail=f"Unknown scoring rule set {scoring_version}")
+    if scoring_version == loaded.active or scoring_version in loaded.experiments:
+        raise HTTPException(status_code=409, detail=f"Scoring version {scoring_version} is scoring live traffic")
+
+    settings = get_scoring_settings()
+    mode = mode or settings.mode
+    replay = ScoreReplayModel(
+        scoring_version=scoring_version,
+        mode=mode,
+        half_life_seconds=settings.half_life_seconds if mode == "decayed" else None,
+        status="queued",
+        vendors_replayed=0,
+        scores_written=0,
+    )
+
+    try:
+        live_scores = exists().where(
+            VendorScoreModel.scoring_version == scoring_version, VendorScoreModel.replay_id.is_(None)
+        )
+        if session.scalar(select(live_scores)):
+            raise HTTPException(status_code=409, detail=f"Scoring version {scoring_version} has live scores")
+        session.add(replay)
+        session.commit()
+        session.refresh(replay)
+        return replay
+
+    except IntegrityError as exc:
+        session.rollback()
+        raise HTTPException(status_code=409, detail=f"Scoring version {scoring_version} was already replayed") from exc
+
+    except SQLAlchemyError as exc:
+        session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to create score replay.") from exc
+
+
+def load_score_replay(session: Session, replay_id: UUID) -> ScoreReplayModel:
+    replay = session.get(ScoreReplayModel, replay_id)
+    if replay is None:
+        raise HTTPException(status_code=404, detail="Replay not found")
+    return replay
+
+
+def claim_score_replay(session: Session, replay_id: UUID) -> UUID | None:
+    """Take ownership of a queued replay; returns the claim token."""
+
+    token = uuid.uuid4()
+    replays = ScoreReplayModel.__table__
+    claimed = session.execute(
+        update(replays)
+        .where(replays.c.id == replay_id)
+        .where(replays.c.status == "queued")
+        .values(status="running", claim_token=token, started_at=datetime.now(timezone.utc), error=None)
+    ).rowcount
+    session.commit()
+    return token if claimed else None
+
+
+def _finish_replay(session: Session, replay_id: UUID, token: UUID, status: str, error: str | None = None) -> None:
+    replays = ScoreReplayModel.__table__
+    session.execute(
+        update(replays)
+        .where(replays.c.id == replay_id)
+        .where(replays.c.claim_token == token)
+        .values(status=status, error=error, finished_at=datetime.now(timezone.utc))
+    )
+    session.commit()
+
+
+def run_score_replay(session: Session, replay_id: UUID, *, batch_size: int = REPLAY_BATCH_SIZE) -> None:
+    """Stream the metric history through a server-side cursor and write its score series.
+
+    Metrics are read on a separate connection so the writer can commit every
+    batch together with the checkpoint (and the decayed running sums) without
+    closing the cursor. Memory stays at one batch; a resumed replay continues
+    after the last committed metric and never writes a score twice.
+    """
+
+    token = claim_score_replay(session, replay_id)
+    if token is None:
+        return
+
+    replay = session.get(ScoreReplayModel, replay_id)
+    replays = ScoreReplayModel.__table__
+    checkpoint = None
+    if replay.checkpoint_vendor_id is not None:
+        checkpoint = (replay.checkpoint_vendor_id, replay.checkpoint_timestamp, replay.checkpoint_metric_id)
+    series = DecayedSeries(replay.half_life_seconds, replay.carry) if replay.mode == "decayed" else None
+    rules = scoring_rules.get(replay.scoring_version)
+    current_vendor = replay.checkpoint_vendor_id
+
+    if rules is None:
+        session.rollback()
+        _finish_replay(session, replay_id, token, "failed", error=f"Unknown scoring rule set {replay.scoring_version}")
+        return
+
+    try:
+        with session.get_bind().connect() as reader:
+            result = reader.execution_options(stream_results=True, yield_per=batch_size).execute(
+                replay_metrics_stmt(checkpoint)
+            )
+            for rows in result.partitions():
+                session.execute(
+                    insert(VendorScoreModel), score_replay_rows(rows, rules, series=series, replay_id=replay_id)
+                )
+
+                vendor_ids = {row.vendor_id for row in rows}
+                new_vendors = len(vendor_ids - {current_vendor})
+                current_vendor = rows[-1].vendor_id
+                advanced = session.execute(
+                    update(replays)
+                    .where(replays.c.id == replay_id)
+                    .where(replays.c.claim_token == token)
+                    .values(
+                        checkpoint_vendor_id=rows[-1].vendor_id,
+                        checkpoint_timestamp=rows[-1].timestamp,
+                        checkpoint_metric_id=rows[-1].id,
+                        carry=series.carry() if series is not None else None,
+                        vendors_replayed=replays.c.vendors_replayed + new_vendors,
+                        scores_written=replays.c.scores_written + len(rows),
+                    )
+                ).rowcount
+                if not advanced:
+                    # Resumed elsewhere; that run owns the remaining batches.
+                    session.rollback()
+                    return
+                session.commit()
+                invalidate_vendors(*vendor_ids)
+
+        _finish_replay(session, replay_id, token, "succeeded")
+
+    except Exception as exc:
+        session.rollback()
+        logger.exception("Score replay %s failed", replay_id)
+        _finish_replay(session, replay_id, token, "failed", error=f"{type(exc).__name__}: {exc}")
+
+
+def resume_score_replay(session: Session, replay_id: UUID) -> ScoreReplayModel:
+    """Requeue a failed or interrupted replay from its checkpoint, revoking any running claim."""
+
+    replay = load_score_replay(session, replay_id)
+    if replay.status == "succeeded":
+        raise HTTPException(status_code=409, detail="Replay already succeeded")
+
+    try:
+        replay.status = "queued"
+        replay.claim_token = None
+        replay.finished_at = None
+        session.commit()
+        session.refresh(replay)
+        return replay
+
+    except SQLAlchemyError as exc:
+        session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to resume score replay.") from exc
+
+
+def get_score_replay(session: Session, replay_id: UUID) -> ScoreReplayResponse:
+    replay = load_score_replay(session, replay_id)
+    session.refresh(replay)
+    return ScoreReplayResponse.model_validate(replay)
+
+
+def _run_replay_in_worker(replay_id: UUID) -> None:
+    """Process-pool entry point; the worker process builds its own engine on import."""
+
+    from src.database.databases import SessionLocal
+
+    session = SessionLocal()
+    try:
+        run_score_replay(session, replay_id)
+    finally:
+        session.close()
+
+
+def _on_replay_done(future: Future) -> None:
+    """Runs in the API process, whose vendor cache the worker's committed batches made stale."""
+
+    if future.cancelled():
+        return
+    if future.exception() is not None:
+        logger.error("Score replay worker crashed", exc_info=future.exception())
+    # batches committed before a crash are visible already
+    invalidate_all_vendors()
+
+
+def submit_score_replay(replay_id: UUID) -> None:
+    """Run a replay on the recompute job worker pool."""
+
+    get_job_executor().submit(_run_replay_in_worker, replay_id).add_done_callback(_on_replay_done)
@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Sequence
+from datetime import date, datetime, timezone
+
+from fastapi import HTTPException
+from sqlalchemy import ColumnElement, Insert, Select, SmallInteger, func, literal, or_, select, text, union_all, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.models import CategoryScoreBucketModel, DailyScoreBucketModel, VendorModel
+from src.schema import (
+    CategoryScoreStats,
+    DailyScoreDistribution,
+    LeaderboardEntry,
+    LeaderboardResponse,
+    ScoreHistogramResponse,
+    ScoreRollupRefreshSummary,
+    ScoreStatsResponse,
+    VendorCategory,
+)
+
+logger = logging.getLogger(__name__)
+
+# 1-point buckets over [0, 100]; a score of exactly 100 is counted in the last one.
+ROLLUP_BUCKETS = 100
+
+# pg_advisory_xact_lock key serialising rollup refreshes across workers.
+SCORE_ROLLUP_LOCK_KEY = 7_310_004
+
+PERCENTILES = {"p10": 0.1, "p50": 0.5, "p90": 0.9}
+
+
+def score_bucket(score: ColumnElement) -> ColumnElement:
+    return func.least(func.floor(score), ROLLUP_BUCKETS - 1).cast(SmallInteger)
+
+
+def rollup_pending_clause() -> ColumnElement:
+    """Vendors whose current score or category differs from what the rollups count them as.
+
+    Matches the predicate of the partial index ``ix_vendors_rollup_pending``.
+    """
+
+    vendors = VendorModel.__table__
+    return or_(
+        vendors.c.latest_score.is_distinct_from(vendors.c.rollup_score),
+        vendors.c.category.is_distinct_from(vendors.c.rollup_category),
+    )
+
+
+def fold_pending_stmt() -> Select:
+    """Move every pending vendor from its counted bucket to its current one; selects how many moved.
+
+    One statement: the pending vendors are locked and marked as counted, and
+    the per-bucket differences between what they were counted as and their
+    current score are merged into ``category_score_buckets``. A vendor
+    rescored meanwhile waits for the lock and is simply pending again
+    afterwards, so the rollups never drift from ``vendors.latest_score``.
+    """
+
+    vendors = VendorModel.__table__
+    buckets = CategoryScoreBucketModel.__table__
+
+    pending = (
+        select(vendors.c.id, vendors.c.rollup_score, vendors.c.rollup_category)
+        .where(rollup_pending_clause())
+        .with_for_update()
+        .cte("pending")
+    )
+    folded = (
+        update(vendors)
+        .where(vendors.c.id == pending.c.id)
+        .values(rollup_score=vendors.c.latest_score, rollup_category=vendors.c.category, updated_at=vendors.c.updated_at)
+        .returning(
+            pending.c.rollup_score.label("old_score"),
+            pending.c.rollup_category.label("old_category"),
+            vendors.c.latest_score.label("new_score"),
+            vendors.c.category.label("new_category"),
+        )
+        .cte("folded")
+    )
+    changes = union_all(
+        select(
+            folded.c.old_category.label("category"),
+            score_bucket(folded.c.old_score).label("bucket"),
+            literal(-1).label("vendors"),
+            (-folded.c.old_score).label("score_sum"),
+        ).where(folded.c.old_score.is_not(None)),
+        select(
+            folded.c.new_category,
+            score_bucket(folded.c.new_score),
+            literal(1),
+            folded.c.new_score,
+        ).where(folded.c.new_score.is_not(None)),
+    ).subquery("changes")
+    deltas = select(
+        changes.c.category,
+        changes.c.bucket,
+        func.sum(changes.c.vendors),
+        func.sum(changes.c.score_sum),
+        func.now(),
+    ).group_by(changes.c.category, changes.c.bucket)
+
+    merge = insert(buckets).from_select(["category", "bucket", "vendors", "score_sum", "updated_at"], deltas)
+    merge = merge.on_conflict_do_update(
+        index_elements=[buckets.c.category, buckets.c.bucket],
+        set_={
+            "vendors": buckets.c.vendors + merge.excluded.vendors,
+            "score_sum": buckets.c.score_sum + merge.excluded.score_sum,
+            "updated_at": merge.excluded.updated_at,
+        },
+    )
+    # the merge is referenced nowhere, so it is attached explicitly; Postgres runs it all the same
+    return select(func.count()).select_from(folded).add_cte(merge.cte("merged"))
+
+
+def snapshot_day_stmt(day: date) -> Insert:
+    """Copy ``category_score_buckets`` into ``daily_score_buckets`` for ``day``, replacing earlier copies."""
+
+    buckets = CategoryScoreBucketModel.__table__
+    daily = DailyScoreBucketModel.__table__
+    stmt = insert(daily).from_select(
+        ["day", "category", "bucket", "vendors", "score_sum"],
+        select(literal(day), buckets.c.category, buckets.c.bucket, buckets.c.vendors, buckets.c.score_sum),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[daily.c.day, daily.c.category, daily.c.bucket],
+        set_={"vendors": stmt.excluded.vendors, "score_sum": stmt.excluded.score_sum},
+    )
+
+
+def refresh_score_rollups(session: Session) -> ScoreRollupRefreshSummary:
+    """Fold vendors rescored since the last refresh into the rollups and snapshot today's distribution.
+
+    The work is proportional to the vendors that changed, found through
+    ``ix_vendors_rollup_pending``, plus the fixed number of buckets.
+    """
+
+    started = time.perf_counter()
+    day = datetime.now(timezone.utc).date()
+    try:
+        session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCORE_ROLLUP_LOCK_KEY})
+        folded = session.execute(fold_pending_stmt()).scalar_one()
+        session.execute(snapshot_day_stmt(day))
+        session.commit()
+
+    except SQLAlchemyError as exc:
+        session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to refresh score rollups.") from exc
+
+    return ScoreRollupRefreshSummary(
+        folded_vendors=folded, day=day, duration_seconds=round(time.perf_counter() - started, 6)
+    )
+
+
+def refresh_rollups_after_recompute(session: Session) -> None:
+    """``refresh_score_rollups`` for the end of a recompute run, whose scores are already committed.
+
+    A failure is logged rather than raised: the changed vendors stay pending
+    and the next refresh folds them in.
+    """
+
+    try:
+        refresh_score_rollups(session)
+    except HTTPException:
+        logger.exception("Score rollups not refreshed after recompute")
+
+
+def leaderboard_stmt(categories: Sequence[str], limit: int) -> Select:
+    """The ``limit`` highest current scores of each category, one index range read per category.
+
+    Ties are broken by vendor id, matching ``ix_vendors_category_latest_score``.
+    """
+
+    tops = [
+        select(
+            VendorModel.category,
+            VendorModel.id,
+            VendorModel.name,
+            VendorModel.latest_score,
+            VendorModel.latest_scored_at,
+        )
+        .where(VendorModel.category == category)
+        .where(VendorModel.latest_score.is_not(None))
+        .order_by(VendorModel.latest_score.desc(), VendorModel.id)
+        .limit(limit)
+        .subquery()
+        .select()
+        for category in categories
+    ]
+    return union_all(*tops) if len(tops) > 1 else tops[0]
+
+
+def get_leaderboard(session: Session, *, category: str | None = None, limit: int = 10) -> LeaderboardResponse:
+    categories = [category] if category is not None else [member.value for member in VendorCategory]
+    try:
+        rows = session.execute(leaderboard_stmt(categories, limit)).all()
+
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=500, detail="Failed to fetch the leaderboard.") from exc
+
+    rows.sort(key=lambda row: (categories.index(row.category), -row.latest_score, row.id))
+    items = []
+    rank = 0
+    for index, row in enumerate(rows):
+        rank = 1 if index == 0 or row.category != rows[index - 1].category else rank + 1
+        items.append(
+            LeaderboardEntry(
+                category=row.category,
+                rank=rank,
+                vendor_id=row.id,
+                name=row.name,
+                score=row.latest_score,
+                scored_at=row.latest_scored_at,
+            )
+        )
+    return LeaderboardResponse(items=items)
+
+
+def bucket_percentile(counts: Sequence[int], quantile: float) -> float | None:
+    """Percentile of the scores counted in 1-point ``counts``, interpolated linearly within a bucket."""
+
+    total = sum(counts)
+    if total <= 0:
+        return None
+    target = quantile * total
+    seen = 0
+    for bucket, count in enumerate(counts):
+        if count > 0 and seen + count >= target:
+            return round(bucket + (target - seen) / count, 4)
+        seen += count
+    return float(len(counts))
+
+
+def summarize_buckets(counts: Sequence[int], score_sum: float) -> dict:
+    """``ScoreDistribution`` fields of one set of bucket counts."""
+
+    vendors = sum(counts)
+    summary: dict = {"vendors": vendors}
+    if vendors > 0:
+        summary["mean_score"] = round(score_sum / vendors, 4)
+        summary.update({name: bucket_percentile(counts, quantile) for name, quantile in PERCENTILES.items()})
+    return summary
+
+
+def get_score_stats(session: Session, *, category: str | None = None) -> ScoreStatsResponse:
+    """Per-category statistics of current scores, read from ``category_score_buckets`` alone."""
+
+    buckets = CategoryScoreBucketModel.__table__
+    stmt = select(buckets.c.category, buckets.c.bucket, buckets.c.vendors, buckets.c.score_sum, buckets.c.updated_at)
+    if category is not None:
+        stmt = stmt.where(buckets.c.category == category)
+    try:
+        rows = session.execute(stmt).all()
+
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=500, detail="Failed to fetch score statistics.") from exc
+
+    counts: dict[str, list[int]] = {}
+    sums: dict[str, float] = {}
+    for row in rows:
+        counts.setdefault(row.category, [0] * ROLLUP_BUCKETS)[row.bucket] = row.vendors
+        sums[row.category] = sums.get(row.category, 0.0) + row.score_sum
+
+    return ScoreStatsResponse(
+        items=[
+            CategoryScoreStats(category=name, **summarize_buckets(counts[name], sums[name])) for name in sorted(counts)
+        ],
+        refreshed_at=max((row.updated_at for row in rows), default=None),
+    )
+
+
+def get_score_histogram(
+    session: Session,
+    *,
+    category: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    bin_width: int = 10,
+) -> ScoreHistogramResponse:
+    """Daily distribution of current scores from ``daily_score_buckets``, optionally for one category.
+
+    ``start`` and ``end`` are inclusive days; only days with a rollup refresh appear.
+    """
+
+    daily = DailyScoreBucketModel.__table__
+    stmt = (
+        select(daily.c.day, daily.c.bucket, func.sum(daily.c.vendors), func.sum(daily.c.score_sum))
+        .group_by(daily.c.day, daily.c.bucket)
+        .order_by(daily.c.day)
+    )
+    if category is not None:
+        stmt = stmt.where(daily.c.category == category)
+    if start is not None:
+        stmt = stmt.where(daily.c.day >= start)
+    if end is not None:
+        stmt = stmt.where(daily.c.day <= end)
+    try:
+        rows = session.execute(stmt).all()
+
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=500, detail="Failed to fetch the score histogram.") from exc
+
+    counts: dict[date, list[int]] = {}
+    sums: dict[date, float] = {}
+    for day, bucket, vendors, score_sum in rows:
+        counts.setdefault(day, [0] * ROLLUP_BUCKETS)[bucket] = vendors
+        sums[day] = sums.get(day, 0.0) + score_sum
+
+    days = []
+    for day, day_counts in counts.items():
+        histogram = [sum(day_counts[low:low + bin_width]) for low in range(0, ROLLUP_BUCKETS, bin_width)]
+        days.append(DailyScoreDistribution(day=day, histogram=histogram, **summarize_buckets(day_counts, sums[day])))
+    return ScoreHistogramResponse(category=category, bin_width=bin_width, days=days)
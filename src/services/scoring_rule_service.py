@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime, timezone
+from uuid import UUID
+
+import numpy as np
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from src.schema import ScoringRuleFile, ScoringRuleSet, ScoringRulesResponse
+from src.schema.scoring_rules import DEFAULT_RULE_SET_VERSION
+from src.schema.vendor_category import VendorCategory
+from src.utils.validate_db_url import get_scoring_settings
+
+logger = logging.getLogger(__name__)
+
+_monotonic = time.monotonic
+
+# Integer codes for the columnar scoring kernel; unknown categories get the
+# trailing code, which carries the rule set's default category weight.
+CATEGORY_CODES = {category.value: code for code, category in enumerate(VendorCategory)}
+UNKNOWN_CATEGORY_CODE = len(CATEGORY_CODES)
+
+# Experiment shares are resolved per vendor into this many id buckets.
+EXPERIMENT_BUCKETS = 10_000
+
+DEFAULT_RULE_SET = ScoringRuleSet(version=DEFAULT_RULE_SET_VERSION)
+
+
+class CompiledRuleSet:
+    """A validated rule set turned into a scalar scorer and a vectorized kernel.
+
+    Both are built once per load: constants are bound as closure locals and
+    category weights as a dict lookup and a code-indexed table, so scoring a
+    metric costs the same as the hardcoded formula did.
+    """
+
+    def __init__(self, rule_set: ScoringRuleSet) -> None:
+        self.rule_set = rule_set
+        self.version = rule_set.version
+        self.score: Callable[[float, float, float, float, str], float] = _compile_scalar(rule_set)
+        default_weight = rule_set.default_category_weight
+        weights = [rule_set.category_weights.get(category, default_weight) for category in VendorCategory]
+        self.weight_table = np.array([*weights, default_weight], dtype=np.float64)
+
+    def score_batch(
+        self,
+        on_time_delivery_rate: np.ndarray,
+        compliance_score: np.ndarray,
+        complaint_count: np.ndarray,
+        missing_documents: np.ndarray,
+        category_codes: np.ndarray,
+    ) -> np.ndarray:
+        """Vectorized ``score`` over columnar inputs.
+
+        Every operation mirrors the scalar path in the same order, including the
+        tie-breaking of Python's ``min``/``max``, so results are bit-identical.
+        """
+
+        rules = self.rule_set
+        delivery_component = np.asarray(on_time_delivery_rate, dtype=np.float64) * rules.delivery_weight
+        compliance_component = np.asarray(compliance_score, dtype=np.float64) * rules.compliance_weight
+
+        complaint_penalty = np.asarray(complaint_count, dtype=np.float64) * rules.penalty_per_complaint
+        complaint_penalty = np.where(
+            rules.max_complaint_penalty < complaint_penalty, rules.max_complaint_penalty, complaint_penalty
+        )
+        reliability_component = rules.reliability_points - complaint_penalty
+        reliability_component = np.where(reliability_component > 0, reliability_component, 0.0)
+
+        penalty_component = np.asarray(missing_documents, dtype=np.float64) * rules.missing_documents_penalty
+
+        raw_score = delivery_component + compliance_component + reliability_component - penalty_component
+        weighted = raw_score * self.weight_table[np.asarray(category_codes, dtype=np.intp)]
+
+        capped = np.where(weighted < 100.0, weighted, 100.0)
+        return np.where(capped > 0.0, capped, 0.0)
+
+    def __repr__(self) -> str:
+        return f"<CompiledRuleSet(version={self.version})>"
+
+
+def _compile_scalar(rule_set: ScoringRuleSet) -> Callable[[float, float, float, float, str], float]:
+    delivery_weight = rule_set.delivery_weight
+    compliance_weight = rule_set.compliance_weight
+    reliability_points = rule_set.reliability_points
+    penalty_per_complaint = rule_set.penalty_per_complaint
+    max_complaint_penalty = rule_set.max_complaint_penalty
+    missing_documents_penalty = rule_set.missing_documents_penalty
+    category_weight = {category.value: weight for category, weight in rule_set.category_weights.items()}.get
+    default_category_weight = rule_set.default_category_weight
+
+    def score(
+        on_time_delivery_rate: float,
+        compliance_score: float,
+        complaint_count: float,
+        missing_documents: float,
+        category: str,
+    ) -> float:
+        raw_score = (
+            on_time_delivery_rate * delivery_weight
+            + compliance_score * compliance_weight
+            + max(0, reliability_points - min(complaint_count * penalty_per_complaint, max_complaint_penalty))
+            - missing_documents_penalty * missing_documents
+        )
+        return max(0.0, min(100.0, raw_score * category_weight(category, default_category_weight)))
+
+    return score
+
+
+def compile_rule_set(rule_set: ScoringRuleSet) -> CompiledRuleSet:
+    return CompiledRuleSet(rule_set)
+
+
+def encode_categories(categories: Iterable[str]) -> np.ndarray:
+    """Map category names to the integer codes used by ``CompiledRuleSet.score_batch``."""
+
+    return np.fromiter(
+        (CATEGORY_CODES.get(category, UNKNOWN_CATEGORY_CODE) for category in categories),
+        dtype=np.intp,
+    )
+
+
+def load_rule_file(path: str) -> ScoringRuleFile:
+    """Read and validate a rule-set file; raises ``OSError`` or ``ValidationError``."""
+
+    with open(path, "rb") as rule_file:
+        return ScoringRuleFile.model_validate_json(rule_file.read())
+
+
+class LoadedRules:
+    """One immutable load of the rule file; swapped as a whole on reload."""
+
+    def __init__(
+        self,
+        rule_sets: Iterable[ScoringRuleSet],
+        active: str,
+        experiments: dict[str, float],
+        *,
+        source: str | None = None,
+        mtime: float | None = None,
+    ) -> None:
+        self.compiled = {rule_set.version: compile_rule_set(rule_set) for rule_set in rule_sets}
+        self.compiled.setdefault(DEFAULT_RULE_SET.version, compile_rule_set(DEFAULT_RULE_SET))
+        self.active = self.compiled[active]
+        self.experiments = experiments
+        self.source = source
+        self.mtime = mtime
+        self.loaded_at = datetime.now(timezone.utc)
+
+        # cumulative bucket bounds; vendors past the last bound use the active rule set
+        self.bounds: list[tuple[float, CompiledRuleSet]] = []
+        upper = 0.0
+        for version, share in experiments.items():
+            upper += share * EXPERIMENT_BUCKETS
+            self.bounds.append((upper, self.compiled[version]))
+
+
+def default_rules() -> LoadedRules:
+    return LoadedRules([DEFAULT_RULE_SET], DEFAULT_RULE_SET.version, {})
+
+
+class ScoringRuleRegistry:
+    """The compiled rule sets of this process, reloaded when ``SCORING_RULES_PATH`` changes.
+
+    The file's modification time is checked at most every
+    ``SCORING_RULES_RELOAD_SECONDS``; a file that fails validation is logged
+    and the previously loaded rules stay in effect.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._next_check = 0.0
+        self._loaded = default_rules()
+
+    def _refresh(self) -> LoadedRules:
+        if _monotonic() >= self._next_check:
+            self._check_for_changes()
+        return self._loaded
+
+    def _check_for_changes(self) -> None:
+        try:
+            self.reload(force=False)
+        except (OSError, ValidationError):
+            logger.exception("Keeping scoring rules %s: reload failed", self._loaded.active.version)
+
+    def reload(self, *, force: bool = True) -> bool:
+        """Load ``SCORING_RULES_PATH`` if it changed (or always with ``force``); returns whether it did."""
+
+        with self._lock:
+            settings = get_scoring_settings()
+            self._next_check = time.monotonic() + settings.rules_reload_seconds
+            path = settings.rules_path
+            if path is None:
+                if self._loaded.source is None and not force:
+                    return False
+                self._loaded = default_rules()
+                return True
+
+            mtime = os.stat(path).st_mtime
+            if not force and path == self._loaded.source and mtime == self._loaded.mtime:
+                return False
+            rule_file = load_rule_file(path)
+            self._loaded = LoadedRules(
+                rule_file.rule_sets, rule_file.active, rule_file.experiments, source=path, mtime=mtime
+            )
+            logger.info("Loaded scoring rules %s from %s", rule_file.active, path)
+            return True
+
+    def active(self) -> CompiledRuleSet:
+        if _monotonic() >= self._next_check:
+            self._check_for_changes()
+        return self._loaded.active
+
+    def get(self, version: str) -> CompiledRuleSet | None:
+        return self._refresh().compiled.get(version)
+
+    def for_vendor(self, vendor_id: UUID) -> CompiledRuleSet:
+        """The rule set scoring ``vendor_id``: an experiment's if its id bucket falls in one, else the active one."""
+
+        if _monotonic() >= self._next_check:
+            self._check_for_changes()
+        loaded = self._loaded
+        if loaded.bounds:
+            bucket = vendor_id.int % EXPERIMENT_BUCKETS
+            for upper, rules in loaded.bounds:
+                if bucket < upper:
+                    return rules
+        return loaded.active
+
+    def describe(self) -> ScoringRulesResponse:
+        loaded = self._refresh()
+        return ScoringRulesResponse(
+            active=loaded.active.version,
+            experiments=loaded.experiments,
+            versions=sorted(loaded.compiled),
+            source=loaded.source,
+            loaded_at=loaded.loaded_at,
+        )
+
+
+scoring_rules = ScoringRuleRegistry()
+
+
+def get_scoring_rules() -> ScoringRulesResponse:
+    return scoring_rules.describe()
+
+
+def reload_scoring_rules() -> ScoringRulesResponse:
+    """Reload the rule file now, reporting a missing or invalid file instead of keeping the old rules silently."""
+
+    try:
+        scoring_rules.reload()
+    except OSError as exc:
+        raise HTTPException(status_code=422, detail=f"Cannot read scoring rules: {exc}") from exc
+    except ValidationError as exc:
+        raise HTTPException(status_code=422, detail=f"Invalid scoring rules: {exc}") from exc
+    return scoring_rules.describe()
@@ -1,20 +1,32 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Collection, Iterable, Sequence
 from datetime import datetime, timezone
+from uuid import UUID
 
+import numpy as np
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import Row, Select, Update, bindparam, func, insert, or_, select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.models import VendorMetricModel, VendorModel, VendorScoreModel
+from src.schema import VendorScoreRecomputeSummary
+from src.services.metric_service import latest_metric_stmt
+from src.services.score_aggregate_service import decayed_metrics_stmt, rebuild_aggregates_stmt
+from src.services.score_rollup_service import refresh_rollups_after_recompute
+from src.services.scoring_rule_service import DEFAULT_RULE_SET, CompiledRuleSet, encode_categories, scoring_rules
+from src.utils.cache import invalidate_all_vendors, invalidate_vendors
+from src.utils.validate_db_url import get_job_settings, get_scoring_settings
 
-CATEGORY_WEIGHTS = {
-    "supplier": 1.0,
-    "distributor": 0.95,
-    "dealer": 0.9,
-    "manufacturer": 1.05,
-}
+# Category weights of the built-in v1 rule set.
+CATEGORY_WEIGHTS = {category.value: weight for category, weight in DEFAULT_RULE_SET.category_weights.items()}
+
+# Vendors scored per round trip in bulk recomputes; matches SQLAlchemy's
+# default insertmanyvalues page size so each chunk is a single INSERT.
+BULK_RECOMPUTE_CHUNK_SIZE = 1000
 
 
 def clamp_score(value: float) -> float:
@@ -23,44 +35,197 @@ def clamp_score(value: float) -> float:
     return max(0.0, min(100.0, value))
 
 
-def _complaint_penalty(complaints: int) -> float:
-    """Penalty curve for complaint counts."""
+def score_metric_values(
+    on_time_delivery_rate: float,
+    compliance_score: float,
+    complaint_count: float,
+    missing_documents: float,
+    category: str,
+    rules: CompiledRuleSet | None = None,
+) -> float:
+    """Compute a deterministic score from raw metric values with ``rules`` (default: the active rule set)."""
 
-    # 1 complaint = 1.25 penalty, maxing out at 20 complaints = 25 penalty
-    return min(complaints * 1.25, 25.0)
+    return (rules or scoring_rules.active()).score(
+        on_time_delivery_rate, compliance_score, complaint_count, missing_documents, category
+    )
 
 
-def _missing_docs_penalty(missing: bool) -> float:
-    return 10.0 if missing else 0.0
+def compute_score(metric: VendorMetricModel, vendor: VendorModel, rules: CompiledRuleSet | None = None) -> float:
+    """Compute a deterministic score for a given metric."""
 
+    return (rules or scoring_rules.active()).score(
+        metric.on_time_delivery_rate,
+        metric.compliance_score,
+        metric.complaint_count,
+        metric.missing_documents,
+        vendor.category,
+    )
+
+
+def compute_scores_batch(
+    on_time_delivery_rate: np.ndarray,
+    compliance_score: np.ndarray,
+    complaint_count: np.ndarray,
+    missing_documents: np.ndarray,
+    category_codes: np.ndarray,
+    rules: CompiledRuleSet | None = None,
+) -> np.ndarray:
+    """Vectorized ``score_metric_values`` over columnar inputs, bit-identical to the scalar path."""
+
+    return (rules or scoring_rules.active()).score_batch(
+        on_time_delivery_rate, compliance_score, complaint_count, missing_documents, category_codes
+    )
 
-def compute_score(metric: VendorMetricModel, vendor: VendorModel) -> float:
-    """Compute a deterministic score for a given metric."""
 
-    delivery_component = metric.on_time_delivery_rate * 0.45
-    compliance_component = metric.compliance_score * 0.4
-    reliability_component = max(0, 15 - _complaint_penalty(metric.complaint_count))
-    penalty_component = _missing_docs_penalty(metric.missing_documents)
+def score_rows(rows: Sequence[Row], assigned: Sequence[CompiledRuleSet]) -> list[float]:
+    """Batch-score metric-shaped rows, each with the rule set at the same position in ``assigned``."""
 
-    raw_score = delivery_component + compliance_component + reliability_component - penalty_component
-    weight = CATEGORY_WEIGHTS.get(vendor.category, 1.0)
+    columns = (
+        np.array([row.on_time_delivery_rate for row in rows], dtype=np.float64),
+        np.array([row.compliance_score for row in rows], dtype=np.float64),
+        np.array([row.complaint_count for row in rows], dtype=np.float64),
+        np.array([row.missing_documents for row in rows], dtype=np.float64),
+        encode_categories(row.category for row in rows),
+    )
+    rule_sets = set(assigned)
+    if len(rule_sets) == 1:
+        return rule_sets.pop().score_batch(*columns).tolist()
 
-    return clamp_score(raw_score * weight)
+    scores = np.empty(len(rows), dtype=np.float64)
+    for rules in rule_sets:
+        mask = np.fromiter((candidate is rules for candidate in assigned), dtype=bool, count=len(rows))
+        scores[mask] = rules.score_batch(*(column[mask] for column in columns))
+    return scores.tolist()
 
 
-def record_score_snapshot(session: Session, vendor: VendorModel, score_value: float) -> VendorScoreModel:
-    """Record a recent score calculated for a vendor."""
+def build_score_snapshot(vendor: VendorModel, score_value: float, scoring_version: str | None = None) -> VendorScoreModel:
+    """Build an unsaved score snapshot stamped with the current time and the rule set that produced it."""
 
-    snapshot = VendorScoreModel(
+    return VendorScoreModel(
         vendor_id=vendor.id,
         calculated_at=datetime.now(timezone.utc),
         score=score_value,
+        scoring_version=scoring_version or scoring_rules.active().version,
     )
 
+
+def vendor_latest_score_stmt() -> Update:
+    """UPDATE copying a snapshot onto ``vendors.latest_score``, for executemany use.
+
+    Parameters are ``b_vendor_id``, ``b_score`` and ``b_calculated_at`` plus the
+    scoring watermark ``b_metric_id``, ``b_metric_timestamp``, ``b_category`` and
+    ``b_scoring_version`` (NULLs keep the previous watermark). Older snapshots never
+    overwrite newer ones, and ``updated_at`` is pinned to itself so a rescore
+    is not mistaken for a profile edit.
+    """
+
+    vendors = VendorModel.__table__
+    return (
+        update(vendors)
+        .where(vendors.c.id == bindparam("b_vendor_id"))
+        .where(
+            or_(
+                vendors.c.latest_scored_at.is_(None),
+                vendors.c.latest_scored_at <= bindparam("b_calculated_at"),
+            )
+        )
+        .values(
+            latest_score=bindparam("b_score"),
+            latest_scored_at=bindparam("b_calculated_at"),
+            last_scored_metric_id=func.coalesce(bindparam("b_metric_id"), vendors.c.last_scored_metric_id),
+            last_scored_metric_at=func.coalesce(bindparam("b_metric_timestamp"), vendors.c.last_scored_metric_at),
+            last_scored_category=func.coalesce(bindparam("b_category"), vendors.c.last_scored_category),
+            last_scored_version=func.coalesce(bindparam("b_scoring_version"), vendors.c.last_scored_version),
+            updated_at=vendors.c.updated_at,
+        )
+    )
+
+
+def latest_score_params(snapshots: Iterable[dict]) -> list[dict]:
+    """Map snapshot rows, optionally carrying a ``scoring_watermark``, onto ``vendor_latest_score_stmt`` parameters."""
+
+    return [
+        {
+            "b_vendor_id": snapshot["vendor_id"],
+            "b_score": snapshot["score"],
+            "b_calculated_at": snapshot["calculated_at"],
+            "b_metric_id": snapshot.get("metric_id"),
+            "b_metric_timestamp": snapshot.get("metric_timestamp"),
+            "b_category": snapshot.get("category"),
+            "b_scoring_version": snapshot.get("scoring_version"),
+        }
+        for snapshot in snapshots
+    ]
+
+
+def scoring_watermark(metric_id: UUID, metric_timestamp: datetime, category: str) -> dict:
+    """What a score was computed from; a vendor is only rescored once this changes."""
+
+    return {"metric_id": metric_id, "metric_timestamp": metric_timestamp, "category": category}
+
+
+def metric_watermark(vendor: VendorModel, metric: VendorMetricModel | None) -> dict | None:
+    """``scoring_watermark`` of a score computed from ``metric``, if any."""
+
+    if metric is None:
+        return None
+    return scoring_watermark(metric.id, metric.timestamp, vendor.category)
+
+
+def sync_vendor_latest_score(vendor: VendorModel, snapshot: VendorScoreModel, watermark: dict | None = None) -> None:
+    """Reflect a recorded snapshot on an in-session vendor without marking it dirty."""
+
+    set_committed_value(vendor, "latest_score", snapshot.score)
+    set_committed_value(vendor, "latest_scored_at", snapshot.calculated_at)
+    set_committed_value(vendor, "last_scored_version", snapshot.scoring_version)
+    if watermark is not None:
+        set_committed_value(vendor, "last_scored_metric_id", watermark["metric_id"])
+        set_committed_value(vendor, "last_scored_metric_at", watermark["metric_timestamp"])
+        set_committed_value(vendor, "last_scored_category", watermark["category"])
+
+
+def snapshot_params(vendor: VendorModel, snapshot: VendorScoreModel, watermark: dict | None = None) -> dict:
+    """Snapshot of a single vendor as a ``latest_score_params`` input."""
+
+    params = {
+        "vendor_id": vendor.id,
+        "score": snapshot.score,
+        "calculated_at": snapshot.calculated_at,
+        "scoring_version": snapshot.scoring_version,
+    }
+    if watermark is not None:
+        params.update(watermark)
+    return params
+
+
+def record_score_snapshot(
+    session: Session,
+    vendor: VendorModel,
+    score_value: float,
+    *,
+    metric: VendorMetricModel | None = None,
+    watermark: dict | None = None,
+    scoring_version: str | None = None,
+) -> VendorScoreModel:
+    """Record a recent score calculated for a vendor and make it the vendor's current score.
+
+    ``metric`` is the metric the score was computed from; when given it
+    becomes the vendor's scoring watermark for incremental recomputes.
+    Decayed scores pass their ``scoring_watermark`` directly instead.
+    ``scoring_version`` names the rule set used, by default the active one.
+    """
+
+    snapshot = build_score_snapshot(vendor, score_value, scoring_version)
+    watermark = watermark or metric_watermark(vendor, metric)
+    params = snapshot_params(vendor, snapshot, watermark)
+
     try:
         session.add(snapshot)
+        session.execute(vendor_latest_score_stmt(), latest_score_params([params]))
         session.commit()
+        invalidate_vendors(vendor.id)
         session.refresh(snapshot)
+        sync_vendor_latest_score(vendor, snapshot, watermark)
         return snapshot
 
     except SQLAlchemyError as exc:
@@ -69,17 +234,13 @@ def record_score_snapshot(session: Session, vendor: VendorModel, score_value: fl
 
 
 def recompute_latest_score(session: Session, vendor: VendorModel) -> VendorScoreModel | None:
-    """Recompute the score using the most recent vendor metric."""
+    """Recompute the score using the most recent vendor metric, or the decayed history in decayed mode."""
 
-    metric_stmt = (
-        select(VendorMetricModel)
-        .where(VendorMetricModel.vendor_id == vendor.id)
-        .order_by(VendorMetricModel.timestamp.desc())
-        .limit(1)
-    )
+    if get_scoring_settings().mode == "decayed":
+        return recompute_decayed_score(session, vendor)
 
     try:
-        metric = session.execute(metric_stmt).scalars().first()
+        metric = session.execute(latest_metric_stmt(vendor.id)).scalars().first()
 
     except SQLAlchemyError as exc:
         raise HTTPException(status_code=500, detail="Failed to fetch vendor metrics for scoring.") from exc
@@ -87,21 +248,275 @@ def recompute_latest_score(session: Session, vendor: VendorModel) -> VendorScore
     if metric is None:      # Handle case where no metrics exist for the vendor
         return None
 
-    score_value = compute_score(metric, vendor)
-    return record_score_snapshot(session, vendor, score_value)
+    rules = scoring_rules.for_vendor(vendor.id)
+    score_value = compute_score(metric, vendor, rules)
+    return record_score_snapshot(session, vendor, score_value, metric=metric, scoring_version=rules.version)
+
+
+def recompute_decayed_score(session: Session, vendor: VendorModel) -> VendorScoreModel | None:
+    """Recompute the score from the vendor's running decayed aggregate."""
+
+    try:
+        session.execute(rebuild_aggregates_stmt(vendor_ids=[vendor.id], stale_only=True))
+        row = session.execute(decayed_metrics_stmt(vendor_ids=[vendor.id])).first()
+
+    except SQLAlchemyError as exc:
+        session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to fetch vendor metrics for scoring.") from exc
+
+    if row is None:
+        return None
+
+    rules = scoring_rules.for_vendor(vendor.id)
+    score_value = rules.score(
+        row.on_time_delivery_rate, row.compliance_score, row.complaint_count, row.missing_documents, row.category
+    )
+    watermark = scoring_watermark(row.metric_id, row.metric_timestamp, row.category)
+    return record_score_snapshot(session, vendor, score_value, watermark=watermark, scoring_version=rules.version)
+
+
+def latest_metrics_stmt(
+    *,
+    after: UUID | None = None,
+    before: UUID | None = None,
+    vendor_ids: Collection[UUID] | None = None,
+    limit: int | None = None,
+) -> Select:
+    """Select the newest metric of every vendor in one pass, ordered by vendor id.
+
+    Uses ``DISTINCT ON (vendor_id)`` so Postgres resolves "latest metric per
+    vendor" set-based; ``after`` allows keyset iteration over vendor ids and
+    ``before`` caps the range (exclusive) for sharded runs.
+    """
+
+    stmt = (
+        select(
+            VendorMetricModel.vendor_id,
+            VendorMetricModel.on_time_delivery_rate,
+            VendorMetricModel.compliance_score,
+            VendorMetricModel.complaint_count,
+            VendorMetricModel.missing_documents,
+            VendorModel.category,
+            VendorMetricModel.id.label("metric_id"),
+            VendorMetricModel.timestamp.label("metric_timestamp"),
+            VendorModel.last_scored_metric_id,
+            VendorModel.last_scored_category,
+            VendorModel.last_scored_version,
+        )
+        .join(VendorModel, VendorModel.id == VendorMetricModel.vendor_id)
+        .distinct(VendorMetricModel.vendor_id)
+        .order_by(VendorMetricModel.vendor_id, VendorMetricModel.timestamp.desc())
+    )
+    if after is not None:
+        stmt = stmt.where(VendorMetricModel.vendor_id > after)
+    if before is not None:
+        stmt = stmt.where(VendorMetricModel.vendor_id < before)
+    if vendor_ids is not None:
+        stmt = stmt.where(VendorMetricModel.vendor_id.in_(vendor_ids))
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def scoring_inputs_stmt(
+    *,
+    after: UUID | None = None,
+    before: UUID | None = None,
+    vendor_ids: Collection[UUID] | None = None,
+    limit: int | None = None,
+) -> Select:
+    """``latest_metrics_stmt`` or ``decayed_metrics_stmt``, depending on ``SCORING_MODE``."""
+
+    if get_scoring_settings().mode == "decayed":
+        return decayed_metrics_stmt(after=after, before=before, vendor_ids=vendor_ids, limit=limit)
+    return latest_metrics_stmt(after=after, before=before, vendor_ids=vendor_ids, limit=limit)
+
+
+def prepare_scoring_inputs(
+    session: Session,
+    *,
+    after: UUID | None = None,
+    before: UUID | None = None,
+    vendor_ids: Collection[UUID] | None = None,
+) -> None:
+    """In decayed mode, build the aggregates missing or stale for a vendor range before it is scored."""
+
+    if get_scoring_settings().mode == "decayed":
+        session.execute(rebuild_aggregates_stmt(after=after, before=before, vendor_ids=vendor_ids, stale_only=True))
+
+
+def score_snapshot_rows(
+    rows: Sequence[Row], calculated_at: datetime, assigned: Sequence[CompiledRuleSet] | None = None
+) -> list[dict]:
+    """Score rows from ``scoring_inputs_stmt`` into insertable snapshot dicts.
+
+    ``assigned`` holds each row's rule set, by default ``scoring_rules.for_vendor``.
+    """
+
+    if assigned is None:
+        assigned = [scoring_rules.for_vendor(row.vendor_id) for row in rows]
+    return [
+        {"vendor_id": row.vendor_id, "calculated_at": calculated_at, "score": score, "scoring_version": rules.version}
+        for row, rules, score in zip(rows, assigned, score_rows(rows, assigned))
+    ]
+
+
+def needs_rescore(row: Row, rules: CompiledRuleSet) -> bool:
+    """Whether a ``scoring_inputs_stmt`` row differs from the vendor's scoring watermark under ``rules``."""
+
+    return (
+        row.metric_id != row.last_scored_metric_id
+        or row.category != row.last_scored_category
+        or rules.version != row.last_scored_version
+    )
+
+
+def plan_score_chunk(rows: Sequence[Row], calculated_at: datetime, *, force: bool = False) -> tuple[list[dict], list[dict]]:
+    """Snapshot rows and ``vendors`` update parameters for a chunk.
+
+    Vendors whose latest metric, category and assigned rule set match their
+    watermark are left out unless ``force`` is set.
+    """
+
+    planned = [(row, scoring_rules.for_vendor(row.vendor_id)) for row in rows]
+    if not force:
+        planned = [(row, rules) for row, rules in planned if needs_rescore(row, rules)]
+    if not planned:
+        return [], []
+
+    changed = [row for row, _ in planned]
+    snapshots = score_snapshot_rows(changed, calculated_at, [rules for _, rules in planned])
+    params = latest_score_params(
+        {**snapshot, **scoring_watermark(row.metric_id, row.metric_timestamp, row.category)}
+        for snapshot, row in zip(snapshots, changed)
+    )
+    return snapshots, params
 
 
-def recompute_all_vendor_scores(session: Session) -> int:
-    """Recalculate scores for all vendors; returns number of processed vendors."""
+def recompute_summary(recomputed: int, skipped: int, started: float) -> VendorScoreRecomputeSummary:
+    """Build a recompute summary with throughput measured from ``started``."""
+
+    duration = time.perf_counter() - started
+    processed = recomputed + skipped
+    return VendorScoreRecomputeSummary(
+        processed_vendors=processed,
+        recomputed_vendors=recomputed,
+        skipped_vendors=skipped,
+        duration_seconds=round(duration, 6),
+        rows_per_second=round(processed / duration, 2) if duration > 0 else 0.0,
+    )
+
+
+def recompute_score_chunk(
+    session: Session,
+    *,
+    calculated_at: datetime,
+    after: UUID | None = None,
+    before: UUID | None = None,
+    vendor_ids: Collection[UUID] | None = None,
+    limit: int = BULK_RECOMPUTE_CHUNK_SIZE,
+    force: bool = False,
+) -> tuple[int, int, UUID | None]:
+    """Score the next chunk of vendors and insert their snapshots without committing.
+
+    Returns the number of snapshots written, the number of unchanged vendors
+    skipped and the last vendor id seen, which is the keyset cursor for the
+    following chunk (``None`` once exhausted).
+    """
+
+    rows = session.execute(
+        scoring_inputs_stmt(after=after, before=before, vendor_ids=vendor_ids, limit=limit)
+    ).all()
+    if not rows:
+        return 0, 0, None
+
+    snapshots, params = plan_score_chunk(rows, calculated_at, force=force)
+    if snapshots:
+        session.execute(insert(VendorScoreModel), snapshots)
+        session.execute(vendor_latest_score_stmt(), params)
+    return len(snapshots), len(rows) - len(snapshots), rows[-1].vendor_id
+
+
+def recompute_vendor_scores_in_transaction(
+    session: Session,
+    *,
+    calculated_at: datetime,
+    vendor_ids: Collection[UUID] | None = None,
+    chunk_size: int = BULK_RECOMPUTE_CHUNK_SIZE,
+    force: bool = False,
+) -> tuple[int, int]:
+    """Walk every chunk of vendors and write their snapshots, leaving the commit to the caller.
+
+    Returns ``(recomputed, skipped)`` vendor counts.
+    """
+
+    prepare_scoring_inputs(session, vendor_ids=vendor_ids)
+    recomputed = skipped = 0
+    cursor: UUID | None = None
+    while True:
+        written, unchanged, cursor = recompute_score_chunk(
+            session,
+            calculated_at=calculated_at,
+            after=cursor,
+            vendor_ids=vendor_ids,
+            limit=chunk_size,
+            force=force,
+        )
+        recomputed += written
+        skipped += unchanged
+        if cursor is None or written + unchanged < chunk_size:
+            return recomputed, skipped
+
+
+def bulk_recompute_vendor_scores(
+    session: Session,
+    *,
+    vendor_ids: Collection[UUID] | None = None,
+    chunk_size: int = BULK_RECOMPUTE_CHUNK_SIZE,
+    force: bool = False,
+) -> VendorScoreRecomputeSummary:
+    """Recompute scores set-based in chunks and commit every snapshot in one transaction.
+
+    Only vendors with new scoring inputs or a changed category get a new
+    snapshot unless ``force`` is set. The score rollups are refreshed afterwards.
+    """
+
+    started = time.perf_counter()
 
     try:
-        vendors = session.execute(select(VendorModel)).scalars().all()
+        recomputed, skipped = recompute_vendor_scores_in_transaction(
+            session,
+            calculated_at=datetime.now(timezone.utc),
+            vendor_ids=vendor_ids,
+            chunk_size=chunk_size,
+            force=force,
+        )
+        session.commit()
 
     except SQLAlchemyError as exc:
-        raise HTTPException(status_code=500, detail="Failed to load vendors for score recomputation.") from exc
+        session.rollback()
+        raise HTTPException(status_code=500, detail="Failed to recompute vendor scores.") from exc
+
+    if vendor_ids is None:
+        invalidate_all_vendors()
+    else:
+        invalidate_vendors(*vendor_ids)
+    if recomputed:
+        refresh_rollups_after_recompute(session)
+
+    return recompute_summary(recomputed, skipped, started)
+
+
+def recompute_all_vendor_scores(session: Session, *, force: bool = False, parallelism: int | None = None) -> int:
+    """Recalculate scores for all vendors; returns number of processed vendors.
+
+    With ``parallelism`` above 1 (default ``JOBS_RECOMPUTE_PARALLELISM``) the
+    vendors are split across that many worker processes instead.
+    """
+
+    parallelism = parallelism or get_job_settings().recompute_parallelism
+    if parallelism > 1:
+        from src.services.parallel_recompute_service import parallel_recompute_vendor_scores
 
-    processed = 0
-    for vendor in vendors:
-        if recompute_latest_score(session, vendor):
-            processed += 1
-    return processed
\ No newline at end of file
+        return parallel_recompute_vendor_scores(parallelism=parallelism, force=force).processed_vendors
+    return bulk_recompute_vendor_scores(session, force=force).processed_vendors
\ No newline at end of file
@@ -1,15 +1,31 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
+from datetime import datetime
 from fastapi import HTTPException
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import ColumnElement, Select, any_, bindparam, func, select, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from src.models import VendorModel, VendorScoreModel
-from src.schema import VendorCreate, VendorUpdate
+from src.schema import (
+    VendorBatchGetItem,
+    VendorBatchGetResponse,
+    VendorCreate,
+    VendorListResponse,
+    VendorScoreRow,
+    VendorUpdate,
+)
+from src.utils.cache import invalidate_vendors, vendor_cache
+from src.utils.cursor import encode_score_cursor, encode_vendor_cursor
+from src.utils.validate_vendor import ensure_vendor_exists, vendor_to_response
+
+SCORE_ROWS_ADAPTER = TypeAdapter(list[VendorScoreRow])
 
 
 def create_vendor(session: Session, payload: VendorCreate) -> VendorModel:
@@ -30,16 +46,22 @@ def create_vendor(session: Session, payload: VendorCreate) -> VendorModel:
         raise HTTPException(status_code=500, detail="Failed to create vendor.") from exc
 
 
-def update_vendor(session: Session, vendor: VendorModel, payload: VendorUpdate) -> VendorModel:
-    """Apply updates to an existing vendor."""
+def apply_vendor_update(vendor: VendorModel, payload: VendorUpdate) -> None:
+    """Copy the fields set on an update payload onto a vendor."""
     if payload.name is not None:
         vendor.name = payload.name
     if payload.category is not None:
         vendor.category = payload.category.value
 
+
+def update_vendor(session: Session, vendor: VendorModel, payload: VendorUpdate) -> VendorModel:
+    """Apply updates to an existing vendor."""
+    apply_vendor_update(vendor, payload)
+
     try:
         session.add(vendor)
         session.commit()
+        invalidate_vendors(vendor.id)
         session.refresh(vendor)
         return vendor
     
@@ -48,32 +70,301 @@ def update_vendor(session: Session, vendor: VendorModel, payload: VendorUpdate)
         raise HTTPException(status_code=500, detail="Failed to update vendor.") from exc
 
 
-def get_vendor_latest_score(session: Session, vendor_id: UUID) -> Optional[VendorScoreModel]:
-    """Return the most recent score for a vendor."""
-    stmt = (
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards and the backslash escape character so user input matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def vendors_stmt(
+    *,
+    limit: int,
+    after: tuple[str, UUID] | None = None,
+    category: str | None = None,
+    name_prefix: str | None = None,
+    search: str | None = None,
+    min_score: float | None = None,
+    max_score: float | None = None,
+) -> Select:
+    """Select a page of vendors ordered by ``(name, id)``.
+
+    ``after`` is a keyset position ``(name, id)``. ``name_prefix`` and
+    ``search`` match ``lower(name)`` case-insensitively as a prefix and a
+    substring, backed by the prefix and trigram indexes. The score filters
+    read the denormalized ``vendors.latest_score``, so no score rows are
+    joined; vendors never scored are left out by either bound.
+    """
+    stmt = select(VendorModel).order_by(VendorModel.name, VendorModel.id)
+    if after is not None:
+        stmt = stmt.where(tuple_(VendorModel.name, VendorModel.id) > tuple_(*after))
+    if category is not None:
+        stmt = stmt.where(VendorModel.category == category)
+    if name_prefix:
+        stmt = stmt.where(func.lower(VendorModel.name).like(f"{escape_like(name_prefix.lower())}%", escape="\\"))
+    if search:
+        stmt = stmt.where(func.lower(VendorModel.name).like(f"%{escape_like(search.lower())}%", escape="\\"))
+    if min_score is not None:
+        stmt = stmt.where(VendorModel.latest_score >= min_score)
+    if max_score is not None:
+        stmt = stmt.where(VendorModel.latest_score <= max_score)
+    return stmt.limit(limit)
+
+
+def build_vendor_page(vendors: list[VendorModel], limit: int) -> VendorListResponse:
+    """Turn up to ``limit + 1`` vendors into a page; the extra row only signals a next page."""
+    next_cursor = None
+    if len(vendors) > limit:
+        vendors = vendors[:limit]
+        next_cursor = encode_vendor_cursor(vendors[-1].name, vendors[-1].id)
+
+    return VendorListResponse(
+        items=[vendor_to_response(vendor) for vendor in vendors],
+        count=len(vendors),
+        next_cursor=next_cursor,
+    )
+
+
+def list_vendors(
+    session: Session,
+    *,
+    limit: int = 50,
+    after: tuple[str, UUID] | None = None,
+    category: str | None = None,
+    name_prefix: str | None = None,
+    search: str | None = None,
+    min_score: float | None = None,
+    max_score: float | None = None,
+) -> VendorListResponse:
+    """Return one page of vendors with their latest scores in a single query."""
+    stmt = vendors_stmt(
+        limit=limit + 1,
+        after=after,
+        category=category,
+        name_prefix=name_prefix,
+        search=search,
+        min_score=min_score,
+        max_score=max_score,
+    )
+    try:
+        vendors = list(session.execute(stmt).scalars())
+
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=500, detail="Failed to list vendors.") from exc
+
+    return build_vendor_page(vendors, limit)
+
+
+def vendors_by_ids_stmt(vendor_ids: Sequence[UUID]) -> Select:
+    """Select the given vendors, latest scores included, as ``id = ANY(:vendor_ids)``.
+
+    One array parameter instead of an expanded ``IN`` list keeps the statement
+    text (and its prepared plan) the same for any number of ids.
+    """
+    ids = bindparam("vendor_ids", list(dict.fromkeys(vendor_ids)), type_=ARRAY(PG_UUID(as_uuid=True)))
+    return select(VendorModel).where(VendorModel.id == any_(ids))
+
+
+def build_batch_get_response(vendor_ids: Sequence[UUID], vendors: Iterable[VendorModel]) -> VendorBatchGetResponse:
+    """Answer every requested id in request order, with explicit not-found entries."""
+    found = {vendor.id: vendor_to_response(vendor) for vendor in vendors}
+    items = [
+        VendorBatchGetItem(id=vendor_id, found=vendor_id in found, vendor=found.get(vendor_id))
+        for vendor_id in vendor_ids
+    ]
+    hits = sum(item.found for item in items)
+    return VendorBatchGetResponse(items=items, found=hits, not_found=len(items) - hits)
+
+
+def batch_get_vendors(session: Session, vendor_ids: Sequence[UUID]) -> VendorBatchGetResponse:
+    """Resolve many vendors and their latest scores with a single query."""
+    try:
+        vendors = session.execute(vendors_by_ids_stmt(vendor_ids)).scalars().all()
+
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=500, detail="Failed to fetch vendors.") from exc
+
+    return build_batch_get_response(vendor_ids, vendors)
+
+
+def replayed_scores_clause(replayed: bool) -> ColumnElement:
+    """Scores written by score replays, or with ``replayed=False`` the live history."""
+    return VendorScoreModel.replay_id.is_not(None) if replayed else VendorScoreModel.replay_id.is_(None)
+
+
+def latest_score_stmt(vendor_id: UUID) -> Select:
+    """Select the most recent live score snapshot for a vendor."""
+    return (
         select(VendorScoreModel)
         .where(VendorScoreModel.vendor_id == vendor_id)
+        .where(replayed_scores_clause(False))
         .order_by(VendorScoreModel.calculated_at.desc())
         .limit(1)
     )
+
+
+def vendor_scores_stmt(
+    vendor_id: UUID,
+    *,
+    limit: int,
+    offset: int = 0,
+    after: tuple[datetime, UUID] | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    scoring_version: str | None = None,
+    replayed: bool = False,
+) -> Select:
+    """Select a page of a vendor's score history, newest first.
+
+    ``after`` is a keyset position ``(calculated_at, id)``: the page starts just
+    past it, so deep pages cost the same as the first. ``start`` is inclusive
+    and ``end`` exclusive. ``scoring_version`` limits the page to one version.
+    The live history is returned unless ``replayed`` asks for the scores
+    written by score replays instead; the two are never mixed.
+    """
+    stmt = (
+        select(VendorScoreModel)
+        .where(VendorScoreModel.vendor_id == vendor_id)
+        .where(replayed_scores_clause(replayed))
+        .order_by(VendorScoreModel.calculated_at.desc(), VendorScoreModel.id.desc())
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(VendorScoreModel.calculated_at, VendorScoreModel.id) < tuple_(*after))
+    if start is not None:
+        stmt = stmt.where(VendorScoreModel.calculated_at >= start)
+    if end is not None:
+        stmt = stmt.where(VendorScoreModel.calculated_at < end)
+    if scoring_version is not None:
+        stmt = stmt.where(VendorScoreModel.scoring_version == scoring_version)
+    if offset:
+        stmt = stmt.offset(offset)
+    return stmt.limit(limit)
+
+
+def get_vendor_latest_score(session: Session, vendor_id: UUID) -> Optional[VendorScoreModel]:
+    """Return the most recent score for a vendor."""
     try:
-        return session.execute(stmt).scalars().first()
+        return session.execute(latest_score_stmt(vendor_id)).scalars().first()
     
     except SQLAlchemyError as exc:
         raise HTTPException(status_code=500, detail="Failed to fetch latest vendor score.") from exc
 
 
-def list_vendor_scores(session: Session, vendor_id: UUID, *, limit: int = 10, offset: int = 0) -> list[VendorScoreModel]:
+def list_vendor_scores(
+    session: Session,
+    vendor_id: UUID,
+    *,
+    limit: int = 10,
+    offset: int = 0,
+    after: tuple[datetime, UUID] | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    scoring_version: str | None = None,
+    replayed: bool = False,
+) -> list[VendorScoreModel]:
     """Return list of vendor score history."""
-    stmt = (
-        select(VendorScoreModel)
-        .where(VendorScoreModel.vendor_id == vendor_id)
-        .order_by(VendorScoreModel.calculated_at.desc())
-        .offset(offset)
-        .limit(limit)
+    stmt = vendor_scores_stmt(
+        vendor_id,
+        limit=limit,
+        offset=offset,
+        after=after,
+        start=start,
+        end=end,
+        scoring_version=scoring_version,
+        replayed=replayed,
     )
     try:
         return list(session.execute(stmt).scalars().all())
     
     except SQLAlchemyError as exc:
-        raise HTTPException(status_code=500, detail="Failed to fetch vendor score history.") from exc
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to fetch vendor score history.") from exc
+
+
+def score_rows_stmt(
+    vendor_id: UUID,
+    *,
+    limit: int,
+    offset: int = 0,
+    after: tuple[datetime, UUID] | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    scoring_version: str | None = None,
+    replayed: bool = False,
+) -> Select:
+    """``vendor_scores_stmt`` selecting just the response columns, as plain rows."""
+    return vendor_scores_stmt(
+        vendor_id,
+        limit=limit,
+        offset=offset,
+        after=after,
+        start=start,
+        end=end,
+        scoring_version=scoring_version,
+        replayed=replayed,
+    ).with_only_columns(
+        VendorScoreModel.id,
+        VendorScoreModel.vendor_id,
+        VendorScoreModel.calculated_at,
+        VendorScoreModel.score,
+        VendorScoreModel.scoring_version,
+    )
+
+
+def build_score_page_json(rows: Sequence, limit: int) -> bytes:
+    """Serialize up to ``limit + 1`` score rows as ``<next_cursor>\\n<items JSON>``.
+
+    The rows come straight from the database, which already enforces the score
+    bounds, so they are dumped without building ``VendorScoreResponse`` models.
+    """
+    next_cursor = b""
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_score_cursor(rows[-1].calculated_at, rows[-1].id).encode()
+    return next_cursor + b"\n" + SCORE_ROWS_ADAPTER.dump_json([row._asdict() for row in rows])
+
+
+def split_score_page_json(page: bytes) -> tuple[bytes, Optional[str]]:
+    """Undo ``build_score_page_json``: the items JSON array and the next cursor, if any."""
+    next_cursor, _, items = page.partition(b"\n")
+    return items, next_cursor.decode() or None
+
+
+def get_vendor_score_page_json(
+    session: Session,
+    vendor_id: UUID,
+    *,
+    limit: int = 10,
+    offset: int = 0,
+    after: tuple[datetime, UUID] | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    scoring_version: str | None = None,
+    replayed: bool = False,
+) -> tuple[bytes, Optional[str]]:
+    """Return a page of score history as response-ready JSON bytes plus the next cursor.
+
+    Misses select column tuples and serialize them once; hits return the cached
+    bytes untouched. Either way no Pydantic model is built or validated.
+    """
+
+    def load() -> bytes:
+        ensure_vendor_exists(session, vendor_id)
+        stmt = score_rows_stmt(
+            vendor_id,
+            limit=limit + 1,
+            offset=offset,
+            after=after,
+            start=start,
+            end=end,
+            scoring_version=scoring_version,
+            replayed=replayed,
+        )
+        try:
+            rows = session.execute(stmt).all()
+
+        except SQLAlchemyError as exc:
+            raise HTTPException(status_code=500, detail="Failed to fetch vendor score history.") from exc
+        return build_score_page_json(rows, limit)
+
+    page = vendor_cache.get_or_load_raw(
+        "score-page", vendor_id, load, limit, offset, after, start, end, scoring_version, replayed
+    )
+    return split_score_page_json(page)
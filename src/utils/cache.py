@@ -0,0 +1,520 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Sequence
+from typing import Any, Generic, Optional, TypeVar
+from uuid import UUID
+
+from pydantic import TypeAdapter
+
+from src.schema import CacheStats
+from src.utils.validate_db_url import CacheSettings, get_cache_settings
+
+V = TypeVar("V")
+T = TypeVar("T")
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe LRU cache whose entries also expire ``ttl`` seconds after being stored.
+
+    ``maxsize`` bounds memory: storing past it evicts the least recently used
+    entry. Every ``invalidate``/``clear`` bumps an epoch; a value loaded before
+    an invalidation is dropped by ``set`` instead of resurrecting stale data.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def epoch(self) -> int:
+        """Token to pass to ``set`` for a value about to be loaded."""
+        return self._epoch
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self, key: Hashable, value: V, *, epoch: Optional[int] = None, ttl: Optional[float] = None
+    ) -> bool:
+        """Store ``value``; returns False when an invalidation happened since ``epoch``."""
+        if self.maxsize <= 0:
+            return False
+
+        with self._lock:
+            if epoch is not None and epoch != self._epoch:
+                return False
+
+            self._entries[key] = (self._clock() + (self.ttl if ttl is None else ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def invalidate(self, keys: Iterable[Hashable]) -> None:
+        with self._lock:
+            self._epoch += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                backend="memory",
+                size=len(self._entries),
+                maxsize=self.maxsize,
+                ttl_seconds=self.ttl,
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                expirations=self.expirations,
+            )
+
+
+class ExpiringCounters:
+    """Thread-safe integer counters that expire ``ttl`` seconds after their last increment.
+
+    Unlike ``TTLCache`` there is no size bound: a counter is never dropped
+    before it expires, so it cannot restart at a number entries are still
+    cached under. Expired counters are swept at most once per ``sweep_interval``,
+    keeping memory at the counters bumped within one ttl.
+    """
+
+    def __init__(self, sweep_interval: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.sweep_interval = sweep_interval
+        self._clock = clock
+        self._counters: dict[Hashable, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+        self._next_sweep = clock() + sweep_interval
+
+    def get(self, key: Hashable) -> Optional[int]:
+        with self._lock:
+            entry = self._counters.get(key)
+            if entry is None or entry[0] <= self._clock():
+                return None
+            return entry[1]
+
+    def increment(self, key: Hashable, *, ttl: float) -> int:
+        """Add one to a counter (missing or expired counts as 0) and return it."""
+        with self._lock:
+            now = self._clock()
+            if now >= self._next_sweep:
+                self._counters = {k: entry for k, entry in self._counters.items() if entry[0] > now}
+                self._next_sweep = now + self.sweep_interval
+            entry = self._counters.get(key)
+            value = (entry[1] if entry is not None and entry[0] > now else 0) + 1
+            self._counters[key] = (now + ttl, value)
+            return value
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+
+class CacheBackend(ABC):
+    """Byte-valued key/value store shared by the read-through caches.
+
+    The ``a``-prefixed methods are the event-loop friendly twins used by the
+    async routers; backends without real I/O simply delegate to the sync ones.
+    """
+
+    name: str
+
+    @abstractmethod
+    def get_many(self, keys: Sequence[str]) -> list[Optional[bytes]]: ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    @abstractmethod
+    def increment(self, keys: Sequence[str], ttl: float) -> None: ...
+
+    async def aget_many(self, keys: Sequence[str]) -> list[Optional[bytes]]:
+        return self.get_many(keys)
+
+    async def aset(self, key: str, value: bytes, ttl: float) -> None:
+        self.set(key, value, ttl)
+
+    async def aincrement(self, keys: Sequence[str], ttl: float) -> None:
+        self.increment(keys, ttl)
+
+    def stats(self) -> dict[str, Any]:
+        return {}
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Per-process backend on top of ``TTLCache``; only valid with a single worker."""
+
+    name = "memory"
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.entries: TTLCache[bytes] = TTLCache(maxsize, ttl)
+        # Counters live apart and unbounded: evicting one would restart a
+        # version at a number stale entries are still cached under.
+        self.counters = ExpiringCounters(ttl)
+
+    def get_many(self, keys: Sequence[str]) -> list[Optional[bytes]]:
+        values = []
+        for key in keys:
+            counter = self.counters.get(key)
+            values.append(self.entries.get(key) if counter is None else str(counter).encode())
+        return values
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.entries.set(key, value, ttl=ttl)
+
+    def increment(self, keys: Sequence[str], ttl: float) -> None:
+        for key in keys:
+            self.counters.increment(key, ttl=ttl)
+
+    def stats(self) -> dict[str, Any]:
+        stats = self.entries.stats()
+        return stats.model_dump(include={"size", "maxsize", "evictions", "expirations"})
+
+
+class RedisCacheBackend(CacheBackend):
+    """Backend speaking the Redis protocol, shared by every worker pointed at it."""
+
+    name = "redis"
+
+    def __init__(self, client: Any, async_client: Any) -> None:
+        self.client = client
+        self.async_client = async_client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheBackend":
+        import redis
+        import redis.asyncio
+
+        return cls(redis.Redis.from_url(url), redis.asyncio.Redis.from_url(url))
+
+    def get_many(self, keys: Sequence[str]) -> list[Optional[bytes]]:
+        return self.client.mget(keys)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.client.set(key, value, px=int(ttl * 1000))
+
+    def increment(self, keys: Sequence[str], ttl: float) -> None:
+        with self.client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.incr(key)
+                pipe.pexpire(key, int(ttl * 1000))
+            pipe.execute()
+
+    async def aget_many(self, keys: Sequence[str]) -> list[Optional[bytes]]:
+        return await self.async_client.mget(keys)
+
+    async def aset(self, key: str, value: bytes, ttl: float) -> None:
+        await self.async_client.set(key, value, px=int(ttl * 1000))
+
+    async def aincrement(self, keys: Sequence[str], ttl: float) -> None:
+        async with self.async_client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.incr(key)
+                pipe.pexpire(key, int(ttl * 1000))
+            await pipe.execute()
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Collapse concurrent loads of one key in this process into a single call."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+
+    def do(self, key: str, load: Callable[[], T]) -> tuple[T, bool]:
+        """Run ``load`` or wait for the in-flight call; the flag is True when coalesced."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            flight.result = load()
+            return flight.result, False
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+class _LeaderCancelled(Exception):
+    """Set on a flight whose leading coroutine was cancelled before its load finished."""
+
+
+class AsyncSingleFlight:
+    """``SingleFlight`` for coroutines sharing one event loop.
+
+    Only the leader's own request is cancelled with it: its waiters are
+    released with ``_LeaderCancelled`` and the first of them to resume runs
+    the load again for the rest.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, load: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        while (flight := self._flights.get(key)) is not None:
+            try:
+                return await asyncio.shield(flight), True
+            except _LeaderCancelled:
+                continue
+
+        flight = self._flights[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await load()
+            flight.set_result(result)
+            return result, False
+        except asyncio.CancelledError:
+            flight.set_exception(_LeaderCancelled())
+            flight.exception()
+            raise
+        except BaseException as exc:
+            flight.set_exception(exc)
+            # Mark retrieved so a flight nobody waited on doesn't log a warning.
+            flight.exception()
+            raise
+        finally:
+            del self._flights[key]
+
+
+class VendorReadCache:
+    """Read-through cache for per-vendor read models on a shared ``CacheBackend``.
+
+    Keys embed a per-vendor version and a global epoch, both kept in the
+    backend, so invalidating is a single INCR visible to every worker: entries
+    under the old version are never read again and simply expire. Misses are
+    coalesced per process so a cold key costs one database round trip.
+    """
+
+    def __init__(self, backend: CacheBackend, *, ttl: float, version_ttl: float, prefix: str = "privue") -> None:
+        self.backend = backend
+        self.ttl = ttl
+        # Versions must outlive every entry stamped with them.
+        self.version_ttl = max(version_ttl, ttl)
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._flights = SingleFlight()
+        self._async_flights = AsyncSingleFlight()
+
+    def _version_key(self, vendor_id: UUID) -> str:
+        return f"{self.prefix}:vendor-version:{vendor_id}"
+
+    def _epoch_key(self) -> str:
+        return f"{self.prefix}:vendor-epoch"
+
+    def _entry_key(self, namespace: str, vendor_id: UUID, stamps: list[Optional[bytes]], parts: Sequence[Any]) -> str:
+        epoch, version = (int(stamp or 0) for stamp in stamps)
+        suffix = ":".join(str(part) for part in parts)
+        return f"{self.prefix}:{namespace}:{vendor_id}:{epoch}.{version}:{suffix}"
+
+    def _decode(self, adapter: TypeAdapter[T], raw: Optional[bytes]) -> Optional[T]:
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return adapter.validate_json(raw)
+
+    def get_or_load(
+        self,
+        namespace: str,
+        vendor_id: UUID,
+        adapter: TypeAdapter[T],
+        load: Callable[[], T],
+        *parts: Any,
+    ) -> T:
+        """Return the cached value for ``(namespace, vendor_id, *parts)`` or load and store it."""
+        stamps = self.backend.get_many([self._epoch_key(), self._version_key(vendor_id)])
+        key = self._entry_key(namespace, vendor_id, stamps, parts)
+
+        def load_and_store() -> T:
+            value = self._decode(adapter, self.backend.get_many([key])[0])
+            if value is None:
+                value = load()
+                self.backend.set(key, adapter.dump_json(value), self.ttl)
+            return value
+
+        value, coalesced = self._flights.do(key, load_and_store)
+        self.coalesced += coalesced
+        return value
+
+    async def aget_or_load(
+        self,
+        namespace: str,
+        vendor_id: UUID,
+        adapter: TypeAdapter[T],
+        load: Callable[[], Awaitable[T]],
+        *parts: Any,
+    ) -> T:
+        stamps = await self.backend.aget_many([self._epoch_key(), self._version_key(vendor_id)])
+        key = self._entry_key(namespace, vendor_id, stamps, parts)
+
+        async def load_and_store() -> T:
+            value = self._decode(adapter, (await self.backend.aget_many([key]))[0])
+            if value is None:
+                value = await load()
+                await self.backend.aset(key, adapter.dump_json(value), self.ttl)
+            return value
+
+        value, coalesced = await self._async_flights.do(key, load_and_store)
+        self.coalesced += coalesced
+        return value
+
+    def get_or_load_raw(
+        self,
+        namespace: str,
+        vendor_id: UUID,
+        load: Callable[[], bytes],
+        *parts: Any,
+    ) -> bytes:
+        """``get_or_load`` for values that are already serialized: bytes in, bytes out, nothing decoded."""
+        stamps = self.backend.get_many([self._epoch_key(), self._version_key(vendor_id)])
+        key = self._entry_key(namespace, vendor_id, stamps, parts)
+
+        def load_and_store() -> bytes:
+            raw = self.backend.get_many([key])[0]
+            if raw is not None:
+                self.hits += 1
+                return raw
+            self.misses += 1
+            raw = load()
+            self.backend.set(key, raw, self.ttl)
+            return raw
+
+        raw, coalesced = self._flights.do(key, load_and_store)
+        self.coalesced += coalesced
+        return raw
+
+    async def aget_or_load_raw(
+        self,
+        namespace: str,
+        vendor_id: UUID,
+        load: Callable[[], Awaitable[bytes]],
+        *parts: Any,
+    ) -> bytes:
+        stamps = await self.backend.aget_many([self._epoch_key(), self._version_key(vendor_id)])
+        key = self._entry_key(namespace, vendor_id, stamps, parts)
+
+        async def load_and_store() -> bytes:
+            raw = (await self.backend.aget_many([key]))[0]
+            if raw is not None:
+                self.hits += 1
+                return raw
+            self.misses += 1
+            raw = await load()
+            await self.backend.aset(key, raw, self.ttl)
+            return raw
+
+        raw, coalesced = await self._async_flights.do(key, load_and_store)
+        self.coalesced += coalesced
+        return raw
+
+    def invalidate(self, vendor_ids: Iterable[UUID]) -> None:
+        keys = [self._version_key(vendor_id) for vendor_id in vendor_ids]
+        if keys:
+            self.backend.increment(keys, self.version_ttl)
+
+    async def ainvalidate(self, vendor_ids: Iterable[UUID]) -> None:
+        keys = [self._version_key(vendor_id) for vendor_id in vendor_ids]
+        if keys:
+            await self.backend.aincrement(keys, self.version_ttl)
+
+    def invalidate_all(self) -> None:
+        self.backend.increment([self._epoch_key()], self.version_ttl)
+
+    async def ainvalidate_all(self) -> None:
+        await self.backend.aincrement([self._epoch_key()], self.version_ttl)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            backend=self.backend.name,
+            ttl_seconds=self.ttl,
+            hits=self.hits,
+            misses=self.misses,
+            coalesced=self.coalesced,
+            **self.backend.stats(),
+        )
+
+
+def build_cache_backend(settings: CacheSettings) -> CacheBackend:
+    if settings.backend == "redis":
+        return RedisCacheBackend.from_url(settings.redis_url)
+    return InMemoryCacheBackend(settings.vendor_maxsize, settings.vendor_ttl_seconds)
+
+
+_CACHE_SETTINGS = get_cache_settings()
+
+# VendorResponse and score history pages, served by GET /vendors/{vendor_id}[/scores].
+vendor_cache = VendorReadCache(
+    build_cache_backend(_CACHE_SETTINGS),
+    ttl=_CACHE_SETTINGS.vendor_ttl_seconds,
+    version_ttl=_CACHE_SETTINGS.version_ttl_seconds,
+)
+
+
+def invalidate_vendors(*vendor_ids: UUID) -> None:
+    """Drop cached reads of those vendors, in every worker, after a committed write."""
+    vendor_cache.invalidate(vendor_ids)
+
+
+async def ainvalidate_vendors(*vendor_ids: UUID) -> None:
+    await vendor_cache.ainvalidate(vendor_ids)
+
+
+def invalidate_all_vendors() -> None:
+    """Drop every cached vendor read, e.g. after a bulk rescore."""
+    vendor_cache.invalidate_all()
+
+
+async def ainvalidate_all_vendors() -> None:
+    await vendor_cache.ainvalidate_all()
@@ -0,0 +1,38 @@
+import base64
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException
+
+
+def encode_score_cursor(calculated_at: datetime, score_id: UUID) -> str:
+    """Opaque keyset cursor for the score snapshot ``(calculated_at, id)``."""
+    raw = f"{calculated_at.isoformat()}|{score_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_score_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        calculated_at, score_id = raw.split("|")
+        return datetime.fromisoformat(calculated_at), UUID(score_id)
+
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor") from exc
+
+
+def encode_vendor_cursor(name: str, vendor_id: UUID) -> str:
+    """Opaque keyset cursor for the vendor listing position ``(name, id)``."""
+    raw = f"{name}|{vendor_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_vendor_cursor(cursor: str) -> tuple[str, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        # names may contain "|", ids never do
+        name, vendor_id = raw.rsplit("|", 1)
+        return name, UUID(vendor_id)
+
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor") from exc
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Optional
+
+from fastapi import HTTPException, Response
+
+from src.utils.cache import CacheBackend, InMemoryCacheBackend, RedisCacheBackend
+from src.utils.validate_db_url import CacheSettings, get_cache_settings
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+# Set on responses answered from an earlier identical request rather than a new write.
+IDEMPOTENT_REPLAY_HEADER = "Idempotent-Replayed"
+
+_FINGERPRINT_SIZE = hashlib.sha256().digest_size
+
+
+def request_fingerprint(body: bytes) -> bytes:
+    return hashlib.sha256(body).digest()
+
+
+def idempotent_response(body: bytes, *, replayed: bool, status_code: int = 201) -> Response:
+    """A JSON write response, flagged with ``Idempotent-Replayed`` when nothing new was written."""
+    headers = {IDEMPOTENT_REPLAY_HEADER: "true"} if replayed else None
+    return Response(content=body, status_code=status_code, media_type="application/json", headers=headers)
+
+
+class IdempotencyStore:
+    """Responses of writes sent with an ``Idempotency-Key``, replayable for ``ttl`` seconds.
+
+    An entry is the fingerprint of the request it answered followed by the
+    response body, so a retry is answered with one backend lookup while a key
+    reused for a different request is refused instead of replayed. Entries
+    simply expire; correctness never depends on one being present, only the
+    cost of a retry does.
+    """
+
+    def __init__(self, backend: CacheBackend, *, ttl: float, prefix: str = "privue") -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _key(self, scope: str, key: str) -> str:
+        return f"{self.prefix}:idempotency:{scope}:{key}"
+
+    def _decode(self, fingerprint: bytes, raw: Optional[bytes]) -> Optional[bytes]:
+        if raw is None:
+            return None
+        if raw[:_FINGERPRINT_SIZE] != fingerprint:
+            raise HTTPException(
+                status_code=422, detail=f"{IDEMPOTENCY_KEY_HEADER} was already used for a different request"
+            )
+        return raw[_FINGERPRINT_SIZE:]
+
+    def get(self, scope: str, key: str, fingerprint: bytes) -> Optional[bytes]:
+        """The stored response body for ``key``, or None when there is none (any more)."""
+        return self._decode(fingerprint, self.backend.get_many([self._key(scope, key)])[0])
+
+    async def aget(self, scope: str, key: str, fingerprint: bytes) -> Optional[bytes]:
+        return self._decode(fingerprint, (await self.backend.aget_many([self._key(scope, key)]))[0])
+
+    def put(self, scope: str, key: str, fingerprint: bytes, body: bytes) -> None:
+        self.backend.set(self._key(scope, key), fingerprint + body, self.ttl)
+
+    async def aput(self, scope: str, key: str, fingerprint: bytes, body: bytes) -> None:
+        await self.backend.aset(self._key(scope, key), fingerprint + body, self.ttl)
+
+
+def build_idempotency_backend(settings: CacheSettings) -> CacheBackend:
+    if settings.backend == "redis":
+        return RedisCacheBackend.from_url(settings.redis_url)
+    return InMemoryCacheBackend(settings.idempotency_maxsize, settings.idempotency_ttl_seconds)
+
+
+_CACHE_SETTINGS = get_cache_settings()
+
+# Responses of POST /vendors/{vendor_id}/metrics, keyed by vendor and Idempotency-Key.
+metric_idempotency = IdempotencyStore(
+    build_idempotency_backend(_CACHE_SETTINGS), ttl=_CACHE_SETTINGS.idempotency_ttl_seconds
+)
@@ -1,9 +1,14 @@
 from uuid import UUID
+from typing import Optional
+from sqlalchemy import Row, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 
-from src.models import VendorModel, VendorScoreModel
-from src.schema import VendorResponse
+from src.models import VendorModel
+from src.schema import VendorResponse, VendorRow
+from src.utils.cache import vendor_cache
 
 
 def load_vendor(session: Session, vendor_id: UUID) -> VendorModel:
@@ -16,12 +21,81 @@ def load_vendor(session: Session, vendor_id: UUID) -> VendorModel:
     return vendor
 
 
-def vendor_to_response(vendor: VendorModel, latest_score: VendorScoreModel | None) -> VendorResponse:
+async def load_vendor_async(session: AsyncSession, vendor_id: UUID) -> VendorModel:
+    vendor = await session.get(VendorModel, vendor_id)
+    if vendor is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Vendor not found"
+        )
+    return vendor
+
+
+def vendor_to_response(vendor: VendorModel) -> VendorResponse:
     return VendorResponse(
         id=vendor.id,
         name=vendor.name,
         category=vendor.category,
         created_at=vendor.created_at,
         updated_at=vendor.updated_at,
-        latest_score=latest_score.score if latest_score else None,
-    )
\ No newline at end of file
+        latest_score=vendor.latest_score,
+    )
+
+
+
+VENDOR_RESPONSE_ADAPTER = TypeAdapter(VendorResponse)
+
+# Plain column tuples serialized straight to JSON: no ORM identity map, no
+# model validation. The bytes are interchangeable with VENDOR_RESPONSE_ADAPTER's.
+VENDOR_ROW_ADAPTER = TypeAdapter(VendorRow)
+
+
+def vendor_row_stmt(vendor_id: UUID) -> Select:
+    return select(
+        VendorModel.name,
+        VendorModel.category,
+        VendorModel.id,
+        VendorModel.created_at,
+        VendorModel.updated_at,
+        VendorModel.latest_score,
+    ).where(VendorModel.id == vendor_id)
+
+
+def vendor_row_json(row: Optional[Row]) -> bytes:
+    if row is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Vendor not found"
+        )
+    return VENDOR_ROW_ADAPTER.dump_json(row._asdict())
+
+
+def load_vendor_json(session: Session, vendor_id: UUID) -> bytes:
+    """Vendor detail as JSON bytes from ``vendor_cache``; a miss selects the row's columns only."""
+    return vendor_cache.get_or_load_raw(
+        "vendor", vendor_id, lambda: vendor_row_json(session.execute(vendor_row_stmt(vendor_id)).first())
+    )
+
+
+async def load_vendor_json_async(session: AsyncSession, vendor_id: UUID) -> bytes:
+    async def load() -> bytes:
+        return vendor_row_json((await session.execute(vendor_row_stmt(vendor_id))).first())
+
+    return await vendor_cache.aget_or_load_raw("vendor", vendor_id, load)
+
+
+def ensure_vendor_exists(session: Session, vendor_id: UUID) -> None:
+    """404 unless the vendor exists, without loading it into the session."""
+    if session.execute(select(VendorModel.id).where(VendorModel.id == vendor_id)).first() is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Vendor not found"
+        )
+
+
+async def ensure_vendor_exists_async(session: AsyncSession, vendor_id: UUID) -> None:
+    if (await session.execute(select(VendorModel.id).where(VendorModel.id == vendor_id))).first() is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Vendor not found"
+        )
@@ -1,9 +1,31 @@
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
 from src.main import app
+from src.services import scoring_rules
+from src.utils.validate_db_url import get_scoring_settings
 
 
 @pytest.fixture
 def client():
     return TestClient(app)
+
+
+@pytest.fixture
+def scoring_rule_file(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """Write a ``SCORING_RULES_PATH`` file and load it; returns the writer for later edits."""
+
+    path = tmp_path / "scoring_rules.json"
+
+    def write(active: str, *rule_sets: dict, experiments: dict | None = None):
+        path.write_text(json.dumps({"active": active, "experiments": experiments or {}, "rule_sets": list(rule_sets)}))
+        return path
+
+    monkeypatch.setenv("SCORING_RULES_PATH", str(path))
+    get_scoring_settings.cache_clear()
+    yield write
+    monkeypatch.delenv("SCORING_RULES_PATH")
+    get_scoring_settings.cache_clear()
+    scoring_rules.reload()
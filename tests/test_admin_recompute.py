@@ -0,0 +1,210 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
+
+from src.database.databases import SessionLocal
+from src.models import VendorMetricModel, VendorModel, VendorScoreAggregateModel
+from src.schema import VendorCategory, VendorMetricCreate, VendorUpdate
+from src.services import create_metric, rebuild_score_aggregates, update_vendor
+from src.services.score_aggregate_service import apply_metric_aggregates, metric_aggregate_row
+from src.utils.validate_db_url import get_scoring_settings
+
+
+@pytest.fixture
+def decayed_scoring(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SCORING_MODE", "decayed")
+    monkeypatch.setenv("SCORING_HALF_LIFE_DAYS", "1")
+    get_scoring_settings.cache_clear()
+    yield
+    get_scoring_settings.cache_clear()
+
+
+def _submit_metric(client: TestClient, vendor_id: str, timestamp: datetime, **overrides) -> None:
+    payload = {
+        "timestamp": timestamp.isoformat(),
+        "on_time_delivery_rate": 90.0,
+        "complaint_count": 0,
+        "missing_documents": False,
+        "compliance_score": 90.0,
+    }
+    payload.update(overrides)
+    response = client.post(f"/vendors/{vendor_id}/metrics", json=payload)
+    assert response.status_code == 201
+
+
+def test_bulk_recompute_scores_latest_metric(client: TestClient):
+    vendor_id = client.post("/vendors", json={"name": "Bulk Recompute", "category": "dealer"}).json()["id"]
+    now = datetime.now(timezone.utc)
+    _submit_metric(client, vendor_id, now, on_time_delivery_rate=100.0, compliance_score=100.0)
+    _submit_metric(client, vendor_id, now - timedelta(days=1), on_time_delivery_rate=10.0, compliance_score=10.0)
+
+    response = client.get("/admin/vendors/scores/recompute")
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["processed_vendors"] >= 1
+    assert summary["rows_per_second"] >= 0
+
+    scores = client.get(f"/vendors/{vendor_id}/scores").json()
+    # dealer weight 0.9 applied to 45 + 40 + 15 from the newest metric
+    assert scores[0]["score"] == 90.0
+
+
+def test_scoring_maintains_vendor_latest_score(client: TestClient):
+    vendor = client.post("/vendors", json={"name": "Current Score", "category": "supplier"}).json()
+    vendor_id = vendor["id"]
+    _submit_metric(client, vendor_id, datetime.now(timezone.utc), on_time_delivery_rate=100.0, compliance_score=100.0)
+
+    detail = client.get(f"/vendors/{vendor_id}").json()
+    assert detail["latest_score"] == 100.0
+    # a rescore is not a profile edit
+    assert detail["updated_at"] == vendor["updated_at"]
+
+    _submit_metric(client, vendor_id, datetime.now(timezone.utc), on_time_delivery_rate=0.0, compliance_score=0.0)
+    client.get("/admin/vendors/scores/recompute")
+    detail = client.get(f"/vendors/{vendor_id}").json()
+    assert detail["latest_score"] == 15.0
+    assert detail["latest_score"] == client.get(f"/vendors/{vendor_id}/scores").json()[0]["score"]
+
+
+def _score_count(client: TestClient, vendor_id: str) -> int:
+    return len(client.get(f"/vendors/{vendor_id}/scores", params={"limit": 100}).json())
+
+
+def test_incremental_recompute_skips_unchanged_vendors(client: TestClient):
+    vendor_id = client.post("/vendors", json={"name": "Incremental", "category": "distributor"}).json()["id"]
+    _submit_metric(client, vendor_id, datetime.now(timezone.utc))
+    assert _score_count(client, vendor_id) == 1
+
+    summary = client.get("/admin/vendors/scores/recompute").json()
+    assert summary["skipped_vendors"] >= 1
+    assert summary["processed_vendors"] == summary["recomputed_vendors"] + summary["skipped_vendors"]
+    assert _score_count(client, vendor_id) == 1
+
+    summary = client.get("/admin/vendors/scores/recompute", params={"force": True}).json()
+    assert summary["skipped_vendors"] == 0
+    assert _score_count(client, vendor_id) == 2
+
+
+def test_incremental_recompute_picks_up_category_changes(client: TestClient):
+    vendor_id = client.post("/vendors", json={"name": "Recategorised", "category": "supplier"}).json()["id"]
+    _submit_metric(client, vendor_id, datetime.now(timezone.utc), on_time_delivery_rate=100.0, compliance_score=100.0)
+
+    with SessionLocal() as session:
+        vendor = session.get(VendorModel, UUID(vendor_id))
+        update_vendor(session, vendor, VendorUpdate(category=VendorCategory.dealer))
+
+    client.get("/admin/vendors/scores/recompute")
+
+    assert _score_count(client, vendor_id) == 2
+    assert client.get(f"/vendors/{vendor_id}").json()["latest_score"] == 90.0
+
+
+def _aggregate_sums(vendor_id: str) -> tuple[float, ...]:
+    with SessionLocal() as session:
+        aggregate = session.get(VendorScoreAggregateModel, UUID(vendor_id))
+        return (
+            aggregate.weight_sum,
+            aggregate.on_time_delivery_sum,
+            aggregate.compliance_sum,
+            aggregate.complaint_sum,
+            aggregate.missing_documents_sum,
+        )
+
+
+def test_decayed_scoring_weights_history_by_half_life(client: TestClient, decayed_scoring):
+    vendor_id = client.post("/vendors", json={"name": "Decayed", "category": "supplier"}).json()["id"]
+    now = datetime.now(timezone.utc)
+    _submit_metric(client, vendor_id, now, on_time_delivery_rate=100.0, compliance_score=100.0)
+    # arrives late: one half-life older than the newest metric, so it weighs 0.5
+    _submit_metric(client, vendor_id, now - timedelta(days=1), on_time_delivery_rate=0.0, compliance_score=0.0)
+
+    # (100 * 0.45 + 100 * 0.4) / 1.5 + 15
+    assert client.get(f"/vendors/{vendor_id}").json()["latest_score"] == pytest.approx(85 / 1.5 + 15)
+
+    merged = _aggregate_sums(vendor_id)
+    with SessionLocal() as session:
+        assert rebuild_score_aggregates(session, vendor_ids=[UUID(vendor_id)]) == 1
+        session.commit()
+    assert _aggregate_sums(vendor_id) == pytest.approx(merged)
+    assert merged[0] == pytest.approx(1.5)
+
+
+def test_first_merge_builds_the_aggregate_from_existing_history(client: TestClient, decayed_scoring):
+    vendor_id = client.post("/vendors", json={"name": "Decayed Backfill", "category": "supplier"}).json()["id"]
+    now = datetime.now(timezone.utc)
+    for days in (1, 2, 3):
+        _submit_metric(client, vendor_id, now - timedelta(days=days), on_time_delivery_rate=0.0, compliance_score=0.0)
+    # metrics recorded before the vendor had an aggregate, e.g. before aggregates were deployed
+    with SessionLocal() as session:
+        session.execute(delete(VendorScoreAggregateModel).where(VendorScoreAggregateModel.vendor_id == UUID(vendor_id)))
+        session.commit()
+
+    _submit_metric(client, vendor_id, now, on_time_delivery_rate=100.0, compliance_score=100.0)
+
+    with SessionLocal() as session:
+        assert session.get(VendorScoreAggregateModel, UUID(vendor_id)).metric_count == 4
+        assert rebuild_score_aggregates(session, vendor_ids=[UUID(vendor_id)], stale_only=True) == 0
+    # (100 * 0.45 + 100 * 0.4) / (1 + 0.5 + 0.25 + 0.125) + 15
+    assert client.get(f"/vendors/{vendor_id}").json()["latest_score"] == pytest.approx(85 / 1.875 + 15)
+
+
+def test_concurrent_first_merges_keep_both_metrics(client: TestClient, decayed_scoring):
+    vendor_id = UUID(client.post("/vendors", json={"name": "Decayed Race", "category": "supplier"}).json()["id"])
+    now = datetime.now(timezone.utc)
+
+    def add_metric(session, timestamp: datetime) -> None:
+        metric = VendorMetricModel(
+            vendor_id=vendor_id,
+            timestamp=timestamp,
+            on_time_delivery_rate=100.0,
+            complaint_count=0,
+            missing_documents=False,
+            compliance_score=100.0,
+        )
+        session.add(metric)
+        session.flush()
+        apply_metric_aggregates(session, [metric_aggregate_row(metric)])
+
+    with SessionLocal() as first, SessionLocal() as second:
+        add_metric(first, now - timedelta(days=1))
+        # the second submission builds the same missing aggregate while the first is uncommitted
+        racer = threading.Thread(target=lambda: (add_metric(second, now), second.commit()))
+        racer.start()
+        racer.join(timeout=0.5)
+        first.commit()
+        racer.join()
+
+    with SessionLocal() as session:
+        assert session.get(VendorScoreAggregateModel, vendor_id).metric_count == 2
+
+
+def test_decayed_recompute_rescores_late_metrics(client: TestClient, decayed_scoring):
+    vendor_id = client.post("/vendors", json={"name": "Decayed Incremental", "category": "supplier"}).json()["id"]
+    now = datetime.now(timezone.utc)
+    _submit_metric(client, vendor_id, now)
+    client.get("/admin/vendors/scores/recompute")
+    scored = _score_count(client, vendor_id)
+
+    client.get("/admin/vendors/scores/recompute")
+    assert _score_count(client, vendor_id) == scored
+
+    with SessionLocal() as session:
+        # an older metric leaves the latest metric unchanged but moves the decayed average
+        create_metric(
+            session,
+            session.get(VendorModel, UUID(vendor_id)),
+            VendorMetricCreate(
+                timestamp=now - timedelta(days=2),
+                on_time_delivery_rate=0.0,
+                complaint_count=0,
+                missing_documents=True,
+                compliance_score=0.0,
+            ),
+        )
+
+    client.get("/admin/vendors/scores/recompute")
+    assert _score_count(client, vendor_id) == scored + 1
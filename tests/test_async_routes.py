@@ -0,0 +1,55 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.database.databases import async_engine
+from src.routers.aio import admin_router, vendor_router
+
+
+async_app = FastAPI()
+async_app.include_router(vendor_router)
+async_app.include_router(admin_router)
+
+
+@pytest.mark.asyncio
+async def test_async_routes_round_trip():
+    transport = httpx.ASGITransport(app=async_app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/vendors", json={"name": "Async Vendor", "category": "manufacturer"})
+            assert response.status_code == 201
+            vendor_id = response.json()["id"]
+
+            metric_payload = {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "on_time_delivery_rate": 80.0,
+                "complaint_count": 2,
+                "missing_documents": True,
+                "compliance_score": 70.0,
+            }
+            response = await client.post(f"/vendors/{vendor_id}/metrics", json=metric_payload)
+            assert response.status_code == 201
+
+            detail = (await client.get(f"/vendors/{vendor_id}")).json()
+            assert detail["latest_score"] is not None
+
+            scores = (await client.get(f"/vendors/{vendor_id}/scores")).json()
+            assert scores[0]["score"] == detail["latest_score"]
+
+            listed = (await client.get("/vendors", params={"category": "manufacturer", "min_score": 0})).json()
+            assert vendor_id in [item["id"] for item in listed["items"]] or listed["next_cursor"] is not None
+
+            response = await client.get(f"/admin/vendors/{vendor_id}/scores/recompute")
+            assert response.status_code == 200
+            assert response.json()["latest_score"] == detail["latest_score"]
+
+            missing = await client.get("/vendors/00000000-0000-0000-0000-000000000000")
+            assert missing.status_code == 404
+
+            batch = (await client.post("/vendors:batchGet", json={"ids": [vendor_id, str(uuid4())]})).json()
+            assert [item["found"] for item in batch["items"]] == [True, False]
+    finally:
+        await async_engine.dispose()
@@ -0,0 +1,258 @@
+import asyncio
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from src.database.databases import SessionLocal
+from src.schema import VendorScoreResponse
+from src.services import list_vendor_scores
+from src.utils.cache import InMemoryCacheBackend, RedisCacheBackend, TTLCache, VendorReadCache, vendor_cache
+from src.utils.cursor import encode_score_cursor
+from src.utils.validate_vendor import VENDOR_RESPONSE_ADAPTER, load_vendor, vendor_to_response
+
+INT_ADAPTER = TypeAdapter(int)
+
+
+def _redis_backend(server: fakeredis.FakeServer) -> RedisCacheBackend:
+    return RedisCacheBackend(
+        fakeredis.FakeRedis(server=server), fakeredis.aioredis.FakeRedis(server=server)
+    )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    stats = cache.stats()
+    assert (stats.size, stats.evictions, stats.hits, stats.misses) == (2, 1, 2, 1)
+
+
+def test_ttl_cache_expires_entries():
+    clock = FakeClock()
+    cache: TTLCache[int] = TTLCache(maxsize=10, ttl=5, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.stats().expirations == 1
+
+
+def test_ttl_cache_drops_values_loaded_before_invalidation():
+    cache: TTLCache[int] = TTLCache(maxsize=10, ttl=60)
+    epoch = cache.epoch()
+    cache.invalidate(["a"])
+
+    assert cache.set("a", 1, epoch=epoch) is False
+    assert cache.get("a") is None
+
+
+def test_vendor_reads_are_cached_and_invalidated_by_scoring(client: TestClient):
+    vendor_id = client.post("/vendors", json={"name": "Cached Vendor", "category": "supplier"}).json()["id"]
+    assert client.get(f"/vendors/{vendor_id}").json()["latest_score"] is None
+    assert client.get(f"/vendors/{vendor_id}/scores").json() == []
+
+    hits = vendor_cache.stats().hits
+    assert client.get(f"/vendors/{vendor_id}").json()["latest_score"] is None
+    assert vendor_cache.stats().hits == hits + 1
+
+    response = client.post(
+        f"/vendors/{vendor_id}/metrics",
+        json={
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "on_time_delivery_rate": 100.0,
+            "complaint_count": 0,
+            "missing_documents": False,
+            "compliance_score": 100.0,
+        },
+    )
+    assert response.status_code == 201
+
+    assert client.get(f"/vendors/{vendor_id}").json()["latest_score"] == 100.0
+    assert [score["score"] for score in client.get(f"/vendors/{vendor_id}/scores").json()] == [100.0]
+
+
+def test_serialized_reads_match_the_response_models(client: TestClient):
+    vendor_id = client.post("/vendors", json={"name": "Serialized Vendor", "category": "dealer"}).json()["id"]
+    for delivery in (80.0, 90.0):
+        client.post(
+            f"/vendors/{vendor_id}/metrics",
+            json={
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "on_time_delivery_rate": delivery,
+                "complaint_count": 3,
+                "missing_documents": False,
+                "compliance_score": 75.5,
+            },
+        )
+
+    with SessionLocal() as session:
+        vendor = VENDOR_RESPONSE_ADAPTER.dump_json(vendor_to_response(load_vendor(session, uuid.UUID(vendor_id))))
+        latest, _ = list_vendor_scores(session, uuid.UUID(vendor_id), limit=2)
+        scores = TypeAdapter(list[VendorScoreResponse]).dump_json(
+            [VendorScoreResponse.model_validate(latest, from_attributes=True)]
+        )
+
+    for _ in range(2):  # miss, then hit
+        response = client.get(f"/vendors/{vendor_id}")
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == vendor
+        response = client.get(f"/vendors/{vendor_id}/scores", params={"limit": 1})
+        assert response.content == scores
+        assert response.headers["X-Next-Cursor"] == encode_score_cursor(latest.calculated_at, latest.id)
+
+    assert client.get(f"/vendors/{uuid.uuid4()}").status_code == 404
+    assert client.get(f"/vendors/{uuid.uuid4()}/scores").status_code == 404
+
+
+def test_cache_stats_endpoint(client: TestClient):
+    response = client.get("/admin/cache/stats")
+
+    assert response.status_code == 200
+    assert {"hits", "misses", "evictions", "size", "maxsize"} <= response.json().keys()
+
+
+def test_redis_backend_invalidation_reaches_other_workers():
+    server = fakeredis.FakeServer()
+    worker_a = VendorReadCache(_redis_backend(server), ttl=60, version_ttl=3600)
+    worker_b = VendorReadCache(_redis_backend(server), ttl=60, version_ttl=3600)
+    vendor_id = uuid.uuid4()
+
+    assert worker_a.get_or_load("vendor", vendor_id, INT_ADAPTER, lambda: 1) == 1
+    assert worker_b.get_or_load("vendor", vendor_id, INT_ADAPTER, lambda: 2) == 1
+
+    worker_b.invalidate([vendor_id])
+
+    assert worker_a.get_or_load("vendor", vendor_id, INT_ADAPTER, lambda: 3) == 3
+    worker_a.invalidate_all()
+    assert worker_b.get_or_load("vendor", vendor_id, INT_ADAPTER, lambda: 4) == 4
+
+
+def test_async_redis_backend_round_trip():
+    cache = VendorReadCache(_redis_backend(fakeredis.FakeServer()), ttl=60, version_ttl=3600)
+    vendor_id = uuid.uuid4()
+
+    async def scenario() -> list[int]:
+        async def load(value: int):
+            return value
+
+        first = await cache.aget_or_load("vendor", vendor_id, INT_ADAPTER, lambda: load(1))
+        cached = await cache.aget_or_load("vendor", vendor_id, INT_ADAPTER, lambda: load(2))
+        await cache.ainvalidate([vendor_id])
+        reloaded = await cache.aget_or_load("vendor", vendor_id, INT_ADAPTER, lambda: load(3))
+        return [first, cached, reloaded]
+
+    assert asyncio.run(scenario()) == [1, 1, 3]
+
+
+def test_version_counters_outlive_value_evictions():
+    cache = VendorReadCache(InMemoryCacheBackend(3, 60), ttl=60, version_ttl=3600)
+    vendor_id = uuid.uuid4()
+
+    assert cache.get_or_load("vendor", vendor_id, INT_ADAPTER, lambda: 1) == 1
+    cache.invalidate([vendor_id])
+    # more invalidated vendors than the backend holds values
+    for _ in range(10):
+        cache.invalidate([uuid.uuid4()])
+
+    assert cache.get_or_load("vendor", vendor_id, INT_ADAPTER, lambda: 2) == 2
+
+
+def test_cold_key_is_loaded_once_per_process():
+    cache = VendorReadCache(InMemoryCacheBackend(100, 60), ttl=60, version_ttl=3600)
+    vendor_id = uuid.uuid4()
+    calls = []
+
+    def load() -> int:
+        calls.append(1)
+        time.sleep(0.1)
+        return 7
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("vendor", vendor_id, INT_ADAPTER, load)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [7] * 8
+    assert len(calls) == 1
+    assert cache.stats().coalesced == 7
+
+
+def test_async_cold_key_is_loaded_once():
+    cache = VendorReadCache(InMemoryCacheBackend(100, 60), ttl=60, version_ttl=3600)
+    vendor_id = uuid.uuid4()
+    calls = []
+
+    async def load() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 7
+
+    async def scenario() -> list[int]:
+        return await asyncio.gather(
+            *(cache.aget_or_load("vendor", vendor_id, INT_ADAPTER, load) for _ in range(5))
+        )
+
+    assert asyncio.run(scenario()) == [7] * 5
+    assert len(calls) == 1
+
+
+def test_cancelled_async_leader_hands_the_load_to_a_waiter():
+    cache = VendorReadCache(InMemoryCacheBackend(100, 60), ttl=60, version_ttl=3600)
+    vendor_id = uuid.uuid4()
+    calls = []
+
+    async def load() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 7
+
+    async def scenario() -> list[int]:
+        leader = asyncio.create_task(cache.aget_or_load("vendor", vendor_id, INT_ADAPTER, load))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(cache.aget_or_load("vendor", vendor_id, INT_ADAPTER, load)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*waiters)
+
+    assert asyncio.run(scenario()) == [7] * 3
+    assert len(calls) == 2
+
+
+def test_failed_load_propagates_to_waiters():
+    cache = VendorReadCache(InMemoryCacheBackend(100, 60), ttl=60, version_ttl=3600)
+
+    def load() -> int:
+        raise LookupError("gone")
+
+    with pytest.raises(LookupError):
+        cache.get_or_load("vendor", uuid.uuid4(), INT_ADAPTER, load)
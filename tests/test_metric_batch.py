@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+
+def _metric(timestamp: datetime, **overrides) -> dict:
+    payload = {
+        "timestamp": timestamp.isoformat(),
+        "on_time_delivery_rate": 90.0,
+        "complaint_count": 0,
+        "missing_documents": False,
+        "compliance_score": 90.0,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_metric_batch_reports_per_item_status(client: TestClient):
+    vendor_id = client.post("/vendors", json={"name": "Batch Vendor", "category": "supplier"}).json()["id"]
+    now = datetime.now(timezone.utc)
+    items = [
+        {"vendor_id": vendor_id, **_metric(now - timedelta(hours=1), on_time_delivery_rate=50.0)},
+        {"vendor_id": vendor_id, **_metric(now, on_time_delivery_rate=100.0, compliance_score=100.0)},
+        {"vendor_id": vendor_id, **_metric(now, compliance_score=150)},
+        {"vendor_id": str(uuid4()), **_metric(now)},
+    ]
+
+    response = client.post("/metrics:batch", json={"items": items})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["created"] == 2
+    assert body["rejected"] == 2
+    assert body["rescored_vendors"] == 1
+    assert [item["status"] for item in body["items"]] == ["created", "created", "rejected", "rejected"]
+    assert body["items"][3]["detail"] == "Vendor not found"
+
+    # one rescore per batch, from the newest metric
+    scores = client.get(f"/vendors/{vendor_id}/scores").json()
+    assert len(scores) == 1
+    assert scores[0]["score"] == 100.0
+
+
+def test_vendor_metric_batch_uses_path_vendor(client: TestClient):
+    vendor_id = client.post("/vendors", json={"name": "Batch Vendor 2", "category": "dealer"}).json()["id"]
+    now = datetime.now(timezone.utc)
+
+    response = client.post(
+        f"/vendors/{vendor_id}/metrics:batch",
+        json={"items": [_metric(now), _metric(now - timedelta(days=1))]},
+    )
+    assert response.status_code == 200
+    assert response.json()["created"] == 2
+
+    missing = client.post(f"/vendors/{uuid4()}/metrics:batch", json={"items": [_metric(now)]})
+    assert missing.status_code == 404
+
+
+def test_vendor_metric_batch_rejects_items_for_another_vendor(client: TestClient):
+    vendor_id = client.post("/vendors", json={"name": "Batch Vendor 3", "category": "dealer"}).json()["id"]
+    other_id = client.post("/vendors", json={"name": "Batch Vendor 4", "category": "dealer"}).json()["id"]
+    now = datetime.now(timezone.utc)
+    items = [
+        {"vendor_id": vendor_id, **_metric(now)},
+        {"vendor_id": other_id, **_metric(now - timedelta(days=1))},
+    ]
+
+    response = client.post(f"/vendors/{vendor_id}/metrics:batch", json={"items": items})
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["status"] for item in body["items"]] == ["created", "rejected"]
+    assert body["items"][1]["vendor_id"] == other_id
+    assert body["items"][1]["detail"] == "vendor_id does not match the vendor in the path"
+    assert client.get(f"/vendors/{other_id}/scores").json() == []
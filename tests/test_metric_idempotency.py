@@ -0,0 +1,90 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+
+def _metric(**overrides) -> dict:
+    payload = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "on_time_delivery_rate": 90.0,
+        "complaint_count": 1,
+        "missing_documents": False,
+        "compliance_score": 85.0,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def _vendor(client: TestClient, name: str) -> str:
+    return client.post("/vendors", json={"name": name, "category": "supplier"}).json()["id"]
+
+
+def test_resubmitted_metric_returns_the_stored_one(client: TestClient):
+    vendor_id = _vendor(client, "Retrying Vendor")
+    metric = _metric()
+
+    first = client.post(f"/vendors/{vendor_id}/metrics", json=metric)
+    assert first.status_code == 201
+    assert "Idempotent-Replayed" not in first.headers
+
+    retry = client.post(f"/vendors/{vendor_id}/metrics", json=metric)
+    assert retry.status_code == 201
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.json() == first.json()
+    # no second row and no second rescore
+    assert len(client.get(f"/vendors/{vendor_id}/scores").json()) == 1
+
+    conflicting = client.post(f"/vendors/{vendor_id}/metrics", json={**metric, "compliance_score": 10.0})
+    assert conflicting.status_code == 409
+
+
+def test_idempotency_key_replays_the_original_response(client: TestClient):
+    vendor_id = _vendor(client, "Keyed Vendor")
+    key = str(uuid4())
+    metric = _metric()
+
+    first = client.post(f"/vendors/{vendor_id}/metrics", json=metric, headers={"Idempotency-Key": key})
+    assert first.status_code == 201
+
+    replay = client.post(f"/vendors/{vendor_id}/metrics", json=metric, headers={"Idempotency-Key": key})
+    assert replay.status_code == 201
+    assert replay.headers["Idempotent-Replayed"] == "true"
+    assert replay.content == first.content
+    assert len(client.get(f"/vendors/{vendor_id}/scores").json()) == 1
+
+    reused = client.post(
+        f"/vendors/{vendor_id}/metrics", json=_metric(complaint_count=3), headers={"Idempotency-Key": key}
+    )
+    assert reused.status_code == 422
+
+
+def test_batch_reports_already_recorded_metrics(client: TestClient):
+    vendor_id = _vendor(client, "Batch Retry Vendor")
+    items = [_metric(), _metric(on_time_delivery_rate=70.0)]
+
+    first = client.post(f"/vendors/{vendor_id}/metrics:batch", json={"items": items}).json()
+    assert first["created"] == 2
+
+    retry = client.post(f"/vendors/{vendor_id}/metrics:batch", json={"items": items}).json()
+    assert retry["created"] == 0
+    assert retry["duplicates"] == 2
+    assert retry["rescored_vendors"] == 0
+    assert [item["status"] for item in retry["items"]] == ["duplicate", "duplicate"]
+    assert [item["metric_id"] for item in retry["items"]] == [item["metric_id"] for item in first["items"]]
+
+
+def test_batch_rejects_resubmissions_with_other_values(client: TestClient):
+    vendor_id = _vendor(client, "Batch Conflict Vendor")
+    stored = _metric()
+    assert client.post(f"/vendors/{vendor_id}/metrics", json=stored).status_code == 201
+
+    repeated = _metric(on_time_delivery_rate=50.0)
+    items = [{**stored, "complaint_count": 4}, repeated, {**repeated, "compliance_score": 10.0}]
+    response = client.post(f"/vendors/{vendor_id}/metrics:batch", json={"items": items}).json()
+
+    assert [item["status"] for item in response["items"]] == ["rejected", "created", "rejected"]
+    assert response["created"] == 1
+    assert response["duplicates"] == 0
+    assert response["rejected"] == 2
+    assert response["items"][2]["metric_id"] == response["items"][1]["metric_id"]
@@ -0,0 +1,106 @@
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+
+def test_import_ndjson_streams_rows_and_reports_rejections(client: TestClient):
+    vendor_id = client.post("/vendors", json={"name": "Import Vendor", "category": "supplier"}).json()["id"]
+    timestamp = datetime.now(timezone.utc).isoformat()
+    metric = {
+        "vendor_id": vendor_id,
+        "timestamp": timestamp,
+        "on_time_delivery_rate": 88.0,
+        "complaint_count": 1,
+        "missing_documents": False,
+        "compliance_score": 91.0,
+    }
+    lines = [
+        json.dumps(metric),
+        json.dumps({**metric, "compliance_score": 101}),
+        "{not json",
+        json.dumps({**metric, "vendor_id": str(uuid4())}),
+        json.dumps(metric),
+    ]
+
+    def body():
+        for line in lines:
+            yield (line + "\n").encode()
+
+    response = client.post("/metrics:import?format=ndjson", content=body())
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["lines_read"] == 5
+    # the last line repeats the first metric
+    assert summary["imported"] == 1
+    assert summary["duplicates"] == 1
+    assert summary["rejected"] == 3
+    assert [error["line"] for error in summary["errors"]] == [2, 3, 4]
+
+
+def test_import_csv(client: TestClient):
+    vendor_id = client.post("/vendors", json={"name": "Import Vendor CSV", "category": "dealer"}).json()["id"]
+    timestamp = datetime.now(timezone.utc).isoformat()
+    body = (
+        "vendor_id,timestamp,on_time_delivery_rate,complaint_count,missing_documents,compliance_score\n"
+        f"{vendor_id},{timestamp},75.5,0,true,80\n"
+        f"{vendor_id},{timestamp},75.5,0,true"
+    )
+
+    response = client.post("/metrics:import?format=csv", content=body.encode())
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["imported"] == 1
+    assert summary["errors"] == [{"line": 3, "detail": "expected 6 columns, got 5"}]
+
+
+def test_import_csv_quoted_fields_span_lines(client: TestClient):
+    vendor_id = client.post("/vendors", json={"name": "Import Vendor Notes", "category": "dealer"}).json()["id"]
+    start = datetime.now(timezone.utc)
+    body = (
+        "vendor_id,timestamp,on_time_delivery_rate,complaint_count,missing_documents,compliance_score,note\n"
+        f'{vendor_id},{start.isoformat()},75.5,0,true,80,"late truck,\n""cold"" storage"\n'
+        f"{vendor_id},{(start + timedelta(seconds=1)).isoformat()},75.5,0,true,80,plain\n"
+        f'{vendor_id},{(start + timedelta(seconds=2)).isoformat()},75.5,0,true,80,"never closed\n'
+    )
+
+    # split inside the quoted field, as a streamed body may be
+    split = body.index("cold")
+    chunks = iter([body[:split].encode(), body[split:].encode()])
+    response = client.post("/metrics:import?format=csv", content=chunks)
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["imported"] == 2
+    assert summary["errors"] == [{"line": 5, "detail": "unterminated quoted field"}]
+
+
+def test_import_rejects_rows_that_conflict_with_stored_metrics(client: TestClient):
+    vendor_id = client.post("/vendors", json={"name": "Import Vendor Conflicts", "category": "supplier"}).json()["id"]
+    start = datetime.now(timezone.utc)
+    metric = {
+        "timestamp": start.isoformat(),
+        "on_time_delivery_rate": 88.0,
+        "complaint_count": 1,
+        "missing_documents": False,
+        "compliance_score": 91.0,
+    }
+    assert client.post(f"/vendors/{vendor_id}/metrics", json=metric).status_code == 201
+
+    later = {**metric, "vendor_id": vendor_id, "timestamp": (start + timedelta(seconds=1)).isoformat()}
+    lines = [
+        {**metric, "vendor_id": vendor_id},
+        {**metric, "vendor_id": vendor_id, "complaint_count": 3},
+        later,
+        {**later, "compliance_score": 10.0},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines)
+
+    summary = client.post("/metrics:import?format=ndjson", content=body.encode()).json()
+    assert summary["imported"] == 1
+    assert summary["duplicates"] == 1
+    assert summary["rejected"] == 2
+    assert [error["line"] for error in summary["errors"]] == [2, 4]
+    assert {error["detail"] for error in summary["errors"]} == {
+        "A metric with different values is already recorded for this vendor and timestamp."
+    }
@@ -0,0 +1,82 @@
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.database.databases import SessionLocal
+from src.services import partition_service, run_partition_maintenance
+from src.utils.validate_db_url import PartitionSettings
+
+
+def test_add_months_rolls_over_year():
+    month = datetime(2026, 11, 1, tzinfo=timezone.utc)
+
+    assert partition_service.add_months(month, 2) == datetime(2027, 1, 1, tzinfo=timezone.utc)
+    assert partition_service.add_months(month, -11) == datetime(2025, 12, 1, tzinfo=timezone.utc)
+
+
+def test_maintenance_moves_default_rows_into_month_partition(client: TestClient):
+    vendor_id = client.post("/vendors", json={"name": "Far Future", "category": "supplier"}).json()["id"]
+    timestamp = datetime(2031, 5, 17, tzinfo=timezone.utc)
+    response = client.post(
+        f"/vendors/{vendor_id}/metrics",
+        json={
+            "timestamp": timestamp.isoformat(),
+            "on_time_delivery_rate": 90.0,
+            "complaint_count": 0,
+            "missing_documents": False,
+            "compliance_score": 90.0,
+        },
+    )
+    assert response.status_code == 201
+
+    with SessionLocal() as session:
+        run_partition_maintenance(session, settings=PartitionSettings(), apply_retention=False)
+        partitions = partition_service.list_month_partitions(session, "vendor_metrics")
+        located = session.execute(
+            text("SELECT tableoid::regclass::text FROM vendor_metrics WHERE vendor_id = :vendor_id"),
+            {"vendor_id": vendor_id},
+        ).scalar_one()
+
+    assert partitions[datetime(2031, 5, 1, tzinfo=timezone.utc)] == "vendor_metrics_p2031_05"
+    assert located == "vendor_metrics_p2031_05"
+
+
+def test_retention_archives_and_drops_partitions_before_cutoff(client: TestClient, tmp_path):
+    vendor_id = client.post("/vendors", json={"name": "Long Gone", "category": "supplier"}).json()["id"]
+    for timestamp in (datetime(1990, 3, 20, tzinfo=timezone.utc), datetime(1990, 4, 2, tzinfo=timezone.utc)):
+        response = client.post(
+            f"/vendors/{vendor_id}/metrics",
+            json={
+                "timestamp": timestamp.isoformat(),
+                "on_time_delivery_rate": 80.0,
+                "complaint_count": 1,
+                "missing_documents": False,
+                "compliance_score": 85.0,
+            },
+        )
+        assert response.status_code == 201
+
+    now = datetime.now(timezone.utc)
+    cutoff = datetime(1990, 4, 1, tzinfo=timezone.utc)
+    retention_months = (now.year - cutoff.year) * 12 + now.month - cutoff.month
+    settings = PartitionSettings(metrics_retention_months=retention_months, archive_dir=str(tmp_path))
+
+    with SessionLocal() as session:
+        summary = run_partition_maintenance(session, now=now, settings=settings)
+        partitions = partition_service.list_month_partitions(session, "vendor_metrics")
+        remaining = session.execute(
+            text('SELECT "timestamp" FROM vendor_metrics WHERE vendor_id = :vendor_id'),
+            {"vendor_id": vendor_id},
+        ).scalars().all()
+
+    # March 1990 ends exactly at the cutoff and is expired; April 1990 straddles it and is kept.
+    assert summary.archived == ["vendor_metrics_p1990_03"]
+    assert summary.dropped == ["vendor_metrics_p1990_03"]
+    assert datetime(1990, 3, 1, tzinfo=timezone.utc) not in partitions
+    assert partitions[cutoff] == "vendor_metrics_p1990_04"
+    assert remaining == [datetime(1990, 4, 2, tzinfo=timezone.utc)]
+
+    header, *rows = (tmp_path / "vendor_metrics_p1990_03.csv").read_text().splitlines()
+    assert header.split(",")[:3] == ["id", "vendor_id", "timestamp"]
+    assert [row.split(",")[1] for row in rows] == [str(vendor_id)]
@@ -0,0 +1,133 @@
+import time
+from datetime import datetime, timezone
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from src.database.databases import SessionLocal
+from src.models import VendorMetricModel
+from src.services import (
+    create_recompute_job,
+    get_recompute_job,
+    job_shard_ids,
+    parallel_recompute_vendor_scores,
+    resume_job,
+)
+from src.services.recompute_job_service import run_recompute_shard, uuid_shard_bounds
+
+
+def _vendor_with_metric(client: TestClient, name: str) -> str:
+    vendor_id = client.post("/vendors", json={"name": name, "category": "supplier"}).json()["id"]
+    response = client.post(
+        f"/vendors/{vendor_id}/metrics",
+        json={
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "on_time_delivery_rate": 100.0,
+            "complaint_count": 0,
+            "missing_documents": False,
+            "compliance_score": 100.0,
+        },
+    )
+    assert response.status_code == 201
+    return vendor_id
+
+
+def _wait_for(client: TestClient, job_id: str, timeout: float = 60.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(f"/admin/jobs/{job_id}").json()
+        if job["status"] in ("succeeded", "failed", "cancelled"):
+            return job
+        time.sleep(0.2)
+    raise AssertionError(f"job {job_id} did not finish: {job}")
+
+
+def test_uuid_shard_bounds_cover_the_whole_space():
+    bounds = uuid_shard_bounds(4)
+
+    assert bounds[0][0] == UUID(int=0)
+    assert bounds[-1][1] is None
+    assert all(upper == lower for (_, upper), (lower, _) in zip(bounds, bounds[1:]))
+
+
+def test_recompute_job_runs_in_worker_pool(client: TestClient):
+    vendor_id = _vendor_with_metric(client, "Job Vendor")
+
+    response = client.post("/admin/jobs/recompute", json={"force": True, "shards": 2})
+    assert response.status_code == 202
+    assert len(response.json()["shards"]) == 2
+
+    job = _wait_for(client, response.json()["id"])
+
+    assert job["status"] == "succeeded"
+    assert job["errors"] == []
+    assert job["recomputed_vendors"] >= 1
+    assert job["skipped_vendors"] == 0
+    assert len(client.get(f"/vendors/{vendor_id}/scores").json()) == 2
+
+
+def test_job_invalidates_cached_reads_of_the_api_process(client: TestClient):
+    vendor_id = _vendor_with_metric(client, "Cached Job Vendor")
+    assert client.get(f"/vendors/{vendor_id}").json()["latest_score"] == 100.0
+    # change the inputs behind the cache's back; only the job's rescore can surface it
+    with SessionLocal() as session:
+        session.execute(
+            update(VendorMetricModel)
+            .where(VendorMetricModel.vendor_id == UUID(vendor_id))
+            .values(on_time_delivery_rate=0.0, compliance_score=0.0)
+        )
+        session.commit()
+    assert client.get(f"/vendors/{vendor_id}").json()["latest_score"] == 100.0
+
+    job_id = client.post("/admin/jobs/recompute", json={"force": True, "shards": 2}).json()["id"]
+    assert _wait_for(client, job_id)["status"] == "succeeded"
+
+    # the worker process reports completion before the pool's callback runs here
+    deadline = time.monotonic() + 10.0
+    while client.get(f"/vendors/{vendor_id}").json()["latest_score"] != 15.0:
+        assert time.monotonic() < deadline, "cached read outlived the recompute job"
+        time.sleep(0.1)
+
+
+def test_cancelled_job_resumes_from_checkpoint(client: TestClient):
+    _vendor_with_metric(client, "Resumable Vendor")
+
+    with SessionLocal() as session:
+        job = create_recompute_job(session, shards=1)
+        job_id = job.id
+
+    cancelled = client.post(f"/admin/jobs/{job_id}/cancel").json()
+    assert cancelled["status"] == "cancelled"
+    assert client.post(f"/admin/jobs/{job_id}/cancel").status_code == 409
+
+    with SessionLocal() as session:
+        # run the resumed shard inline instead of through the pool
+        (shard_id,) = resume_job(session, job_id)
+        run_recompute_shard(session, shard_id, chunk_size=1)
+        resumed = get_recompute_job(session, job_id)
+        assert job_shard_ids(session, job_id) == []
+
+    assert resumed.status == "succeeded"
+    assert resumed.processed_vendors >= 1
+    assert resumed.shards[0].checkpoint is not None
+
+
+def test_unknown_job_is_404(client: TestClient):
+    assert client.get("/admin/jobs/00000000-0000-0000-0000-000000000000").status_code == 404
+
+
+def test_parallel_recompute_merges_shard_counts(client: TestClient):
+    vendor_ids = [_vendor_with_metric(client, f"Parallel Vendor {index}") for index in range(3)]
+
+    summary = parallel_recompute_vendor_scores(parallelism=2, force=True)
+
+    assert summary.recomputed_vendors >= 3
+    assert summary.skipped_vendors == 0
+    assert summary.processed_vendors == summary.recomputed_vendors
+    for vendor_id in vendor_ids:
+        assert len(client.get(f"/vendors/{vendor_id}/scores").json()) == 2
+
+    rerun = parallel_recompute_vendor_scores(parallelism=2)
+    assert rerun.recomputed_vendors == 0
+    assert rerun.skipped_vendors == summary.recomputed_vendors
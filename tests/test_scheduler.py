@@ -0,0 +1,39 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.database.databases import engine
+from src.services import build_scheduler, run_scheduled_job
+from src.services.scheduler_service import SCHEDULED_JOB_LOCK_KEYS
+from src.utils.validate_db_url import SchedulerSettings
+
+
+def test_scheduled_recompute_records_run_history(client: TestClient):
+    run = run_scheduled_job(engine, "recompute_vendor_scores")
+
+    assert run is not None
+    assert run.status == "succeeded"
+    assert run.processed_vendors == run.recomputed_vendors + run.skipped_vendors
+
+    runs = client.get("/admin/scheduler/runs", params={"job_name": "recompute_vendor_scores"}).json()
+    assert runs[0]["id"] == str(run.id)
+
+
+def test_scheduled_run_is_skipped_while_another_worker_holds_the_lock():
+    lock_key = SCHEDULED_JOB_LOCK_KEYS["recompute_vendor_scores"]
+    with engine.connect() as other_worker:
+        other_worker.execute(text("SELECT pg_advisory_lock(:key)"), {"key": lock_key})
+        try:
+            assert run_scheduled_job(engine, "recompute_vendor_scores") is None
+        finally:
+            other_worker.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": lock_key})
+
+
+def test_build_scheduler_prevents_overlap_and_jitters():
+    settings = SchedulerSettings(enabled=True, recompute_cron="15 3 * * *", partition_cron=None, jitter_seconds=120)
+    scheduler = build_scheduler(engine, settings)
+
+    (job,) = scheduler.get_jobs()
+    assert job.id == "recompute_vendor_scores"
+    assert job.max_instances == 1
+    assert job.coalesce is True
+    assert job.trigger.jitter == 120
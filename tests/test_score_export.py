@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+import pyarrow
+import pyarrow.ipc
+from fastapi.testclient import TestClient
+
+from src.services import score_export_service
+
+
+def _vendor_with_scores(client: TestClient, category: str, deliveries: list[float]) -> str:
+    vendor_id = client.post("/vendors", json={"name": f"Export {category}", "category": category}).json()["id"]
+    for delivery in deliveries:
+        response = client.post(
+            f"/vendors/{vendor_id}/metrics",
+            json={
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "on_time_delivery_rate": delivery,
+                "complaint_count": 2,
+                "missing_documents": False,
+                "compliance_score": 80.0,
+            },
+        )
+        assert response.status_code == 201
+    return vendor_id
+
+
+def test_export_streams_filtered_history(client: TestClient, monkeypatch):
+    since = datetime.now(timezone.utc).isoformat()
+    first = _vendor_with_scores(client, "distributor", [70.0, 80.0, 90.0])
+    second = _vendor_with_scores(client, "distributor", [60.0])
+    _vendor_with_scores(client, "manufacturer", [50.0])
+    # several cursor fetches per export
+    monkeypatch.setattr(score_export_service, "EXPORT_BATCH_SIZE", 2)
+
+    response = client.get("/scores/export", params={"vendor_id": first})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["vendor_id"] for line in lines] == [first] * 3
+    assert lines == client.get(f"/vendors/{first}/scores").json()
+
+    response = client.get("/scores/export", params={"format": "csv", "category": "distributor", "from": since})
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert tuple(rows[0]) == score_export_service.EXPORT_COLUMNS
+    assert sorted(row["vendor_id"] for row in rows) == sorted([first] * 3 + [second])
+
+    response = client.get("/scores/export", params={"vendor_id": first, "from": datetime.now(timezone.utc).isoformat()})
+    assert response.text == ""
+
+    assert client.get("/scores/export", params={"from": since, "to": since}).status_code == 400
+    assert client.get("/scores/export", params={"format": "parquet"}).status_code == 422
+
+
+def test_export_arrow_stream(client: TestClient):
+    vendor_id = _vendor_with_scores(client, "supplier", [75.0, 85.0])
+
+    response = client.get("/scores/export", params={"format": "arrow", "vendor_id": vendor_id})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+
+    table = pyarrow.ipc.open_stream(response.content).read_all()
+    assert table.column_names == list(score_export_service.EXPORT_COLUMNS)
+    assert table.column("vendor_id").to_pylist() == [vendor_id, vendor_id]
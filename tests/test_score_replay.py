@@ -0,0 +1,139 @@
+import uuid
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from src.database.databases import SessionLocal
+from src.models import VendorMetricModel
+from src.services import create_score_replay, get_score_replay, run_score_replay, score_replay_service, scoring_rules
+
+
+def _vendor_with_history(client: TestClient) -> tuple[str, list[datetime]]:
+    vendor_id = client.post("/vendors", json={"name": "Replayed Vendor", "category": "dealer"}).json()["id"]
+    start = datetime.now(timezone.utc) - timedelta(days=3)
+    timestamps = [start + timedelta(days=offset) for offset in range(3)]
+    for rate, timestamp in zip((100.0, 50.0, 0.0), timestamps):
+        response = client.post(
+            f"/vendors/{vendor_id}/metrics",
+            json={
+                "timestamp": timestamp.isoformat(),
+                "on_time_delivery_rate": rate,
+                "complaint_count": 0,
+                "missing_documents": False,
+                "compliance_score": rate,
+            },
+        )
+        assert response.status_code == 201
+    return vendor_id, timestamps
+
+
+def _replayed_scores(client: TestClient, vendor_id: str, scoring_version: str) -> list[dict]:
+    return client.get(
+        f"/vendors/{vendor_id}/scores", params={"scoring_version": scoring_version, "replayed": True, "limit": 100}
+    ).json()
+
+
+def _register_rule_set(scoring_rule_file) -> str:
+    """Load a rule set with the v1 weights under a fresh version name."""
+
+    scoring_version = f"test-{uuid.uuid4().hex[:8]}"
+    scoring_rule_file("v1", {"version": "v1"}, {"version": scoring_version})
+    scoring_rules.reload()
+    return scoring_version
+
+
+def test_replay_writes_a_score_per_metric_timestamp(client: TestClient, scoring_rule_file):
+    vendor_id, timestamps = _vendor_with_history(client)
+    scoring_version = _register_rule_set(scoring_rule_file)
+
+    with SessionLocal() as session:
+        replay = create_score_replay(session, scoring_version, mode="latest")
+        run_score_replay(session, replay.id, batch_size=7)
+        summary = get_score_replay(session, replay.id)
+
+    assert summary.status == "succeeded"
+    assert summary.scores_written >= 3
+    scores = _replayed_scores(client, vendor_id, scoring_version)
+    assert [datetime.fromisoformat(score["calculated_at"]) for score in scores] == timestamps[::-1]
+    # dealer weight 0.9 applied to 85% of the rate plus 15 reliability
+    assert [score["score"] for score in scores] == [13.5, 51.75, 90.0]
+
+    # the live history is untouched by the replay and does not list its scores
+    live = client.get(f"/vendors/{vendor_id}/scores", params={"limit": 100}).json()
+    assert len(live) == 3
+    assert {score["scoring_version"] for score in live} == {"v1"}
+    assert client.get(f"/vendors/{vendor_id}").json()["latest_score"] == live[0]["score"]
+    assert client.post("/admin/jobs/replays", json={"scoring_version": scoring_version}).status_code == 409
+    assert client.post("/admin/jobs/replays", json={"scoring_version": "unloaded"}).status_code == 400
+
+
+def test_resumed_replay_continues_after_checkpoint(client: TestClient, scoring_rule_file):
+    vendor_id, timestamps = _vendor_with_history(client)
+    scoring_version = _register_rule_set(scoring_rule_file)
+
+    with SessionLocal() as session:
+        first_metric = session.execute(
+            select(VendorMetricModel)
+            .where(VendorMetricModel.vendor_id == UUID(vendor_id))
+            .order_by(VendorMetricModel.timestamp)
+            .limit(1)
+        ).scalar_one()
+        replay = create_score_replay(session, scoring_version, mode="decayed")
+        # as if a previous run committed everything up to the vendor's first metric
+        replay.checkpoint_vendor_id = first_metric.vendor_id
+        replay.checkpoint_timestamp = first_metric.timestamp
+        replay.checkpoint_metric_id = first_metric.id
+        replay.carry = {
+            "vendor_id": vendor_id,
+            "anchor": first_metric.timestamp.isoformat(),
+            "sums": [1.0, 100.0, 100.0, 0.0, 0.0],
+        }
+        session.commit()
+
+        run_score_replay(session, replay.id)
+        assert get_score_replay(session, replay.id).status == "succeeded"
+
+    scores = _replayed_scores(client, vendor_id, scoring_version)
+    assert [datetime.fromisoformat(score["calculated_at"]) for score in scores] == timestamps[:0:-1]
+    # decayed averages continue from the carried sums instead of restarting at the second metric
+    assert scores[-1]["score"] > 51.75
+
+
+def test_versions_scoring_live_traffic_are_not_replayed(client: TestClient, scoring_rule_file):
+    _vendor_with_history(client)
+    scoring_rule_file("v1", {"version": "v1"}, {"version": "v2"}, experiments={"v2": 0.5})
+    scoring_rules.reload()
+
+    for scoring_version in ("v1", "v2"):
+        response = client.post("/admin/jobs/replays", json={"scoring_version": scoring_version})
+        assert response.status_code == 409
+
+    # retired from live scoring, v1 still has live scores a replay would mix with
+    scoring_rule_file("v2", {"version": "v1"}, {"version": "v2"})
+    scoring_rules.reload()
+    assert client.post("/admin/jobs/replays", json={"scoring_version": "v1"}).status_code == 409
+
+
+def test_finished_replay_worker_invalidates_the_api_process_cache(
+    client: TestClient, scoring_rule_file, monkeypatch: pytest.MonkeyPatch
+):
+    vendor_id, timestamps = _vendor_with_history(client)
+    scoring_version = _register_rule_set(scoring_rule_file)
+    assert _replayed_scores(client, vendor_id, scoring_version) == []
+
+    # a pool worker's invalidations only reach its own process-local cache
+    monkeypatch.setattr(score_replay_service, "invalidate_vendors", lambda *vendor_ids: None)
+    with SessionLocal() as session:
+        replay = create_score_replay(session, scoring_version, mode="latest")
+        run_score_replay(session, replay.id)
+    assert _replayed_scores(client, vendor_id, scoring_version) == []
+
+    finished = Future()
+    finished.set_result(None)
+    score_replay_service._on_replay_done(finished)
+
+    assert len(_replayed_scores(client, vendor_id, scoring_version)) == len(timestamps)
@@ -0,0 +1,118 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from src.database.databases import SessionLocal, async_engine
+from src.main import app
+from src.models import VendorModel
+from src.routers.aio import admin_router, vendor_router
+from src.routers.scores import router as score_router
+from src.routers.scoring_rules import router as scoring_rules_router
+from src.services.score_rollup_service import bucket_percentile
+
+# the routes DATABASE_ASYNC=true serves
+async_app = FastAPI()
+for router in (vendor_router, admin_router, score_router, scoring_rules_router):
+    async_app.include_router(router)
+
+
+@pytest.fixture(params=["sync", "async"])
+def rollup_client(request: pytest.FixtureRequest):
+    if request.param == "sync":
+        yield TestClient(app)
+        return
+    # one event loop for the whole test, so pooled async connections stay usable
+    with TestClient(async_app) as client:
+        yield client
+        client.portal.call(async_engine.dispose)
+
+
+def _current_scores() -> dict[str, list[float]]:
+    with SessionLocal() as session:
+        rows = session.execute(
+            select(VendorModel.category, VendorModel.latest_score).where(VendorModel.latest_score.is_not(None))
+        ).all()
+    scores = defaultdict(list)
+    for category, score in rows:
+        scores[category].append(score)
+    return scores
+
+
+def _submit_metric(client: TestClient, vendor_id: str, delivery: float) -> None:
+    response = client.post(
+        f"/vendors/{vendor_id}/metrics",
+        json={
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "on_time_delivery_rate": delivery,
+            "complaint_count": 1,
+            "missing_documents": False,
+            "compliance_score": 70.0,
+        },
+    )
+    assert response.status_code == 201
+
+
+def test_rollups_follow_recomputes_and_rescores(rollup_client: TestClient):
+    client = rollup_client
+    vendor_ids = [
+        client.post("/vendors", json={"name": f"Rollup {index}", "category": "manufacturer"}).json()["id"]
+        for index in range(3)
+    ]
+    for vendor_id, delivery in zip(vendor_ids, (40.0, 70.0, 100.0)):
+        _submit_metric(client, vendor_id, delivery)
+    assert client.get("/admin/vendors/scores/recompute", params={"force": "true"}).status_code == 200
+
+    def assert_stats_match_vendors() -> None:
+        stats = {item["category"]: item for item in client.get("/scores/stats").json()["items"]}
+        for category, scores in _current_scores().items():
+            assert stats[category]["vendors"] == len(scores)
+            assert abs(stats[category]["mean_score"] - sum(scores) / len(scores)) < 1e-3
+
+    assert_stats_match_vendors()
+
+    # metric submissions rescore one vendor; it is folded in by the next refresh, and only once
+    _submit_metric(client, vendor_ids[0], 95.0)
+    assert client.post("/admin/scoring/rollups/refresh").json()["folded_vendors"] >= 1
+    assert client.post("/admin/scoring/rollups/refresh").json()["folded_vendors"] == 0
+    assert_stats_match_vendors()
+
+    today = datetime.now(timezone.utc).date().isoformat()
+    histogram = client.get(
+        "/scores/histogram", params={"category": "manufacturer", "from": today, "bin_width": 25}
+    ).json()
+    (day,) = histogram["days"]
+    assert day["day"] == today
+    assert len(day["histogram"]) == 4
+    assert sum(day["histogram"]) == day["vendors"] == len(_current_scores()["manufacturer"])
+
+
+def test_leaderboard_ranks_each_category(client: TestClient):
+    vendor_id = client.post("/vendors", json={"name": "Leader", "category": "distributor"}).json()["id"]
+    _submit_metric(client, vendor_id, 100.0)
+
+    leaderboard = client.get("/scores/leaderboard", params={"limit": 3}).json()["items"]
+    by_category = defaultdict(list)
+    for entry in leaderboard:
+        by_category[entry["category"]].append(entry)
+
+    for category, scores in _current_scores().items():
+        entries = by_category[category]
+        assert [entry["rank"] for entry in entries] == list(range(1, min(3, len(scores)) + 1))
+        assert [entry["score"] for entry in entries] == sorted(scores, reverse=True)[:3]
+
+    only = client.get("/scores/leaderboard", params={"category": "distributor", "limit": 1}).json()["items"]
+    assert [entry["category"] for entry in only] == ["distributor"]
+
+
+def test_bucket_percentiles_interpolate_within_buckets():
+    counts = [0] * 100
+    counts[10] = 2
+    counts[50] = 2
+
+    assert bucket_percentile(counts, 0.5) == 11.0
+    assert bucket_percentile(counts, 0.75) == 50.5
+    assert bucket_percentile([0] * 100, 0.5) is None
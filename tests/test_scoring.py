@@ -0,0 +1,94 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from src.schema import ScoringRuleSet, VendorCategory
+from src.services.score_aggregate_service import fold_metric_aggregates
+from src.services.scoring_rule_service import compile_rule_set
+from src.services.scoring_service import (
+    CATEGORY_WEIGHTS,
+    compute_scores_batch,
+    encode_categories,
+    score_metric_values,
+)
+
+
+metric_rows = st.lists(
+    st.tuples(
+        st.floats(min_value=0, max_value=100, allow_nan=False),
+        st.floats(min_value=0, max_value=100, allow_nan=False),
+        st.integers(min_value=0, max_value=10_000),
+        st.booleans(),
+        st.sampled_from([*CATEGORY_WEIGHTS, "unknown"]),
+    ),
+    min_size=1,
+    max_size=50,
+)
+
+
+@settings(max_examples=300)
+@given(metric_rows)
+def test_compute_scores_batch_is_bit_identical_to_scalar(rows):
+    on_time, compliance, complaints, missing, categories = zip(*rows)
+
+    batch = compute_scores_batch(
+        np.array(on_time),
+        np.array(compliance),
+        np.array(complaints),
+        np.array(missing),
+        encode_categories(categories),
+    )
+    scalar = np.array([score_metric_values(*row) for row in rows], dtype=np.float64)
+
+    assert batch.dtype == np.float64
+    np.testing.assert_array_equal(batch.view(np.uint64), scalar.view(np.uint64))
+
+
+def test_fold_metric_aggregates_anchors_at_newest_metric():
+    vendor_id = uuid.uuid4()
+    newest = datetime(2026, 1, 10, tzinfo=timezone.utc)
+    metrics = [
+        {"vendor_id": vendor_id, "timestamp": newest - timedelta(days=days), "on_time_delivery_rate": rate,
+         "compliance_score": 50.0, "complaint_count": 2, "missing_documents": missing}
+        for days, rate, missing in ((2, 0.0, True), (0, 100.0, False), (1, 40.0, False))
+    ]
+
+    (aggregate,) = fold_metric_aggregates(metrics, half_life_seconds=86_400)
+
+    assert aggregate["anchor_at"] == newest
+    assert aggregate["metric_count"] == 3
+    assert aggregate["weight_sum"] == 1.75
+    assert aggregate["on_time_delivery_sum"] == 100.0 + 20.0
+    assert aggregate["missing_documents_sum"] == 0.25
+
+
+@settings(max_examples=300)
+@given(metric_rows)
+def test_compiled_rule_set_kernel_is_bit_identical_to_scalar(rows):
+    rules = compile_rule_set(
+        ScoringRuleSet(
+            version="custom",
+            delivery_weight=0.5,
+            compliance_weight=0.35,
+            reliability_points=20,
+            penalty_per_complaint=0.7,
+            max_complaint_penalty=30,
+            missing_documents_penalty=12.5,
+            category_weights={VendorCategory.dealer: 1.1},
+            default_category_weight=0.8,
+        )
+    )
+    on_time, compliance, complaints, missing, categories = zip(*rows)
+
+    batch = rules.score_batch(
+        np.array(on_time),
+        np.array(compliance),
+        np.array(complaints),
+        np.array(missing),
+        encode_categories(categories),
+    )
+    scalar = np.array([rules.score(*row) for row in rows], dtype=np.float64)
+
+    np.testing.assert_array_equal(batch.view(np.uint64), scalar.view(np.uint64))
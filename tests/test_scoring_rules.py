@@ -0,0 +1,65 @@
+import os
+import uuid
+from datetime import datetime, timezone
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+
+from src.database.databases import SessionLocal
+from src.services import bulk_recompute_vendor_scores, scoring_rules
+
+
+def test_switching_active_rule_set_rescores_vendors(client: TestClient, scoring_rule_file):
+    vendor_id = client.post("/vendors", json={"name": "Rule Switch", "category": "supplier"}).json()["id"]
+    response = client.post(
+        f"/vendors/{vendor_id}/metrics",
+        json={
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "on_time_delivery_rate": 100.0,
+            "complaint_count": 0,
+            "missing_documents": False,
+            "compliance_score": 100.0,
+        },
+    )
+    assert response.status_code == 201
+    assert client.get(f"/vendors/{vendor_id}").json()["latest_score"] == 100.0
+
+    version = f"strict-{uuid.uuid4().hex[:8]}"
+    scoring_rule_file(version, {"version": version, "delivery_weight": 0.3, "compliance_weight": 0.3})
+    rules = client.post("/admin/scoring/rules/reload").json()
+    assert rules["active"] == version
+    assert rules["versions"] == sorted(["v1", version])
+
+    with SessionLocal() as session:
+        # only the rule set changed, which is enough to rescore
+        assert bulk_recompute_vendor_scores(session, vendor_ids=[UUID(vendor_id)]).recomputed_vendors == 1
+        assert bulk_recompute_vendor_scores(session, vendor_ids=[UUID(vendor_id)]).skipped_vendors == 1
+
+    latest = client.get(f"/vendors/{vendor_id}/scores").json()[0]
+    assert latest["score"] == 75.0
+    assert latest["scoring_version"] == version
+
+    # an invalid file is rejected and the loaded rules stay in effect
+    scoring_rule_file("missing", {"version": version})
+    assert client.post("/admin/scoring/rules/reload").status_code == 422
+    assert client.get("/admin/scoring/rules").json()["active"] == version
+
+    # so is a file that changes the weights behind the existing v1 scores
+    scoring_rule_file("v1", {"version": "v1", "delivery_weight": 0.6})
+    assert client.post("/admin/scoring/rules/reload").status_code == 422
+    assert client.get("/admin/scoring/rules").json()["active"] == version
+
+
+def test_rule_file_changes_are_picked_up_without_restart(scoring_rule_file):
+    path = scoring_rule_file("v1", {"version": "v1"}, {"version": "treatment"}, experiments={"treatment": 0.5})
+    scoring_rules.reload()
+    assert scoring_rules.for_vendor(UUID(int=1)).version == "treatment"
+    assert scoring_rules.for_vendor(UUID(int=9_999)).version == "v1"
+
+    scoring_rule_file("treatment", {"version": "v1"}, {"version": "treatment"})
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    scoring_rules._next_check = 0.0  # as if the reload interval had elapsed
+
+    assert scoring_rules.active().version == "treatment"
+    assert scoring_rules.for_vendor(UUID(int=9_999)).version == "treatment"
@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import create_engine, insert, select
+
+from src.database.databases import RoutingSession, to_psycopg_url
+from src.models import VendorModel
+from src.utils.validate_db_url import DatabaseSettings
+
+
+def test_database_settings_engine_options(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("DATABASE_URL", "postgresql+psycopg://user:pass@db:5432/privue")
+    monkeypatch.setenv("DATABASE_POOL_SIZE", "20")
+    monkeypatch.setenv("DATABASE_POOL_PRE_PING", "no")
+    monkeypatch.setenv("DATABASE_STATEMENT_TIMEOUT_MS", "5000")
+    monkeypatch.setenv("DATABASE_PREPARE_THRESHOLD", "none")
+    monkeypatch.setenv("DATABASE_READ_REPLICA_URL", "")
+
+    settings = DatabaseSettings()
+    options = settings.engine_options(settings.url)
+
+    assert options["pool_size"] == 20
+    assert options["pool_pre_ping"] is False
+    assert options["connect_args"] == {
+        "prepare_threshold": None,
+        "options": "-c statement_timeout=5000",
+    }
+    assert settings.read_replica_url is None
+    # psycopg2 refuses psycopg's connection arguments
+    psycopg2_options = settings.engine_options("postgresql+psycopg2://user:pass@db:5432/privue")
+    assert psycopg2_options["connect_args"] == {"options": "-c statement_timeout=5000"}
+    assert to_psycopg_url("postgresql://user:pass@db:5432/privue") == "postgresql+psycopg://user:pass@db:5432/privue"
+
+
+def test_routing_session_sends_writes_to_primary():
+    primary = create_engine("postgresql+psycopg://user@primary/privue")
+    replica = create_engine("postgresql+psycopg://user@replica/privue")
+
+    class Routing(RoutingSession):
+        primary_bind = primary
+        replica_bind = replica
+
+    session = Routing()
+    assert session.get_bind(clause=select(VendorModel)) is replica
+    assert session.get_bind(clause=insert(VendorModel)) is primary
@@ -1,3 +1,5 @@
+import uuid
+
 from fastapi.testclient import TestClient
 from src.main import app
 from datetime import datetime, timezone
@@ -73,3 +75,97 @@ def test_metric_validation_failure(client: TestClient):
     }
     response = client.post(f"/vendors/{vendor_id}/metrics", json=invalid_payload)
     assert response.status_code == 422
+
+
+def test_vendor_scores_cursor_pagination(client: TestClient):
+    vendor_id = client.post("/vendors", json={"name": "Paged Vendor", "category": "supplier"}).json()["id"]
+    metric_payload = {
+        "on_time_delivery_rate": 92.5,
+        "complaint_count": 1,
+        "missing_documents": False,
+        "compliance_score": 88.0,
+    }
+    for _ in range(5):
+        # distinct timestamps: a repeated one would be the same metric
+        metric_payload["timestamp"] = datetime.now(timezone.utc).isoformat()
+        client.post(f"/vendors/{vendor_id}/metrics", json=metric_payload)
+
+    seen = []
+    response = client.get(f"/vendors/{vendor_id}/scores", params={"limit": 2})
+    while True:
+        assert response.status_code == 200
+        seen.extend(score["id"] for score in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        response = client.get(f"/vendors/{vendor_id}/scores", params={"limit": 2, "after": cursor})
+
+    all_scores = client.get(f"/vendors/{vendor_id}/scores", params={"limit": 100}).json()
+    assert seen == [score["id"] for score in all_scores]
+    assert len(seen) == 5
+
+    assert client.get(f"/vendors/{vendor_id}/scores", params={"after": "garbage"}).status_code == 400
+    future = client.get(f"/vendors/{vendor_id}/scores", params={"from": "2999-01-01T00:00:00+00:00"})
+    assert future.json() == []
+
+
+def test_list_vendors_filters_and_pages(client: TestClient):
+    prefix = f"Listed_{uuid.uuid4().hex[:8]}"
+    names = [f"{prefix} {suffix}" for suffix in ("Alpha", "Beta", "Gamma")]
+    ids = [
+        client.post("/vendors", json={"name": name, "category": category}).json()["id"]
+        for name, category in zip(names, ("supplier", "dealer", "supplier"))
+    ]
+    client.post(
+        f"/vendors/{ids[0]}/metrics",
+        json={
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "on_time_delivery_rate": 100.0,
+            "complaint_count": 0,
+            "missing_documents": False,
+            "compliance_score": 100.0,
+        },
+    )
+
+    seen = []
+    response = client.get("/vendors", params={"name_prefix": prefix.lower(), "limit": 2})
+    while True:
+        assert response.status_code == 200
+        page = response.json()
+        assert page["count"] == len(page["items"])
+        seen.extend(item["name"] for item in page["items"])
+        if page["next_cursor"] is None:
+            break
+        response = client.get("/vendors", params={"name_prefix": prefix, "limit": 2, "after": page["next_cursor"]})
+    assert seen == names
+
+    # "_" is matched literally, not as a LIKE wildcard
+    assert client.get("/vendors", params={"name_prefix": prefix.replace("_", "x")}).json()["count"] == 0
+    suppliers = client.get("/vendors", params={"q": prefix[3:], "category": "supplier"}).json()
+    assert [item["id"] for item in suppliers["items"]] == [ids[0], ids[2]]
+    scored = client.get("/vendors", params={"name_prefix": prefix, "min_score": 99}).json()
+    assert [(item["id"], item["latest_score"]) for item in scored["items"]] == [(ids[0], 100.0)]
+
+    assert client.get("/vendors", params={"min_score": 50, "max_score": 10}).status_code == 400
+    assert client.get("/vendors", params={"after": "garbage"}).status_code == 400
+
+
+def test_batch_get_vendors_keeps_request_order(client: TestClient):
+    ids = [
+        client.post("/vendors", json={"name": f"Batch Get {index}", "category": "dealer"}).json()["id"]
+        for index in range(3)
+    ]
+    missing = str(uuid.uuid4())
+    requested = [ids[2], missing, ids[0], ids[2], ids[1]]
+
+    response = client.post("/vendors:batchGet", json={"ids": requested})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body["items"]] == requested
+    assert [item["found"] for item in body["items"]] == [True, False, True, True, True]
+    assert body["items"][1]["vendor"] is None
+    assert body["items"][0]["vendor"]["name"] == "Batch Get 2"
+    assert (body["found"], body["not_found"]) == (4, 1)
+
+    assert client.post("/vendors:batchGet", json={"ids": []}).status_code == 422